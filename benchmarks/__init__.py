@@ -0,0 +1 @@
+# Benchmarks for PropConverter-V (run inside Blender)
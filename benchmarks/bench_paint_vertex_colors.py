@@ -0,0 +1,71 @@
+"""Benchmark of the vertex color fill.
+
+Compares the former per-corner RNA loop with the bulk foreach_set fill of
+paint_vertex_colors at 10k, 100k and 1M corners. Run inside Blender:
+
+    blender -b --python-expr "from bl_ext.user_default.propconverterv.benchmarks import bench_paint_vertex_colors as b; b.main()"
+"""
+
+import math
+import time
+import bmesh
+import bpy
+from ..core.mesh_prep.paint_vertex_colors import paint_vertex_colors, ensure_color_attribute
+
+CORNER_COUNTS = (10_000, 100_000, 1_000_000)
+COLOR = (1.0, 0.0, 1.0, 1.0)
+
+# Runs of every path, the best time is kept
+REPEAT = 3
+
+
+def _create_grid(corners: int) -> bpy.types.Object:
+    """Create a quad grid object with about the given number of corners."""
+    size = max(2, round(math.sqrt(corners / 4)) + 1)
+    bm = bmesh.new()
+    bmesh.ops.create_grid(bm, x_segments=size - 1, y_segments=size - 1, size=1.0)
+    mesh = bpy.data.meshes.new(f"bench_{corners}")
+    bm.to_mesh(mesh)
+    bm.free()
+    obj = bpy.data.objects.new(mesh.name, mesh)
+    bpy.context.collection.objects.link(obj)
+    return obj
+
+
+def _legacy_fill(obj: bpy.types.Object) -> None:
+    """Per-corner fill as done before the bulk fill path."""
+    target_attr = ensure_color_attribute(obj.data)
+    for loop_index in range(len(obj.data.loops)):
+        target_attr.data[loop_index].color = COLOR
+
+
+def _time(func, *args, **kwargs) -> float:
+    """Return the best wall time of REPEAT runs."""
+    best = float("inf")
+    for _ in range(REPEAT):
+        start = time.perf_counter()
+        func(*args, **kwargs)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    """Run the benchmark and print one line per mesh size."""
+    print(f"{'corners':>10} {'legacy (s)':>12} {'single (s)':>12} {'per-face (s)':>13} {'per-mat (s)':>12} {'speedup':>9}")
+    for corners in CORNER_COUNTS:
+        obj = _create_grid(corners)
+        mesh = obj.data
+        face_colors = [COLOR] * len(mesh.polygons)
+
+        legacy = _time(_legacy_fill, obj)
+        single = _time(paint_vertex_colors, obj, None, color=COLOR)
+        per_face = _time(paint_vertex_colors, obj, None, color=COLOR, face_colors=face_colors)
+        per_material = _time(paint_vertex_colors, obj, None, color=COLOR, material_colors={0: COLOR})
+
+        print(
+            f"{len(mesh.loops):>10} {legacy:>12.4f} {single:>12.4f} {per_face:>13.4f} "
+            f"{per_material:>12.4f} {legacy / max(single, 1e-9):>8.1f}x"
+        )
+
+        bpy.data.objects.remove(obj)
+        bpy.data.meshes.remove(mesh)
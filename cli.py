@@ -0,0 +1,333 @@
+"""Headless command-line pipeline for PropConverter-V.
+
+Converts every source model of an input directory to YDR/YTYP without the UI.
+It does not touch the N-panel state: settings come from a JSON config file
+and/or command-line arguments.
+
+Usage (the add-on and Sollumz must be enabled in the user preferences):
+
+    blender -b --python-exit-code 1 --python-expr \\
+        "import sys; from bl_ext.user_default.propconverterv import cli; sys.exit(cli.main())" -- \\
+        --input ./models --output ./build --config convert.json
+
+The config file is a JSON object using the ConversionSettings field names,
+e.g. {"enable_decimate": true, "decimate_type": "COLLAPSE", "decimate_ratio": 0.3}.
+
+The output tree mirrors the input tree, with one folder per source model.
+With --files-from and no --input, it mirrors the common directory of the
+listed models. A model outside --input is rejected, its folder would be
+outside --output.
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+from typing import Any, Dict, List, Optional
+import bpy
+from .conversion_settings import ConversionSettings
+from .services.conversion_service import ConversionService
+from .services.export_service import ExportService
+from .services.conversion_cache import ConversionCache
+from .core.conversion.texture_registry import TextureRegistry
+from .services.instrumentation import ConversionProfiler
+from . import constants
+
+
+# Export option names accepted on the command line
+_FORMAT_CHOICES = {"native": "NATIVE", "xml": "CWXML"}
+_VERSION_CHOICES = {"gen8": "GEN8", "gen9": "GEN9"}
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Build the command-line argument parser."""
+    parser = argparse.ArgumentParser(
+        prog="propconverter.cli",
+        description="Convert a directory of source models to GTA V props (YDR/YTYP)."
+    )
+    parser.add_argument("--input", help="Directory containing the source models (required without --files-from)")
+    parser.add_argument("--files-from", help="Text file listing the models to convert (one path per line) "
+                                             "instead of scanning --input; the output tree mirrors --input, "
+                                             "or the common directory of the models without it")
+    parser.add_argument("--output", required=True, help="Directory receiving the exported assets")
+    parser.add_argument("--config", help="JSON file with conversion settings")
+    parser.add_argument("--recursive", action="store_true", help="Also search sub-directories of --input")
+    parser.add_argument("--shader-index", type=int, help="Sollumz shader index (default shader if omitted)")
+    parser.add_argument("--shader", dest="shader_name",
+                        help="Sollumz shader name or filename, e.g. normal_spec (overrides --shader-index)")
+    parser.add_argument("--collision-material-index", type=int, help="Sollumz collision material index")
+    parser.add_argument("--vertex-color", type=float, nargs=4, metavar=("R", "G", "B", "A"),
+                        help="Vertex color painted on the drawable")
+    parser.add_argument("--format", dest="formats", action="append", choices=sorted(_FORMAT_CHOICES),
+                        help="Export format, may be repeated (default: native and xml)")
+    parser.add_argument("--version", dest="versions", action="append", choices=sorted(_VERSION_CHOICES),
+                        help="Target version, may be repeated (default: gen8 and gen9)")
+    parser.add_argument("--report", help="JSON lines file receiving one record per converted model")
+    parser.add_argument("--force", action="store_true",
+                        help="Convert every model, even those unchanged since the last export")
+    parser.add_argument("--profile", help="JSON lines file receiving the per-stage timing records")
+    parser.add_argument("--strict", action="store_true",
+                        help="Reject meshes with degenerate faces, non-manifold edges, loose vertices or no UV map")
+    return parser
+
+
+def get_script_args(argv: Optional[List[str]]) -> List[str]:
+    """Return the arguments meant for this script (those after '--')."""
+    if argv is not None:
+        return argv
+    if "--" in sys.argv:
+        return sys.argv[sys.argv.index("--") + 1:]
+    return []
+
+
+def build_settings(args: argparse.Namespace) -> ConversionSettings:
+    """Build conversion settings from the config file and argument overrides."""
+    settings = ConversionSettings.from_file(args.config) if args.config else ConversionSettings()
+    if args.shader_index is not None:
+        settings.shader_index = args.shader_index
+    if args.shader_name:
+        settings.shader_name = args.shader_name
+    if args.collision_material_index is not None:
+        settings.collision_material_index = args.collision_material_index
+    if args.vertex_color is not None:
+        settings.vertex_color = tuple(args.vertex_color)
+    if args.strict:
+        settings.strict_validation = True
+    return settings
+
+
+def read_file_list(filepath: str) -> List[str]:
+    """Read a list of model paths (one per line, blank lines ignored)."""
+    with open(filepath, 'r', encoding='utf-8') as f:
+        return [os.path.abspath(line.strip()) for line in f if line.strip()]
+
+
+def find_source_models(directory: str, recursive: bool = False) -> List[str]:
+    """List the supported source model files of a directory, sorted by path."""
+    found = []
+    for root, dirs, files in os.walk(directory):
+        dirs.sort()
+        for filename in sorted(files):
+            if os.path.splitext(filename)[1].lower() in constants.SOURCE_MODEL_EXTENSIONS:
+                found.append(os.path.join(root, filename))
+        if not recursive:
+            break
+    return found
+
+
+def output_subdir(filepath: str, input_dir: str, output_root: str) -> Optional[str]:
+    """Output folder of a source model: its path relative to input_dir, under output_root.
+
+    Returns:
+        The folder, or None if the model is outside input_dir (its folder
+        would be outside output_root)
+    """
+    try:
+        relative = os.path.relpath(os.path.splitext(filepath)[0], input_dir)
+    except ValueError:
+        # Different drive
+        return None
+    if os.path.isabs(relative) or relative.split(os.sep)[0] == os.pardir:
+        return None
+    return os.path.join(output_root, relative)
+
+
+def import_source_model(filepath: str) -> List[bpy.types.Object]:
+    """Import a source model into the current scene.
+
+    Args:
+        filepath: Path to a supported model file
+
+    Returns:
+        The imported mesh objects
+    """
+    ext = os.path.splitext(filepath)[1].lower()
+    pre_objects = set(bpy.context.scene.objects)
+
+    if ext == ".fbx":
+        bpy.ops.import_scene.fbx(filepath=filepath)
+    elif ext == ".obj":
+        bpy.ops.wm.obj_import(filepath=filepath)
+    elif ext in (".gltf", ".glb"):
+        bpy.ops.import_scene.gltf(filepath=filepath)
+    elif ext == ".ply":
+        bpy.ops.wm.ply_import(filepath=filepath)
+    elif ext == ".stl":
+        bpy.ops.wm.stl_import(filepath=filepath)
+    elif ext == ".blend":
+        with bpy.data.libraries.load(filepath, link=False) as (data_from, data_to):
+            data_to.objects = list(data_from.objects)
+        for obj in data_to.objects:
+            if obj is not None:
+                bpy.context.collection.objects.link(obj)
+    else:
+        raise ValueError(f"Unsupported model format: {ext}")
+
+    return [obj for obj in bpy.context.scene.objects if obj not in pre_objects and obj.type == 'MESH']
+
+
+def convert_file(
+    filepath: str,
+    output_dir: str,
+    settings: ConversionSettings,
+    formats: set,
+    versions: set,
+    force: bool = False,
+    profiler: Optional[ConversionProfiler] = None
+) -> Dict[str, Any]:
+    """Convert and export every mesh of a single source model file.
+
+    The scene is reset first, so each file is converted in isolation.
+    Meshes whose digest matches the manifest of output_dir are skipped
+    (unless force is set), and the manifest is updated after each export.
+
+    Args:
+        filepath: Path to the source model
+        output_dir: Directory receiving the exported assets
+        settings: Conversion settings
+        formats: Sollumz target formats
+        versions: Sollumz target versions
+        force: Ignore the manifest and convert every mesh
+        profiler: Optional profiler receiving the stage records
+
+    Returns:
+        A report record with the keys 'source', 'output_dir', 'success'
+        (True if every mesh was converted and exported, or unchanged),
+        'archetypes' and 'chunks' (world-space center of each chunk of a
+        divided mesh) of the exported props, 'skipped' and 'seconds'
+    """
+    start = time.perf_counter()
+    record = {
+        "source": filepath,
+        "output_dir": output_dir,
+        "success": False,
+        "archetypes": [],
+        "skipped": [],
+        "chunks": {},
+        "seconds": 0.0,
+    }
+
+    bpy.ops.wm.read_homefile(use_empty=True)
+    context = bpy.context
+    # The .blend is never saved: texture paths are relative to the source model
+    TextureRegistry.get_instance().reset(os.path.dirname(os.path.abspath(filepath)))
+
+    try:
+        meshes = import_source_model(filepath)
+    except Exception as e:
+        print(f"[CLI] Failed to import {filepath} - {e}")
+        meshes = []
+
+    if not meshes:
+        print(f"[CLI] No mesh found in {filepath}")
+        record["seconds"] = time.perf_counter() - start
+        return record
+
+    cache = ConversionCache(output_dir)
+    if force:
+        cache.entries.clear()
+    service = ConversionService(profiler=profiler)
+    results = service.convert_batch(context, meshes, settings=settings, cache=cache)
+
+    os.makedirs(output_dir, exist_ok=True)
+    exporter = ExportService()
+    ok = all(result.success for result in results)
+    # Chunks of a divided mesh share the manifest entry of their source mesh,
+    # which is only current once every chunk is exported
+    exported = {}
+    digests = {}
+    for result in results:
+        key = result.source or result.name
+        digests[key] = result.digest
+        if result.skipped:
+            record["skipped"].append(result.name)
+            continue
+        if not result.success:
+            exported[key] = False
+            continue
+        bpy.ops.object.select_all(action='DESELECT')
+        result.drawable.select_set(True)
+        if result.collision is not None:
+            result.collision.select_set(True)
+        context.view_layer.objects.active = result.drawable
+        context.scene.ytyp_index = result.ytyp_index
+        success = exporter.export(context, output_dir, formats, versions)
+        exported[key] = exported.get(key, True) and success
+        ok = ok and success
+        if not success:
+            continue
+        ytyp = context.scene.ytyps[result.ytyp_index]
+        record["archetypes"].extend(archetype.name for archetype in ytyp.archetypes)
+        if result.source:
+            record["chunks"][result.name] = list(result.offset)
+    for key, success in exported.items():
+        if success:
+            cache.update(key, digests[key])
+        else:
+            cache.remove(key)
+    cache.save()
+
+    record["success"] = ok
+    record["seconds"] = time.perf_counter() - start
+    return record
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Run the command-line pipeline.
+
+    Args:
+        argv: Script arguments (defaults to the arguments after '--')
+
+    Returns:
+        0 if every model was converted, 1 otherwise
+    """
+    parser = build_parser()
+    args = parser.parse_args(get_script_args(argv))
+    if not args.input and not args.files_from:
+        parser.error("--input is required without --files-from")
+    settings = build_settings(args)
+    formats = {_FORMAT_CHOICES[f] for f in (args.formats or _FORMAT_CHOICES)}
+    versions = {_VERSION_CHOICES[v] for v in (args.versions or _VERSION_CHOICES)}
+
+    output_root = os.path.abspath(args.output)
+    if args.files_from:
+        sources = read_file_list(args.files_from)
+        source_dirs = [os.path.dirname(filepath) for filepath in sources]
+        try:
+            common_dir = os.path.commonpath(source_dirs) if source_dirs else os.getcwd()
+        except ValueError:
+            # Models on several drives: their folders are rejected below
+            common_dir = os.getcwd()
+        input_dir = os.path.abspath(args.input) if args.input else common_dir
+    else:
+        input_dir = os.path.abspath(args.input)
+        sources = find_source_models(input_dir, args.recursive)
+    print(f"[CLI] Found {len(sources)} source model(s) in {input_dir}")
+
+    profiler = ConversionProfiler(enabled=bool(args.profile))
+    failed = []
+    for index, filepath in enumerate(sources, start=1):
+        print(f"[CLI] ({index}/{len(sources)}) {filepath}")
+        output_dir = output_subdir(filepath, input_dir, output_root)
+        if output_dir is None:
+            print(f"[CLI] {filepath} is outside {input_dir}, its output would be outside {output_root}")
+            failed.append(filepath)
+            continue
+        record = convert_file(filepath, output_dir, settings, formats, versions, args.force, profiler)
+        if not record["success"]:
+            failed.append(filepath)
+        if args.report:
+            # Append and flush per model, so a crash keeps the finished records
+            with open(args.report, 'a', encoding='utf-8') as f:
+                f.write(json.dumps(record) + "\n")
+        if args.profile:
+            profiler.dump_jsonl(args.profile)
+            profiler.clear()
+
+    print(f"[CLI] Done: {len(sources) - len(failed)} converted, {len(failed)} failed")
+    if args.profile:
+        print(f"[CLI] Stage timings written to {args.profile}")
+    for filepath in failed:
+        print(f"[CLI]   FAILED: {filepath}")
+    return 1 if failed else 0
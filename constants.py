@@ -13,6 +13,21 @@ POLY_MESH_SUFFIX = ".poly_mesh"
 # === Sollumz Integration ===
 SOLLUMZ_MODULE_CANDIDATES = ("sollumz", "Sollumz")
 SOLLUMZ_OPERATOR_NAMESPACE = "sollumz"
+
+# Sollumz functions behind the conversion operators, probed in order:
+# capability -> ((submodule, function, required parameter names), ...)
+SOLLUMZ_DIRECT_CALLS = {
+    "convert_to_composite": (
+        ("tools.boundhelper", "convert_obj_to_composite", ("obj", "bound_child_type")),
+    ),
+    "convert_to_drawable": (
+        ("tools.drawablehelper", "convert_obj_to_drawable", ("obj",)),
+    ),
+    "convert_material": (
+        ("tools.drawablehelper", "convert_material_to_selected", ("material", "shader_name")),
+        ("ydr.shader_materials", "convert_material_to_selected", ("material", "shader_name")),
+    ),
+}
 AUTOPROP_MODULE_IDENTIFIER = "autoprop"
 
 # === Shader Configuration ===
@@ -48,8 +63,25 @@ ALL_COLLISION_FLAGS = [
     "no_cam_collision_allow_clipping",
 ]
 
+# === Engine Limits ===
+MAX_GEOMETRY_VERTICES = 65535  # Drawable geometries use 16-bit vertex indices
+
+# === LOD Distances ===
+# Distance up to which each LOD is drawn: LOD_DISTANCE_MIN + bounding radius * factor
+LOD_DISTANCE_MIN = 20.0
+LOD_DISTANCE_FACTORS = {
+    "HIGH": 10.0,
+    "MEDIUM": 20.0,
+    "LOW": 40.0,
+    "VERYLOW": 80.0,
+}
+
 # === File Extensions ===
 TEXTURE_EXTENSION = ".dds"
+SOURCE_MODEL_EXTENSIONS = (".fbx", ".obj", ".gltf", ".glb", ".ply", ".stl", ".blend")
+
+# Threads checking texture files on disk before export
+TEXTURE_CHECK_WORKERS = 8
 
 # === Transform Defaults ===
 DEFAULT_LOCATION = (0.0, 0.0, 0.0)
@@ -0,0 +1,216 @@
+"""Conversion settings snapshot for PropConverter-V.
+
+This module decouples the conversion pipeline from the N-panel state. The
+settings are read once from the scene/window manager (or built from plain
+values) and then passed through every conversion stage, so a batch of props
+does not re-read Blender properties for each object.
+"""
+
+import json
+from dataclasses import dataclass, field
+from typing import Any, Dict, Optional, Tuple
+import bpy
+from . import constants
+
+
+# Fields that map 1:1 to PROPCONVERTER_Properties attributes
+_PROPERTY_FIELDS = (
+    "enable_decimate",
+    "decimate_type",
+    "decimate_ratio",
+    "decimate_iterations",
+    "decimate_use_dissolve",
+    "decimate_planar_angle",
+    "enable_remesh",
+    "remesh_mode",
+    "remesh_use_smooth_shade",
+    "remesh_threshold",
+    "remesh_voxel_size",
+    "remesh_adaptivity",
+    "auto_texture_from_mesh_name",
+    "enable_weld",
+    "weld_distance",
+    "enable_ambient_occlusion",
+    "ao_samples",
+    "ao_distance",
+    "ao_strength",
+    "ao_channel",
+    "enable_model_split",
+    "enable_auto_divide",
+    "divide_chunk_size",
+    "enable_primitive_fitting",
+    "primitive_tolerance",
+    "primitive_max_count",
+    "enable_convex_decomposition",
+    "convex_max_hulls",
+    "convex_volume_error",
+    "enable_collision_budget",
+    "budget_method",
+    "budget_target",
+    "budget_triangles",
+    "budget_max_deviation",
+    "enable_lods",
+    "lod_ratio_medium",
+    "lod_ratio_low",
+    "lod_ratio_very_low",
+)
+
+
+@dataclass
+class ConversionSettings:
+    """Snapshot of every conversion-relevant setting.
+
+    Attributes:
+        vertex_color: RGBA color painted on the drawable mesh
+        collision_material_index: Sollumz collision material index
+        shader_index: Sollumz shader index (-1 resolves to the default shader)
+        shader_name: Sollumz shader name or filename, overrides shader_index
+            when set (for batch and command line conversions)
+        strict_validation: Reject meshes with degenerate faces, non-manifold
+            edges, loose vertices or no UV map instead of warning
+        collision_flags: Mapping of collision flag name to enabled state
+
+    Example:
+        >>> settings = ConversionSettings.from_context(context)
+        >>> settings.decimate_ratio
+        0.5
+    """
+
+    vertex_color: Tuple[float, float, float, float] = (1.0, 0.0, 1.0, 1.0)
+    enable_decimate: bool = False
+    decimate_type: str = 'UNSUBDIV'
+    decimate_ratio: float = 0.5
+    decimate_iterations: int = 1
+    decimate_use_dissolve: bool = False
+    decimate_planar_angle: float = 80.0
+    enable_remesh: bool = False
+    remesh_mode: str = 'smooth'
+    remesh_use_smooth_shade: bool = True
+    remesh_threshold: float = 0.1
+    remesh_voxel_size: float = 0.1
+    remesh_adaptivity: float = 0.0
+    auto_texture_from_mesh_name: bool = False
+    enable_weld: bool = False
+    weld_distance: float = 0.0001
+    enable_ambient_occlusion: bool = False
+    ao_samples: int = 32
+    ao_distance: float = 1.0
+    ao_strength: float = 1.0
+    ao_channel: str = 'RGB'
+    ao_workers: int = 1
+    enable_model_split: bool = True
+    enable_auto_divide: bool = False
+    divide_chunk_size: float = 50.0
+    enable_primitive_fitting: bool = False
+    primitive_tolerance: float = 0.02
+    primitive_max_count: int = 8
+    enable_convex_decomposition: bool = False
+    convex_max_hulls: int = 8
+    convex_volume_error: float = 0.05
+    convex_workers: int = 1
+    enable_collision_budget: bool = False
+    budget_method: str = 'DECIMATE'
+    budget_target: str = 'TRIANGLES'
+    budget_triangles: int = 500
+    budget_max_deviation: float = 0.05
+    enable_lods: bool = False
+    lod_ratio_medium: float = 0.5
+    lod_ratio_low: float = 0.25
+    lod_ratio_very_low: float = 0.1
+    strict_validation: bool = False
+    collision_material_index: int = 0
+    shader_index: int = -1
+    shader_name: str = ""
+    collision_flags: Dict[str, bool] = field(
+        default_factory=lambda: {name: False for name in constants.ALL_COLLISION_FLAGS}
+    )
+
+    @classmethod
+    def from_context(cls, context: bpy.types.Context) -> 'ConversionSettings':
+        """Build settings from the PropConverter-V panel and Sollumz UI state.
+
+        Args:
+            context: Blender context
+
+        Returns:
+            A new ConversionSettings instance
+        """
+        settings = cls()
+
+        props = getattr(context.scene, "prop_converter", None)
+        if props:
+            settings.vertex_color = tuple(getattr(props, "vertex_color", settings.vertex_color))
+            for name in _PROPERTY_FIELDS:
+                if hasattr(props, name):
+                    setattr(settings, name, getattr(props, name))
+
+            collision_flags = getattr(props, "collision_flags", None)
+            if collision_flags:
+                settings.collision_flags = {
+                    name: bool(getattr(collision_flags, name, False))
+                    for name in constants.ALL_COLLISION_FLAGS
+                }
+
+        wm = context.window_manager
+        settings.collision_material_index = getattr(wm, "sz_collision_material_index", 0)
+        settings.shader_index = getattr(wm, "sz_shader_material_index", -1)
+        return settings
+
+    @classmethod
+    def from_context_or(
+        cls,
+        context: bpy.types.Context,
+        settings: Optional['ConversionSettings']
+    ) -> 'ConversionSettings':
+        """Return the given settings, or read them from the context if None."""
+        if settings is not None:
+            return settings
+        return cls.from_context(context)
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'ConversionSettings':
+        """Build settings from a plain dictionary (e.g. a JSON config file).
+
+        Unknown keys are ignored and missing keys keep their defaults.
+        Collision flags not listed in the dictionary are disabled.
+
+        Args:
+            data: Mapping of setting name to value
+
+        Returns:
+            A new ConversionSettings instance
+        """
+        settings = cls()
+        for name, value in data.items():
+            if name not in cls.__dataclass_fields__:
+                print(f"[WARNING] Ignoring unknown conversion setting: {name}")
+                continue
+            if name == "vertex_color":
+                value = tuple(float(c) for c in value)
+            elif name == "collision_flags":
+                value = {
+                    flag_name: bool(value.get(flag_name, False))
+                    for flag_name in constants.ALL_COLLISION_FLAGS
+                }
+            setattr(settings, name, value)
+        return settings
+
+    @classmethod
+    def from_file(cls, filepath: str) -> 'ConversionSettings':
+        """Load settings from a JSON config file.
+
+        Args:
+            filepath: Path to a JSON file with setting names as keys
+
+        Returns:
+            A new ConversionSettings instance
+        """
+        with open(filepath, 'r', encoding='utf-8') as f:
+            return cls.from_dict(json.load(f))
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the settings as a plain JSON-serializable dictionary."""
+        data = {name: getattr(self, name) for name in self.__dataclass_fields__}
+        data["vertex_color"] = list(self.vertex_color)
+        data["collision_flags"] = dict(self.collision_flags)
+        return data
@@ -1,16 +1,37 @@
 # Conversion utilities
 from .convert_collision import convert_collision
+from .fit_primitives import fit_collision_primitives
+from .convex_decomposition import convex_decomposition
 from .convert_drawable import convert_drawable
-from .convert_materials import convert_materials
+from .convert_materials import convert_materials, resolve_shader_index
 from .create_ytyp import create_ytyp
 from .create_archetype import create_archetype
 from .set_textures import set_textures_from_original_name
+from .prop_digest import compute_prop_digest, compute_mesh_digest
+from .generate_lods import attach_lods, generate_lods
+from .split_models import split_model, split_oversized_models
+from .collision_materials import CollisionMaterialPool
+from .material_cache import convert_materials_cached, material_key
+from .texture_registry import TextureRegistry
 
 __all__ = [
     'convert_collision',
+    'fit_collision_primitives',
+    'convex_decomposition',
     'convert_drawable',
     'convert_materials',
+    'resolve_shader_index',
     'create_ytyp',
     'create_archetype',
     'set_textures_from_original_name',
+    'compute_prop_digest',
+    'compute_mesh_digest',
+    'attach_lods',
+    'generate_lods',
+    'split_model',
+    'split_oversized_models',
+    'CollisionMaterialPool',
+    'convert_materials_cached',
+    'material_key',
+    'TextureRegistry',
 ]
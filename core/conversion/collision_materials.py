@@ -0,0 +1,84 @@
+import bpy
+import importlib
+from typing import Dict, Mapping, Optional, Tuple
+from ... import constants
+
+# Custom property tagging pooled materials with their pool key
+POOL_KEY_PROPERTY = "propconverter_collision_key"
+
+
+def flag_bitmask(flags: Mapping[str, bool]) -> int:
+    """Pack collision flags into a bitmask, in the order of ALL_COLLISION_FLAGS."""
+    mask = 0
+    for bit, flag_name in enumerate(constants.ALL_COLLISION_FLAGS):
+        if flags.get(flag_name, False):
+            mask |= 1 << bit
+    return mask
+
+
+class CollisionMaterialPool:
+    """Collision materials shared across material slots and props.
+
+    Materials are keyed by (collision material index, flag bitmask): every
+    slot and prop converted with the same settings reuses one datablock
+    instead of creating its own. Pooled materials are tagged with their
+    key, so materials of an earlier session found in the .blend are reused
+    as well.
+
+    Example:
+        >>> pool = CollisionMaterialPool.get_instance()
+        >>> material = pool.get(mod_name, 0, {"stairs": True})
+    """
+
+    _instance: Optional['CollisionMaterialPool'] = None
+
+    def __init__(self):
+        self._materials: Dict[Tuple[int, int], str] = {}
+        self._scanned = False
+
+    @classmethod
+    def get_instance(cls) -> 'CollisionMaterialPool':
+        """Return the pool shared by the session."""
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
+    def reset(self) -> None:
+        """Forget the pooled materials (they are found again by their tag)."""
+        self._materials.clear()
+        self._scanned = False
+
+    def _scan(self) -> None:
+        """Index the tagged materials already in the file, once."""
+        self._scanned = True
+        for material in bpy.data.materials:
+            key = material.get(POOL_KEY_PROPERTY)
+            if isinstance(key, str) and key.count(":") == 1:
+                index, mask = key.split(":")
+                self._materials.setdefault((int(index), int(mask)), material.name)
+
+    def get(self, mod_name: str, material_index: int, flags: Mapping[str, bool]) -> bpy.types.Material:
+        """Return the collision material for an index and a set of flags, creating it if needed.
+
+        Args:
+            mod_name: Sollumz module name
+            material_index: Sollumz collision material index
+            flags: Mapping of collision flag name to enabled state
+        """
+        if not self._scanned:
+            self._scan()
+        key = (material_index, flag_bitmask(flags))
+        tag = f"{key[0]}:{key[1]}"
+        material = bpy.data.materials.get(self._materials.get(key, ""))
+        if material is not None and material.get(POOL_KEY_PROPERTY) == tag:
+            return material
+
+        collision_materials = importlib.import_module(f"{mod_name}.ybn.collision_materials")
+        material = collision_materials.create_collision_material_from_index(material_index)
+        if hasattr(material, "collision_flags"):
+            for flag_name in constants.ALL_COLLISION_FLAGS:
+                setattr(material.collision_flags, flag_name, flags.get(flag_name, False))
+        material[POOL_KEY_PROPERTY] = tag
+        self._materials[key] = material.name
+        print(f"[COLLISION] Created pooled collision material {material.name} (index {key[0]}, flags {key[1]:#06x})")
+        return material
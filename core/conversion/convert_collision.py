@@ -1,93 +1,239 @@
 import bpy
-import importlib
+from mathutils import Matrix
 from ... import constants
+from ...conversion_settings import ConversionSettings
+from ...sollumz_integration import SollumzIntegration
+from .fit_primitives import fit_collision_primitives
+from .convex_decomposition import convex_decomposition
+from .collision_materials import CollisionMaterialPool
 
+# Sollumz Object properties holding the primitive bound dimensions
+_PRIMITIVE_PROPERTIES = ("bound_dimensions", "bound_radius", "bound_length")
 
-def convert_collision(context, collision_obj: bpy.types.Object, mod_name: str):
-    """Convert collision mesh to composite and apply collision materials."""
+
+def apply_collision_materials(mesh: bpy.types.Mesh, mod_name: str, settings: ConversionSettings):
+    """Replace every material slot of a mesh with the configured collision material and flags.
+    
+    The material comes from the collision material pool, so every slot and
+    every prop converted with the same index and flags share one datablock.
+    """
+    collision_mat = CollisionMaterialPool.get_instance().get(
+        mod_name, settings.collision_material_index, settings.collision_flags
+    )
+    num_materials = len(mesh.materials)
+    if num_materials > 0:
+        for i in range(num_materials):
+            mesh.materials[i] = collision_mat
+        print(f"Converted {num_materials} material slot(s) to collision material {collision_mat.name}")
+    else:
+        mesh.materials.append(collision_mat)
+        print(f"Assigned collision material {collision_mat.name} to empty mesh")
+
+
+def _build_composite(context, collision_obj: bpy.types.Object, children):
+    """Replace the collision mesh with a Bound Composite holding new bound objects.
+    
+    Args:
+        context: Blender context
+        collision_obj: Collision mesh, removed once the composite is built
+        children: List of (name, sollum_type, mesh, matrix_local) for the bounds
+    
+    Returns:
+        Tuple of (composite, bounds) with the bounds in the order of children
+    """
+    SollumType = SollumzIntegration.get_instance().get_sollumz_properties().SollumType
+    collections = list(collision_obj.users_collection) or [context.collection]
+    
+    def link(obj):
+        for collection in collections:
+            collection.objects.link(obj)
+    
+    composite_obj = bpy.data.objects.new(f"{collision_obj.name}.composite", None)
+    composite_obj.sollum_type = SollumType.BOUND_COMPOSITE
+    composite_obj.matrix_world = collision_obj.matrix_world
+    link(composite_obj)
+    
+    bounds = []
+    for name, sollum_type, mesh, matrix_local in children:
+        bound = bpy.data.objects.new(name, mesh)
+        link(bound)
+        bound.sollum_type = sollum_type
+        bound.parent = composite_obj
+        bound.matrix_local = matrix_local
+        bounds.append(bound)
+    
     try:
+        SollumzIntegration.get_instance().run_operator(context, "load_flag_preset", bounds)
+    except Exception as op_err:
+        print(f"[WARNING] Could not apply flag preset via operator: {op_err}")
+    
+    collision_mesh = collision_obj.data
+    bpy.data.objects.remove(collision_obj)
+    if collision_mesh.users == 0:
+        bpy.data.meshes.remove(collision_mesh)
+    return composite_obj, bounds
+
+
+def convert_primitive_collision(context, collision_obj: bpy.types.Object, mod_name: str, settings: ConversionSettings):
+    """Replace the collision mesh with a composite of fitted bound primitives.
+    
+    Returns the composite, or None if the mesh is not well approximated by
+    primitives (or Sollumz lacks the primitive properties), in which case
+    the collision mesh is left untouched for the BVH conversion.
+    """
+    object_properties = bpy.types.Object.bl_rna.properties
+    if not all(name in object_properties for name in _PRIMITIVE_PROPERTIES):
+        print("[PRIMITIVES] Sollumz primitive bound properties not found, using BVH")
+        return None
+    
+    fits = fit_collision_primitives(
+        collision_obj,
+        tolerance=settings.primitive_tolerance,
+        max_primitives=settings.primitive_max_count
+    )
+    if not fits:
+        print(f"[PRIMITIVES] {collision_obj.name} is not a good primitive fit, using BVH")
+        return None
+    
+    SollumType = SollumzIntegration.get_instance().get_sollumz_properties().SollumType
+    sollum_types = {
+        'BOX': SollumType.BOUND_BOX,
+        'SPHERE': SollumType.BOUND_SPHERE,
+        'CAPSULE': SollumType.BOUND_CAPSULE,
+        'CYLINDER': SollumType.BOUND_CYLINDER,
+    }
+    
+    name = collision_obj.name
+    children = []
+    for index, fit in enumerate(fits):
+        mesh = bpy.data.meshes.new(f"{name}.{index}")
+        apply_collision_materials(mesh, mod_name, settings)
+        matrix_local = Matrix.Translation(fit.center) @ Matrix(fit.rotation.tolist()).to_4x4()
+        children.append((f"{name}.{fit.kind.lower()}.{index}", sollum_types[fit.kind], mesh, matrix_local))
+        print(f"[PRIMITIVES] {fit.kind} {index}: deviation {fit.deviation:.4f}m")
+    
+    composite_obj, primitives = _build_composite(context, collision_obj, children)
+    
+    # Sollumz rebuilds the primitive meshes from these properties
+    for primitive, fit in zip(primitives, fits):
+        if fit.kind == 'BOX':
+            primitive.bound_dimensions = fit.size
+        else:
+            primitive.bound_radius = fit.radius
+            if fit.kind != 'SPHERE':
+                primitive.bound_length = fit.length
+    
+    print(f"[PRIMITIVES] Replaced the collision mesh with {len(fits)} primitive(s)")
+    return composite_obj
+
+
+def convert_convex_collision(context, collision_obj: bpy.types.Object, mod_name: str, settings: ConversionSettings):
+    """Replace the collision mesh with a composite of convex Bound Geometry hulls.
+    
+    Returns the composite, or None if the hulls would not cover every part of
+    the mesh, in which case it is left untouched for the BVH conversion.
+    """
+    hulls = convex_decomposition(
+        collision_obj,
+        max_hulls=settings.convex_max_hulls,
+        volume_error=settings.convex_volume_error,
+        workers=settings.convex_workers
+    )
+    if not hulls:
+        print(f"[CONVEX] No full hull cover for {collision_obj.name}, using BVH")
+        return None
+    
+    SollumType = SollumzIntegration.get_instance().get_sollumz_properties().SollumType
+    name = collision_obj.name
+    children = []
+    for index, (vertices, faces) in enumerate(hulls):
+        mesh = bpy.data.meshes.new(f"{name}.hull.{index}")
+        mesh.from_pydata(vertices, [], faces)
+        mesh.update()
+        apply_collision_materials(mesh, mod_name, settings)
+        children.append((f"{name}.hull.{index}", SollumType.BOUND_GEOMETRY, mesh, Matrix.Identity(4)))
+    
+    composite_obj, _ = _build_composite(context, collision_obj, children)
+    print(f"[CONVEX] Replaced the collision mesh with {len(hulls)} convex hull(s)")
+    return composite_obj
+
+
+def _find_composite_parts(collision_obj: bpy.types.Object, collision_name: str, collections):
+    """Find the BVH and poly mesh made by converttocomposite from a collision mesh.
+    
+    Sollumz turns the converted mesh itself into the poly mesh, parented to a
+    new BVH under a new composite, so the hierarchy is walked up from it. If
+    the mesh object was replaced instead, only the objects of the given
+    collections are scanned for a BVH named after the collision mesh.
+    
+    Returns:
+        Tuple of (bvh, poly_mesh), either of them None if not found
+    """
+    try:
+        poly_mesh = collision_obj if collision_obj.type == 'MESH' else None
+    except ReferenceError:
+        # The operator removed the collision mesh object
+        poly_mesh = None
+    bvh_obj = poly_mesh.parent if poly_mesh else None
+    if bvh_obj is not None and bvh_obj.name.lower().endswith(constants.BVH_SUFFIX):
+        return bvh_obj, poly_mesh
+    
+    prefix = collision_name.lower()
+    for collection in collections:
+        for obj in collection.all_objects:
+            name = obj.name.lower()
+            if name.startswith(prefix) and name.endswith(constants.BVH_SUFFIX):
+                poly_mesh = next((c for c in obj.children if c.name.endswith(constants.POLY_MESH_SUFFIX)), None)
+                return obj, poly_mesh
+    return None, None
+
+
+def convert_collision(context, collision_obj: bpy.types.Object, mod_name: str, settings: ConversionSettings = None):
+    """Convert collision mesh to composite and apply collision materials.
+    
+    With primitive fitting enabled, meshes made of boxes, spheres, capsules
+    or cylinders become primitive bounds instead of a BVH. With convex
+    decomposition enabled, the remaining meshes become convex hulls.
+    """
+    try:
+        settings = ConversionSettings.from_context_or(context, settings)
+        
+        composite_obj = None
+        if settings.enable_primitive_fitting:
+            composite_obj = convert_primitive_collision(context, collision_obj, mod_name, settings)
+        if composite_obj is None and settings.enable_convex_decomposition:
+            composite_obj = convert_convex_collision(context, collision_obj, mod_name, settings)
+        if composite_obj is not None:
+            print("[STAGE] convert_collision: EXIT")
+            print("="*80 + "\n")
+            return composite_obj
        
-        bpy.ops.object.select_all(action='DESELECT')
-        collision_obj.select_set(True)
-        context.view_layer.objects.active = collision_obj
-        pre_object_names = {o.name for o in bpy.data.objects}
+        sollumz = SollumzIntegration.get_instance()
+        collision_name = collision_obj.name
+        collections = list(dict.fromkeys(list(collision_obj.users_collection) + [context.collection]))
         
-      
-        bpy.ops.sollumz.converttocomposite()
-  
-
-        created_objs = [o for o in bpy.data.objects if o.name not in pre_object_names]
-   
-        bvh_obj = next((o for o in created_objs if o.name.lower().endswith(constants.BVH_SUFFIX)), None)
-        if bvh_obj is None:
-            bvh_obj = next((o for o in bpy.data.objects if o.name.lower().endswith(constants.BVH_SUFFIX)), None)
+        sollumz.convert_to_composite(context, collision_obj)
+        
+        bvh_obj, poly_mesh = _find_composite_parts(collision_obj, collision_name, collections)
         if bvh_obj:
-   
             if bvh_obj.type == 'MESH':
                 print(f"[DEBUG] BVH loops: {len(bvh_obj.data.loops)}, vertices: {len(bvh_obj.data.vertices)}")
             else:
                 print(f"[DEBUG] BVH is {bvh_obj.type} (not a mesh - likely parent/empty)")
-            bpy.ops.object.select_all(action='DESELECT')
-            bvh_obj.select_set(True)
-            context.view_layer.objects.active = bvh_obj
             print("[SOLLUMZ] Applying flag preset to BVH...")
             try:
-                bpy.ops.sollumz.load_flag_preset()
+                sollumz.run_operator(context, "load_flag_preset", [bvh_obj])
                 print("[SOLLUMZ] Flag preset applied successfully.")
             except Exception as op_err:
                 print(f"[WARNING] Could not apply flag preset via operator: {op_err}")
 
-        poly_mesh = next((o for o in bpy.data.objects if o.name.endswith(constants.POLY_MESH_SUFFIX) and o.parent and o.parent.name == (bvh_obj.name if bvh_obj else "")), None)
         if poly_mesh and mod_name:
             print(f"[POLY_MESH] Found poly_mesh: {poly_mesh.name}")
             print(f"[DEBUG]   Poly_mesh loops: {len(poly_mesh.data.loops)}")
             print(f"[DEBUG]   Poly_mesh vertices: {len(poly_mesh.data.vertices)}")
             print(f"[DEBUG]   Poly_mesh polygons: {len(poly_mesh.data.polygons)}")
-            bpy.ops.object.select_all(action='DESELECT')
-            poly_mesh.select_set(True)
-            context.view_layer.objects.active = poly_mesh
             try:
-                collision_mat_index = getattr(context.window_manager, "sz_collision_material_index", 0)
-                print(f"Converting materials to collision material index: {collision_mat_index}")
-                collision_materials = importlib.import_module(f"{mod_name}.ybn.collision_materials")
-                create_collision_material = collision_materials.create_collision_material_from_index
-                mesh = poly_mesh.data
-                num_materials = len(mesh.materials)
-                if num_materials > 0:
-                    for i in range(num_materials):
-                        collision_mat = create_collision_material(collision_mat_index)
-                        mesh.materials[i] = collision_mat
-                        print(f"Converted material slot {i} to collision material")
-                else:
-                    collision_mat = create_collision_material(collision_mat_index)
-                    mesh.materials.append(collision_mat)
-                    print("Created collision material for empty mesh")
-                
-                # Apply collision flags from PropConverter-V properties
-                props = getattr(context.scene, "prop_converter", None)
-                if props and hasattr(props, "collision_flags"):
-                    collision_flags = props.collision_flags
-                    # Apply flags to all collision materials on this mesh
-                    for mat in mesh.materials:
-                        if mat and hasattr(mat, "collision_flags"):
-                            mat.collision_flags.stairs = collision_flags.stairs
-                            mat.collision_flags.not_climbable = collision_flags.not_climbable
-                            mat.collision_flags.see_through = collision_flags.see_through
-                            mat.collision_flags.shoot_through = collision_flags.shoot_through
-                            mat.collision_flags.not_cover = collision_flags.not_cover
-                            mat.collision_flags.walkable_path = collision_flags.walkable_path
-                            mat.collision_flags.no_cam_collision = collision_flags.no_cam_collision
-                            mat.collision_flags.shoot_through_fx = collision_flags.shoot_through_fx
-                            mat.collision_flags.no_decal = collision_flags.no_decal
-                            mat.collision_flags.no_navmesh = collision_flags.no_navmesh
-                            mat.collision_flags.no_ragdoll = collision_flags.no_ragdoll
-                            mat.collision_flags.vehicle_wheel = collision_flags.vehicle_wheel
-                            mat.collision_flags.no_ptfx = collision_flags.no_ptfx
-                            mat.collision_flags.too_steep_for_player = collision_flags.too_steep_for_player
-                            mat.collision_flags.no_network_spawn = collision_flags.no_network_spawn
-                            mat.collision_flags.no_cam_collision_allow_clipping = collision_flags.no_cam_collision_allow_clipping
-                            print(f"Applied collision flags to material: {mat.name}")
-                
+                apply_collision_materials(poly_mesh.data, mod_name, settings)
                 print(f"Successfully converted all materials to collision material on {poly_mesh.name}")
             except Exception as mat_err:
                 print(f"WARNING: Could not apply collision material to poly_mesh: {mat_err}")
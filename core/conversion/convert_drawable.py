@@ -1,5 +1,6 @@
 import bpy
 from typing import Optional, Tuple
+from ...sollumz_integration import SollumzIntegration
 from .collect_models import collect_model_meshes
 from .debug_utils import log_pre_conversion, log_post_conversion, log_mesh_internals
 
@@ -7,13 +8,8 @@ from .debug_utils import log_pre_conversion, log_post_conversion, log_mesh_inter
 def convert_drawable(context, obj: bpy.types.Object, composite_obj: Optional[bpy.types.Object]) -> Tuple[list, Optional[bpy.types.Object]]:
     """Convert to drawable and parent collision structure."""
     try:
-        # Select object
-        bpy.ops.object.select_all(action='DESELECT')
-        obj.select_set(True)
-        context.view_layer.objects.active = obj
-        
         # Convert to drawable
-        bpy.ops.sollumz.converttodrawable()
+        SollumzIntegration.get_instance().convert_to_drawable(context, obj)
         
         # Update scene
         context.view_layer.update()
@@ -1,60 +1,99 @@
 import bpy
+from typing import Optional
 from ...sollumz_integration import SollumzIntegration
+from ...conversion_settings import ConversionSettings
 from ... import constants
+from .material_cache import convert_materials_cached
 
 
-def convert_materials(context, model_objs, mod_name: str, original_name: str = None) -> bool:
+def resolve_shader_index(context, shader_index: int = -1, shader_name: str = "") -> Optional[int]:
+    """Resolve the shader index used by the Sollumz material conversion.
+    
+    A shader name takes precedence over the index. An out-of-range index
+    falls back to the default shader. Lookups go through the session shader
+    catalog. The resolved index is written to the window manager, which is
+    where the Sollumz operator reads it from.
+    
+    Args:
+        context: Blender context
+        shader_index: Requested shader index (-1 for the default shader)
+        shader_name: Requested shader name or filename (empty to use the index)
+        
+    Returns:
+        The resolved shader index, or None if no shader could be found
+    """
+    catalog = SollumzIntegration.get_instance().get_shader_catalog()
+    
+    if not catalog:
+        print("[ERROR] Could not load Sollumz shader materials")
+        return None
+    
+    if shader_name:
+        shader = catalog.find(shader_name)
+        if shader is None:
+            print(f"[ERROR] Unknown shader {shader_name}")
+            return None
+        shader_index = shader.index
+    elif catalog.get(shader_index) is None:
+        shader = catalog.default
+        if shader is None:
+            print(f"[ERROR] Could not find {constants.DEFAULT_SHADER_NAME} shader")
+            return None
+        shader_index = shader.index
+    
+    wm = context.window_manager
+    if getattr(wm, "sz_shader_material_index", -1) != shader_index:
+        wm.sz_shader_material_index = shader_index
+    return shader_index
+
+
+def convert_materials(context, model_objs, mod_name: str, original_name: str = None, settings: ConversionSettings = None, shader_index: Optional[int] = None) -> bool:
     """Convert materials on model objects to the selected shader.
     
+    Identical source materials are converted once per session and shader,
+    see convert_materials_cached.
+    
     Args:
         context: Blender context
         model_objs: List of model objects to convert materials for
         mod_name: Sollumz module name
         original_name: Original mesh name (before conversion) for texture naming
+        settings: Conversion settings (read from the context if None)
+        shader_index: Pre-resolved shader index; skips the shader lookup when given
     """
     try:
-        sollumz = SollumzIntegration.get_instance()
-        shadermats = sollumz.get_shader_materials()
-        
-        if not shadermats:
-            print("[ERROR] Could not load Sollumz shader materials")
-            return False
+        settings = ConversionSettings.from_context_or(context, settings)
         
-        wm = context.window_manager
-        selected_idx = getattr(wm, "sz_shader_material_index", -1)
-        
-        if not (0 <= selected_idx < len(shadermats)):
-            selected_idx = next(
-                (i for i, shader in enumerate(shadermats) 
-                 if shader.value == constants.DEFAULT_SHADER_NAME), 
-                None
-            )
-            if selected_idx is None:
-                print(f"[ERROR] Could not find {constants.DEFAULT_SHADER_NAME} shader")
+        if shader_index is None:
+            shader_index = resolve_shader_index(context, settings.shader_index, settings.shader_name)
+            if shader_index is None:
                 return False
-            wm.sz_shader_material_index = selected_idx
-
-        if model_objs:
-            bpy.ops.object.select_all(action='DESELECT')
-            for m in model_objs:
-                m.select_set(True)
-            context.view_layer.objects.active = model_objs[0]
+        else:
+            wm = context.window_manager
+            if getattr(wm, "sz_shader_material_index", -1) != shader_index:
+                wm.sz_shader_material_index = shader_index
 
-        bpy.ops.sollumz.convertallmaterialstoselected()
-        
-        # Set texture parameters after conversion (only if auto texture is enabled)
-        from .set_textures import set_textures_from_original_name
-        scene_props = getattr(context.scene, "prop_converter", None)
-        
-        # Check if auto texture feature is enabled
-        if scene_props and getattr(scene_props, "auto_texture_from_mesh_name", False):
-            # Use the passed original_name if provided, otherwise fall back to stored mesh name
+        # Use the passed original_name if provided, otherwise fall back to stored mesh name
+        texture_name = None
+        if settings.auto_texture_from_mesh_name:
             texture_name = original_name
             if not texture_name:
+                scene_props = getattr(context.scene, "prop_converter", None)
                 original_mesh = scene_props.original_mesh if scene_props else None
                 if original_mesh:
                     texture_name = original_mesh.name
-            
+        
+        catalog = SollumzIntegration.get_instance().get_shader_catalog()
+        shader = catalog.get(shader_index) if catalog else None
+        shader_key = shader.filename if shader else str(shader_index)
+        if not convert_materials_cached(context, model_objs or [], shader_key, texture_name):
+            return False
+        
+        # Set texture parameters after conversion (only if auto texture is enabled)
+        from .set_textures import set_textures_from_original_name
+        
+        # Check if auto texture feature is enabled
+        if settings.auto_texture_from_mesh_name:
             if texture_name:
                 ok_textures = set_textures_from_original_name(context, model_objs, texture_name)
                 if not ok_textures:
@@ -0,0 +1,271 @@
+import bpy
+import bmesh
+import heapq
+import itertools
+import multiprocessing
+import os
+import numpy as np
+from typing import List, Optional, Sequence, Tuple
+from mathutils import Vector
+from .fit_primitives import split_clusters
+
+# A convex hull as plain lists, picklable across worker processes
+Hull = Tuple[List[Tuple[float, float, float]], List[List[int]]]
+
+
+def _build_bmesh(positions: Sequence, triangles: Sequence) -> bmesh.types.BMesh:
+    """Build a bmesh from vertex positions and triangle indices."""
+    bm = bmesh.new()
+    verts = [bm.verts.new(co) for co in positions]
+    for a, b, c in triangles:
+        try:
+            bm.faces.new((verts[a], verts[b], verts[c]))
+        except ValueError:
+            pass  # Duplicate or degenerate face
+    return bm
+
+
+def _convex_hull(bm: bmesh.types.BMesh) -> bmesh.types.BMesh:
+    """Return the convex hull of the vertices of a bmesh, as a new bmesh."""
+    hull = bmesh.new()
+    verts = [hull.verts.new(v.co) for v in bm.verts]
+    if len(verts) < 4:
+        return hull
+    try:
+        result = bmesh.ops.convex_hull(hull, input=verts, use_existing_faces=False)
+    except RuntimeError:
+        # Flat or degenerate point set
+        return hull
+    unused = {v for v in result["geom_interior"] + result["geom_unused"] if isinstance(v, bmesh.types.BMVert)}
+    bmesh.ops.delete(hull, geom=list(unused), context='VERTS')
+    hull.verts.index_update()
+    return hull
+
+
+def _split(bm: bmesh.types.BMesh, co: Vector, no: Vector) -> List[bmesh.types.BMesh]:
+    """Cut a closed bmesh in two along a plane, closing both cut faces."""
+    halves = []
+    for clear_inner, clear_outer in ((True, False), (False, True)):
+        half = bm.copy()
+        result = bmesh.ops.bisect_plane(
+            half,
+            geom=half.verts[:] + half.edges[:] + half.faces[:],
+            plane_co=co,
+            plane_no=no,
+            clear_inner=clear_inner,
+            clear_outer=clear_outer
+        )
+        cut_edges = [e for e in result["geom_cut"] if isinstance(e, bmesh.types.BMEdge)]
+        if cut_edges:
+            bmesh.ops.holes_fill(half, edges=cut_edges, sides=0)
+        halves.append(half)
+    return halves
+
+
+class _Piece:
+    """A part of the mesh with its hull and concavity (hull volume minus part volume)."""
+
+    def __init__(self, bm: bmesh.types.BMesh):
+        self.bm = bm
+        self.hull = _convex_hull(bm)
+        self.hull_volume = self.hull.calc_volume()
+        volume = min(max(bm.calc_volume(), 0.0), self.hull_volume)
+        self.error = self.hull_volume - volume
+
+    def free(self) -> None:
+        self.bm.free()
+        self.hull.free()
+
+
+def _best_split(piece: _Piece) -> List[_Piece]:
+    """Split a piece at the middle of the axis giving the smallest total hull volume."""
+    coords = np.array([v.co for v in piece.bm.verts], dtype=np.float64)
+    low, high = coords.min(axis=0), coords.max(axis=0)
+    best, best_volume = None, piece.hull_volume
+    for axis in range(3):
+        if high[axis] - low[axis] <= 1e-6:
+            continue
+        no = Vector((0.0, 0.0, 0.0))
+        no[axis] = 1.0
+        halves = [_Piece(half) for half in _split(piece.bm, Vector((low + high) / 2.0), no)]
+        volume = sum(half.hull_volume for half in halves)
+        # A flat half has no hull and would leave a hole in the collision
+        if all(len(half.hull.faces) >= 4 for half in halves) and volume < best_volume:
+            if best:
+                for half in best:
+                    half.free()
+            best, best_volume = halves, volume
+        else:
+            for half in halves:
+                half.free()
+    return best or []
+
+
+def decompose_arrays(
+    positions: Sequence,
+    triangles: Sequence,
+    max_hulls: int = 8,
+    volume_error: float = 0.05
+) -> List[Hull]:
+    """Approximate a closed mesh by convex hulls.
+
+    The piece with the largest concavity is split in two, along the axis
+    that shrinks its hulls the most, until the total concavity is below
+    volume_error times the volume of the whole hull or max_hulls is reached.
+
+    Args:
+        positions: Vertex positions
+        triangles: Triangle vertex indices
+        max_hulls: Largest number of hulls
+        volume_error: Allowed hull volume in excess of the mesh volume,
+            relative to the volume of the convex hull of the whole mesh
+
+    Returns:
+        One (vertices, faces) hull per piece, empty if the mesh is flat
+    """
+    root = _Piece(_build_bmesh(positions, triangles))
+    target = volume_error * root.hull_volume
+    counter = itertools.count()
+    heap = [(-root.error, next(counter), root)]
+    final = []
+    total_error = root.error
+
+    while heap and len(heap) + len(final) < max_hulls and total_error > target:
+        _, _, piece = heapq.heappop(heap)
+        halves = _best_split(piece)
+        if not halves:
+            # Cannot be improved by splitting, keep it as is
+            final.append(piece)
+            continue
+        total_error += sum(half.error for half in halves) - piece.error
+        piece.free()
+        for half in halves:
+            heapq.heappush(heap, (-half.error, next(counter), half))
+
+    hulls = []
+    for piece in final + [item[2] for item in heap]:
+        if len(piece.hull.faces) >= 4:
+            hulls.append((
+                [tuple(v.co) for v in piece.hull.verts],
+                [[v.index for v in face.verts] for face in piece.hull.faces]
+            ))
+        piece.free()
+    return hulls
+
+
+def allocate_hulls(sizes: List[int], max_hulls: int) -> List[int]:
+    """Share max_hulls between parts in proportion to their sizes.
+
+    Every part gets one hull and the rest is shared by largest remainder,
+    so the total is exactly max_hulls. With more parts than hulls, the
+    largest parts get one hull each and the smallest get none.
+
+    Args:
+        sizes: Vertex count of every part
+        max_hulls: Number of hulls for all the parts
+
+    Returns:
+        Number of hulls of every part (0 for a skipped part)
+    """
+    max_hulls = max(1, max_hulls)
+    order = np.argsort(sizes, kind='stable')[::-1]
+    shares = np.zeros(len(sizes), dtype=np.int64)
+    if len(sizes) >= max_hulls:
+        shares[order[:max_hulls]] = 1
+        return shares.tolist()
+
+    shares[:] = 1
+    extra = max_hulls - len(sizes)
+    quotas = extra * np.asarray(sizes, dtype=np.float64) / max(sum(sizes), 1)
+    shares += np.floor(quotas).astype(np.int64)
+    remainders = quotas - np.floor(quotas)
+    left = max_hulls - int(shares.sum())
+    shares[np.argsort(-remainders, kind='stable')[:left]] += 1
+    return shares.tolist()
+
+
+def _decompose_part(args) -> List[Hull]:
+    """Worker entry point, args is the tuple of decompose_arrays arguments."""
+    return decompose_arrays(*args)
+
+
+def convex_decomposition(
+    obj: bpy.types.Object,
+    max_hulls: int = 8,
+    volume_error: float = 0.05,
+    workers: int = 1
+) -> Optional[List[Hull]]:
+    """Decompose a collision mesh into convex hulls.
+
+    Each connected part of the mesh is decomposed separately, with a share
+    of max_hulls proportional to its vertex count (see allocate_hulls).
+    Parts are processed in the current process, or in a pool of forked
+    processes when workers is not 1 in background mode.
+
+    The hulls must cover every part: with more parts than max_hulls, or a
+    flat part without hull, None is returned so that the mesh is kept for
+    a BVH instead of losing collision.
+
+    Args:
+        obj: Collision mesh object
+        max_hulls: Largest number of hulls for the whole mesh
+        volume_error: Allowed relative excess volume, see decompose_arrays
+        workers: Worker processes (0 for one per CPU, 1 decomposes in the
+            current process). Opt-in, like the ambient occlusion workers:
+            forking Blender, which is multithreaded, can deadlock a worker
+
+    Returns:
+        The hulls, in the local space of obj, or None if a part has none
+    """
+    mesh = obj.data
+    mesh.calc_loop_triangles()
+    positions = np.empty(len(mesh.vertices) * 3, dtype=np.float64)
+    mesh.vertices.foreach_get("co", positions)
+    positions = positions.reshape(-1, 3)
+    triangles = np.empty(len(mesh.loop_triangles) * 3, dtype=np.int64)
+    mesh.loop_triangles.foreach_get("vertices", triangles)
+    triangles = triangles.reshape(-1, 3)
+    if len(triangles) == 0:
+        return []
+
+    edges = np.concatenate((triangles[:, [0, 1]], triangles[:, [1, 2]]))
+    labels = split_clusters(len(positions), edges)
+    triangle_labels = labels[triangles[:, 0]]
+
+    parts = []
+    for label in np.unique(triangle_labels):
+        part_triangles = triangles[triangle_labels == label]
+        vertices, remapped = np.unique(part_triangles, return_inverse=True)
+        parts.append((vertices, remapped))
+
+    if len(parts) > max_hulls:
+        small = sorted(len(vertices) for vertices, _ in parts)[:len(parts) - max_hulls]
+        print(f"[CONVEX] {len(parts)} parts in {obj.name} for {max_hulls} hulls, "
+              f"{len(small)} part(s) of {', '.join(map(str, small))} vertices would have no collision")
+        return None
+
+    jobs = []
+    shares = allocate_hulls([len(vertices) for vertices, _ in parts], max_hulls)
+    for (vertices, remapped), share in zip(parts, shares):
+        jobs.append((
+            positions[vertices].tolist(),
+            remapped.reshape(-1, 3).tolist(),
+            share,
+            volume_error
+        ))
+
+    workers = workers or os.cpu_count() or 1
+    can_fork = bpy.app.background and "fork" in multiprocessing.get_all_start_methods()
+    print(f"[CONVEX] Decomposing {len(jobs)} part(s) of {obj.name} into up to {max_hulls} hulls")
+    if can_fork and workers > 1 and len(jobs) > 1:
+        with multiprocessing.get_context("fork").Pool(min(workers, len(jobs))) as pool:
+            results = pool.map(_decompose_part, jobs)
+    else:
+        results = [_decompose_part(job) for job in jobs]
+
+    flat = [index for index, hulls in enumerate(results) if not hulls]
+    if flat:
+        print(f"[CONVEX] {len(flat)} flat part(s) of {obj.name} have no hull "
+              f"({', '.join(str(len(jobs[index][0])) for index in flat)} vertices)")
+        return None
+    return [hull for hulls in results for hull in hulls]
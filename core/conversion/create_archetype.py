@@ -1,8 +1,9 @@
 import bpy
+from typing import Optional
 from ...sollumz_integration import SollumzIntegration
 
 
-def create_archetype(context, obj, mod_name: str, original_name: str):
+def create_archetype(context, obj, mod_name: str, original_name: str, lod_dist: Optional[float] = None):
     try:
         print(f"Creating archetype from drawable: {obj.name}")
         sollumz = SollumzIntegration.get_instance()
@@ -26,16 +27,11 @@ def create_archetype(context, obj, mod_name: str, original_name: str):
 
         print(f"Found drawable parent: {drawable_parent.name} (type: {drawable_parent.sollum_type})")
         context.scene.create_archetype_type = ArchetypeType.BASE
-        bpy.ops.object.select_all(action='DESELECT')
-        drawable_parent.select_set(True)
-        context.view_layer.objects.active = drawable_parent
-        print(f"Drawable is selected: {drawable_parent.select_get()}")
-        print(f"Active object: {context.view_layer.objects.active.name if context.view_layer.objects.active else 'None'}")
-        print(f"Selected objects: {[o.name for o in context.selected_objects]}")
         print(f"YTYP index: {context.scene.ytyp_index}")
 
         context.view_layer.update()
-        result = bpy.ops.sollumz.createarchetypefromselected()
+        # Sollumz has no archetype function outside of its operator
+        result = sollumz.run_operator(context, "createarchetypefromselected", [drawable_parent])
         print(f"Operator result: {result}")
 
         selected_ytyp = context.scene.ytyps[context.scene.ytyp_index]
@@ -43,6 +39,8 @@ def create_archetype(context, obj, mod_name: str, original_name: str):
         if len(selected_ytyp.archetypes) > 0:
             archetype = selected_ytyp.archetypes[-1]
             archetype.texture_dictionary = original_name
+            if lod_dist is not None:
+                archetype.lod_dist = lod_dist
             print(f"Successfully created archetype: {archetype.name} with texture_dictionary: {original_name}")
         else:
             print("WARNING: No archetypes found after calling createarchetypefromselected")
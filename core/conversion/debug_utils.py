@@ -1,4 +1,5 @@
 import bpy
+from ..mesh_prep.mesh_snapshot import get_snapshot
 
 
 def log_pre_conversion(obj: bpy.types.Object):
@@ -41,9 +42,9 @@ def log_pre_conversion(obj: bpy.types.Object):
     
     # Loop analysis
     print(f"\n[PRE_CONVERT] Loop analysis (first 5):")
-    for i in range(min(5, len(mesh.loops))):
-        loop = mesh.loops[i]
-        print(f"[PRE_CONVERT]   Loop {i}: vertex={loop.vertex_index}, edge={loop.edge_index}")
+    loop_vertices = get_snapshot(mesh).loop_vertices
+    for i in range(min(5, len(loop_vertices))):
+        print(f"[PRE_CONVERT]   Loop {i}: vertex={loop_vertices[i]}, edge={mesh.loops[i].edge_index}")
     
     # Color attributes
     print(f"\n[PRE_CONVERT] Color attributes: {list(mesh.color_attributes.keys())}")
@@ -198,7 +199,7 @@ def log_mesh_internals(context, obj: bpy.types.Object):
         
         # Vertex data hashing
         if len(mesh.vertices) > 0:
-            vert_hash = hash(tuple((round(v.co.x, 6), round(v.co.y, 6), round(v.co.z, 6)) for v in list(mesh.vertices)[:100]))
+            vert_hash = hash(tuple(map(tuple, get_snapshot(mesh).positions[:100].round(6).tolist())))
             print(f"[MESH_INTERNALS]   Vertex positions hash (first 100): {vert_hash}")
     
     print("="*80 + "\n")
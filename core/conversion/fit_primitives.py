@@ -0,0 +1,234 @@
+import bpy
+import math
+import numpy as np
+from dataclasses import dataclass
+from typing import List, Optional, Tuple
+from ..mesh_prep.mesh_snapshot import get_snapshot
+
+# Axis of capsules and cylinders in the local space of a Sollumz bound
+PRIMITIVE_AXIS = 1  # Y
+
+
+@dataclass
+class PrimitiveFit:
+    """A bound primitive approximating a cluster of the collision mesh.
+
+    Attributes:
+        kind: 'BOX', 'SPHERE', 'CAPSULE' or 'CYLINDER'
+        center: Center in the local space of the collision mesh
+        rotation: 3x3 rotation (columns are the primitive's local axes)
+        size: Full extents of a box
+        radius: Radius of a sphere, capsule or cylinder
+        length: Length of a cylinder, or of the straight part of a capsule
+        deviation: Largest distance of a mesh vertex to the primitive surface
+        volume: Volume of the primitive
+    """
+    kind: str
+    center: Tuple[float, float, float]
+    rotation: np.ndarray
+    size: Tuple[float, float, float] = (0.0, 0.0, 0.0)
+    radius: float = 0.0
+    length: float = 0.0
+    deviation: float = 0.0
+    volume: float = 0.0
+
+
+def split_clusters(vertex_count: int, edges: np.ndarray) -> np.ndarray:
+    """Label the connected components of a mesh.
+
+    Args:
+        vertex_count: Number of vertices
+        edges: (E, 2) array of vertex indices
+
+    Returns:
+        Array of component labels per vertex (the lowest vertex index of
+        each component)
+    """
+    labels = np.arange(vertex_count)
+    if len(edges) == 0:
+        return labels
+    a, b = edges[:, 0], edges[:, 1]
+    while True:
+        low = np.minimum(labels[a], labels[b])
+        previous = labels.copy()
+        np.minimum.at(labels, a, low)
+        np.minimum.at(labels, b, low)
+        # Pointer jumping, every label converges to the component minimum
+        labels = labels[labels]
+        if np.array_equal(labels, previous):
+            return labels
+
+
+def _frames(points: np.ndarray) -> List[np.ndarray]:
+    """Candidate orientations: the mesh axes and the principal axes of the points."""
+    frames = [np.eye(3)]
+    if len(points) >= 3:
+        _, vectors = np.linalg.eigh(np.cov((points - points.mean(axis=0)).T))
+        if np.linalg.det(vectors) < 0.0:
+            vectors[:, 2] = -vectors[:, 2]
+        frames.append(vectors)
+    return frames
+
+
+def _axis_frame(frame: np.ndarray, axis: int) -> np.ndarray:
+    """Reorder a frame so that its column 'axis' becomes the primitive axis."""
+    others = [i for i in range(3) if i != axis]
+    columns = [None, None, None]
+    columns[PRIMITIVE_AXIS] = frame[:, axis]
+    free = [i for i in range(3) if i != PRIMITIVE_AXIS]
+    columns[free[0]] = frame[:, others[0]]
+    columns[free[1]] = frame[:, others[1]]
+    rotation = np.stack(columns, axis=1)
+    if np.linalg.det(rotation) < 0.0:
+        rotation[:, free[1]] = -rotation[:, free[1]]
+    return rotation
+
+
+def _candidates(points: np.ndarray) -> List[PrimitiveFit]:
+    """Fit every primitive kind to a point cloud, each enclosing all the points."""
+    fits = []
+    for frame in _frames(points):
+        local = points @ frame
+        low, high = local.min(axis=0), local.max(axis=0)
+        half = (high - low) / 2.0
+        center_local = (low + high) / 2.0
+        center = frame @ center_local
+        local = local - center_local
+
+        # Box: distance of each point to the nearest face
+        deviation = float(np.max(np.min(half - np.abs(local), axis=1)))
+        fits.append(PrimitiveFit(
+            'BOX', tuple(center), frame, size=tuple(half * 2.0),
+            deviation=deviation, volume=float(np.prod(half * 2.0))
+        ))
+
+        for axis in range(3):
+            h = local[:, axis]
+            radial = np.linalg.norm(np.delete(local, axis, axis=1), axis=1)
+            rotation = _axis_frame(frame, axis)
+
+            # Cylinder: nearest of the side and the caps
+            radius, half_length = float(radial.max()), float(np.abs(h).max())
+            deviation = float(np.max(np.minimum(radius - radial, half_length - np.abs(h))))
+            fits.append(PrimitiveFit(
+                'CYLINDER', tuple(center), rotation, radius=radius, length=half_length * 2.0,
+                deviation=deviation, volume=math.pi * radius ** 2 * half_length * 2.0
+            ))
+
+            # Capsule: distance to the axis segment
+            shaft = max(half_length - radius, 0.0)
+            distance = np.hypot(radial, h - np.clip(h, -shaft, shaft))
+            radius = float(distance.max())
+            fits.append(PrimitiveFit(
+                'CAPSULE', tuple(center), rotation, radius=radius, length=shaft * 2.0,
+                deviation=float(np.max(radius - distance)),
+                volume=math.pi * radius ** 2 * shaft * 2.0 + 4.0 / 3.0 * math.pi * radius ** 3
+            ))
+
+    center = (points.min(axis=0) + points.max(axis=0)) / 2.0
+    distance = np.linalg.norm(points - center, axis=1)
+    radius = float(distance.max())
+    fits.append(PrimitiveFit(
+        'SPHERE', tuple(center), np.eye(3), radius=radius,
+        deviation=float(np.max(radius - distance)), volume=4.0 / 3.0 * math.pi * radius ** 3
+    ))
+    return fits
+
+
+def _surface_area(fit: PrimitiveFit) -> float:
+    """Surface area of a fitted primitive."""
+    if fit.kind == 'BOX':
+        a, b, c = fit.size
+        return 2.0 * (a * b + b * c + c * a)
+    if fit.kind == 'SPHERE':
+        return 4.0 * math.pi * fit.radius ** 2
+    if fit.kind == 'CYLINDER':
+        return 2.0 * math.pi * fit.radius * (fit.radius + fit.length)
+    return 2.0 * math.pi * fit.radius * (2.0 * fit.radius + fit.length)
+
+
+def fit_primitive(
+    points: np.ndarray,
+    area: float,
+    tolerance: float,
+    area_tolerance: float = 0.15
+) -> Optional[PrimitiveFit]:
+    """Find the smallest primitive matching a cluster of the mesh.
+
+    A primitive matches when every vertex lies within tolerance of its
+    surface and the mesh area is close to the primitive area, which rejects
+    open or hollow shapes whose vertices happen to lie on the surface.
+
+    Args:
+        points: (N, 3) vertex positions of the cluster
+        area: Surface area of the cluster faces
+        tolerance: Largest allowed vertex distance to the surface, in meters
+        area_tolerance: Largest allowed relative area difference
+
+    Returns:
+        The matching primitive with the smallest volume, or None
+    """
+    best = None
+    for fit in _candidates(points):
+        if fit.deviation > tolerance:
+            continue
+        primitive_area = _surface_area(fit)
+        if primitive_area <= 0.0 or abs(area / primitive_area - 1.0) > area_tolerance:
+            continue
+        if best is None or fit.volume < best.volume:
+            best = fit
+    return best
+
+
+def fit_collision_primitives(
+    obj: bpy.types.Object,
+    tolerance: float = 0.02,
+    max_primitives: int = 8,
+    area_tolerance: float = 0.15
+) -> Optional[List[PrimitiveFit]]:
+    """Approximate a collision mesh by bound primitives.
+
+    Each connected part of the mesh must match a box, sphere, capsule or
+    cylinder; otherwise the mesh needs a BVH and None is returned.
+
+    Args:
+        obj: Collision mesh object
+        tolerance: Largest allowed vertex distance to a primitive, in meters
+        max_primitives: Largest number of primitives (parts) accepted
+        area_tolerance: Largest allowed relative area difference per part
+
+    Returns:
+        One primitive per connected part, or None if the mesh is not a good fit
+    """
+    mesh = obj.data
+    vertex_count, poly_count = len(mesh.vertices), len(mesh.polygons)
+    if vertex_count == 0 or poly_count == 0:
+        return None
+
+    snapshot = get_snapshot(mesh)
+    positions = snapshot.positions.astype(np.float64)
+    edges = np.empty(len(mesh.edges) * 2, dtype=np.int64)
+    mesh.edges.foreach_get("vertices", edges)
+
+    labels = split_clusters(vertex_count, edges.reshape(-1, 2))
+    clusters = np.unique(labels)
+    if len(clusters) > max_primitives:
+        return None
+
+    # Area of each part, from the first vertex of each face
+    areas = np.empty(poly_count, dtype=np.float64)
+    mesh.polygons.foreach_get("area", areas)
+    face_labels = labels[snapshot.loop_vertices[snapshot.loop_starts]]
+
+    fits = []
+    for label in clusters:
+        points = positions[labels == label]
+        area = float(areas[face_labels == label].sum())
+        if len(points) < 4 or area <= 0.0:
+            # Loose vertices or edges carry no collision
+            continue
+        fit = fit_primitive(points, area, tolerance, area_tolerance)
+        if fit is None:
+            return None
+        fits.append(fit)
+    return fits or None
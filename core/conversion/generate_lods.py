@@ -0,0 +1,147 @@
+import bpy
+from typing import Dict, Iterable, Optional
+from mathutils import Vector
+from ... import constants
+from ...sollumz_integration import SollumzIntegration
+from ..mesh_prep.apply_modifier import evaluate_modifier
+from .prop_digest import compute_mesh_digest
+
+# Custom property tagging generated LOD meshes with their cache key
+LOD_KEY_PROPERTY = "propconverter_lod_key"
+
+# Generated LOD meshes by '<source digest>:<level>:<ratio>'. The meshes live in
+# the .blend, so the cache lasts for the session and the open file: the command
+# line reloads an empty file per model, which leaves nothing to reuse
+_LOD_MESHES: Dict[str, str] = {}
+
+
+def bounding_radius(objects: Iterable[bpy.types.Object]) -> float:
+    """Radius of a bounding sphere of objects, from their world-space bounding boxes."""
+    corners = [obj.matrix_world @ Vector(corner) for obj in objects for corner in obj.bound_box]
+    if not corners:
+        return 0.0
+    low = Vector(tuple(min(c[i] for c in corners) for i in range(3)))
+    high = Vector(tuple(max(c[i] for c in corners) for i in range(3)))
+    center = (low + high) / 2.0
+    return max((corner - center).length for corner in corners)
+
+
+def lod_distances(radius: float) -> Dict[str, float]:
+    """LOD switch distances for an object with a bounding sphere radius.
+
+    Returns:
+        Mapping of LOD level ('HIGH', 'MEDIUM', 'LOW', 'VERYLOW') to the
+        distance up to which that level is drawn
+    """
+    return {
+        level: round(constants.LOD_DISTANCE_MIN + radius * factor, 2)
+        for level, factor in constants.LOD_DISTANCE_FACTORS.items()
+    }
+
+
+def _build_lod_mesh(context, model_obj: bpy.types.Object, ratio: float, name: str) -> bpy.types.Mesh:
+    """Decimate the model mesh toward a triangle ratio into a new mesh datablock."""
+    modifier = model_obj.modifiers.new(name="LOD", type='DECIMATE')
+    modifier.decimate_type = 'COLLAPSE'
+    modifier.ratio = ratio
+    bm = evaluate_modifier(context, model_obj, modifier)
+    try:
+        mesh = bpy.data.meshes.new(name)
+        bm.to_mesh(mesh)
+    finally:
+        bm.free()
+    return mesh
+
+
+def _cached_lod(key: str) -> Optional[bpy.types.Mesh]:
+    """Return the generated LOD mesh of a key if it still exists."""
+    mesh = bpy.data.meshes.get(_LOD_MESHES.get(key, ""))
+    if mesh is not None and mesh.get(LOD_KEY_PROPERTY) == key:
+        return mesh
+    return None
+
+
+def generate_lods(context, model_obj: bpy.types.Object, ratios: Dict[str, float]) -> Dict[str, bpy.types.Mesh]:
+    """Build the lower LOD meshes of a drawable model.
+
+    Each LOD is generated once for a given model mesh content and ratio;
+    later conversions of the same mesh in the same session and .blend get a
+    copy of the cached LOD instead of decimating again (the command line
+    starts a new .blend per model, so its models share nothing). The LOD
+    meshes use the materials of the model.
+
+    Args:
+        context: Blender context
+        model_obj: Drawable model whose mesh is the High LOD
+        ratios: Mapping of LOD level ('MEDIUM', 'LOW', 'VERYLOW') to the
+            ratio of triangles kept from the High LOD
+
+    Returns:
+        Mapping of LOD level to its mesh
+    """
+    source_digest = compute_mesh_digest(model_obj.data)
+    lods = {}
+    for level, ratio in ratios.items():
+        key = f"{source_digest}:{level}:{ratio:.4f}"
+        cached = _cached_lod(key)
+        if cached is not None:
+            mesh = cached.copy()
+            print(f"[LOD] Reusing cached {level} LOD for {model_obj.name}")
+        else:
+            mesh = _build_lod_mesh(context, model_obj, ratio, f"{model_obj.name}.{level.lower()}")
+            mesh[LOD_KEY_PROPERTY] = key
+            _LOD_MESHES[key] = mesh.name
+            print(f"[LOD] Generated {level} LOD for {model_obj.name}: {len(mesh.polygons)} faces")
+
+        mesh.materials.clear()
+        for material in model_obj.data.materials:
+            mesh.materials.append(material)
+        lods[level] = mesh
+    return lods
+
+
+def attach_lods(
+    context,
+    model_objs: Iterable[bpy.types.Object],
+    drawable_parent: Optional[bpy.types.Object],
+    ratios: Dict[str, float]
+) -> Optional[float]:
+    """Generate the LODs of every drawable model and set the LOD distances.
+
+    Models get their Medium, Low and Very Low meshes in their Sollumz LOD
+    slots, and the drawable gets LOD distances derived from its bounding
+    sphere.
+
+    Args:
+        context: Blender context
+        model_objs: Drawable model objects
+        drawable_parent: The Drawable object (None if no parent was created)
+        ratios: Mapping of LOD level to triangle ratio, see generate_lods
+
+    Returns:
+        The distance up to which the lowest LOD is drawn (the archetype LOD
+        distance), or None if Sollumz has no LOD slots
+    """
+    sollumz_props = SollumzIntegration.get_instance().get_sollumz_properties()
+    LODLevel = getattr(sollumz_props, "LODLevel", None) if sollumz_props else None
+    if LODLevel is None:
+        print("[LOD] Sollumz LOD levels not found, skipping LOD generation")
+        return None
+
+    model_objs = list(model_objs)
+    for model_obj in model_objs:
+        lod_slots = getattr(model_obj, "sz_lods", None)
+        if lod_slots is None:
+            print(f"[LOD] {model_obj.name} has no LOD slots, skipping")
+            continue
+        for level, mesh in generate_lods(context, model_obj, ratios).items():
+            lod_slots.get_lod(getattr(LODLevel, level)).mesh = mesh
+
+    distances = lod_distances(bounding_radius(model_objs))
+    drawable_props = getattr(drawable_parent, "drawable_properties", None) if drawable_parent else None
+    if drawable_props is not None:
+        drawable_props.lod_dist_high = distances['HIGH']
+        drawable_props.lod_dist_med = distances['MEDIUM']
+        drawable_props.lod_dist_low = distances['LOW']
+        drawable_props.lod_dist_vlow = distances['VERYLOW']
+    return distances['VERYLOW']
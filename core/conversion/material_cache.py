@@ -0,0 +1,161 @@
+import bpy
+import hashlib
+import json
+from typing import Dict, List, Optional
+from ...sollumz_integration import SollumzIntegration
+
+# Custom property tagging converted materials with their cache key
+MATERIAL_KEY_PROPERTY = "propconverter_material_key"
+
+# Converted Sollumz material name by cache key, for the session
+_CONVERTED: Dict[str, str] = {}
+
+
+def _value(value):
+    """JSON-friendly, rounded form of a socket or node value."""
+    if isinstance(value, float):
+        return round(value, 6)
+    if isinstance(value, (bool, int, str)) or value is None:
+        return value
+    try:
+        return [_value(v) for v in value]
+    except TypeError:
+        return str(value)
+
+
+def material_structure(material: bpy.types.Material) -> Dict:
+    """Describe what a material converts from: node types, images, values and links.
+
+    Names of the material and its datablocks are left out, so two copies
+    of the same material have the same structure.
+    """
+    structure = {"color": _value(material.diffuse_color), "nodes": [], "links": []}
+    tree = material.node_tree if material.use_nodes else None
+    if tree is None:
+        return structure
+
+    for node in sorted(tree.nodes, key=lambda n: n.name):
+        entry = {"name": node.name, "type": node.bl_idname}
+        image = getattr(node, "image", None)
+        if image is not None:
+            entry["image"] = bpy.path.abspath(image.filepath, library=image.library) if image.filepath else image.name
+        entry["inputs"] = [
+            [socket.identifier, _value(socket.default_value)]
+            for socket in node.inputs
+            if not socket.is_linked and hasattr(socket, "default_value")
+        ]
+        structure["nodes"].append(entry)
+    structure["links"] = sorted(
+        [link.from_node.name, link.from_socket.identifier, link.to_node.name, link.to_socket.identifier]
+        for link in tree.links
+    )
+    return structure
+
+
+def material_key(material: bpy.types.Material, shader: str, texture_name: Optional[str] = None) -> str:
+    """Cache key of a material converted to a shader (and named textures, if any)."""
+    payload = {"material": material_structure(material), "shader": shader, "textures": texture_name}
+    return hashlib.sha256(json.dumps(payload, sort_keys=True).encode("utf-8")).hexdigest()
+
+
+def _cached(key: str) -> Optional[bpy.types.Material]:
+    """Return the converted material of a key if it still exists."""
+    material = bpy.data.materials.get(_CONVERTED.get(key, ""))
+    if material is not None and material.get(MATERIAL_KEY_PROPERTY) == key:
+        return material
+    return None
+
+
+def _convert_on_proxy(context, template: bpy.types.Object, materials: List[bpy.types.Material]) -> List[bpy.types.Material]:
+    """Convert materials with the Sollumz operator on a throwaway copy of a model.
+
+    Returns:
+        The material of every slot after conversion, in the order of materials
+    """
+    proxy_mesh = bpy.data.meshes.new("propconverter_material_proxy")
+    for material in materials:
+        proxy_mesh.materials.append(material)
+    proxy = template.copy()
+    proxy.data = proxy_mesh
+    for collection in template.users_collection or [context.collection]:
+        collection.objects.link(proxy)
+    try:
+        SollumzIntegration.get_instance().run_operator(context, "convertallmaterialstoselected", [proxy])
+        return list(proxy_mesh.materials)
+    finally:
+        bpy.data.objects.remove(proxy)
+        bpy.data.meshes.remove(proxy_mesh)
+
+
+def _convert(context, template: bpy.types.Object, materials: List[bpy.types.Material], shader: str) -> List[bpy.types.Material]:
+    """Convert materials to a shader, directly through Sollumz when possible.
+
+    A failing direct call raises, it is not retried with the operator.
+    """
+    sollumz = SollumzIntegration.get_instance()
+    results = []
+    for material in materials:
+        called, result = sollumz.call_direct("convert_material", material, shader)
+        if not called:
+            # No direct call: everything goes through the operator
+            return _convert_on_proxy(context, template, materials)
+        results.append(result)
+    return results
+
+
+def convert_materials_cached(
+    context,
+    model_objs: List[bpy.types.Object],
+    shader: str,
+    texture_name: Optional[str] = None
+) -> bool:
+    """Convert the materials of model objects, reusing earlier conversions.
+
+    Every distinct source material is converted once per shader for the
+    session: later slots and props using an identical material (same
+    structure, see material_structure) get the converted Sollumz material
+    directly. With auto texturing, the texture name of the material
+    ('<texture_name><index>', see set_textures_from_original_name) is part
+    of the key, since it ends up in the converted material.
+
+    Args:
+        context: Blender context
+        model_objs: Drawable model objects
+        shader: Target shader filename
+        texture_name: Base texture name when auto texturing, None otherwise
+
+    Returns:
+        True if every material was converted
+    """
+    sources: List[bpy.types.Material] = []
+    for obj in model_objs:
+        for slot in obj.material_slots:
+            if slot.material is not None and slot.material not in sources:
+                sources.append(slot.material)
+    if not sources:
+        return True
+
+    keys = {}
+    for index, material in enumerate(sources):
+        textures = f"{texture_name}{index}" if texture_name else None
+        keys[material.name] = material_key(material, shader, textures)
+
+    converted = {name: _cached(key) for name, key in keys.items()}
+    missing = [material for material in sources if converted[material.name] is None]
+    if missing:
+        results = _convert(context, model_objs[0], missing, shader)
+        for source, result in zip(missing, results):
+            if result is None or result == source:
+                print(f"[MATERIAL] Sollumz did not convert {source.name}")
+                return False
+            key = keys[source.name]
+            result[MATERIAL_KEY_PROPERTY] = key
+            _CONVERTED[key] = result.name
+            converted[source.name] = result
+    print(f"[MATERIAL] Converted {len(missing)} material(s), reused {len(sources) - len(missing)}")
+
+    for obj in model_objs:
+        for slot in obj.material_slots:
+            if slot.material is not None:
+                slot.material = converted[slot.material.name]
+    return True
@@ -0,0 +1,77 @@
+import os
+import xml.etree.ElementTree as ET
+from typing import List
+
+
+def merge_ytyp_files(ytyp_files: List[str], output_dir: str, name: str, max_archetypes: int = 0) -> List[str]:
+    """Merge the archetypes of several CodeWalker XML YTYPs into new YTYP files.
+
+    The first file is used as template for the merged document. Archetypes
+    with a name already seen are skipped, so a prop converted twice only
+    appears once.
+
+    Args:
+        ytyp_files: Paths to the .ytyp.xml files to merge
+        output_dir: Directory receiving the merged YTYPs
+        name: Name of the merged YTYP
+        max_archetypes: Maximum archetypes per YTYP; when exceeded the result
+            is split into name_0, name_1, ... (0 for no limit)
+
+    Returns:
+        Paths of the written .ytyp.xml files
+    """
+    archetypes = []
+    seen = set()
+    template = None
+    for path in ytyp_files:
+        try:
+            root = ET.parse(path).getroot()
+        except (ET.ParseError, OSError) as e:
+            print(f"[WARNING] Skipping unreadable YTYP {path} - {e}")
+            continue
+        if template is None:
+            template = root
+        container = root.find("archetypes")
+        if container is None:
+            continue
+        for item in container.findall("Item"):
+            archetype_name = (item.findtext("name") or "").lower()
+            if archetype_name in seen:
+                continue
+            seen.add(archetype_name)
+            archetypes.append(item)
+
+    if template is None or not archetypes:
+        print("[WARNING] No archetypes found to merge")
+        return []
+
+    if max_archetypes and max_archetypes > 0:
+        groups = [archetypes[i:i + max_archetypes] for i in range(0, len(archetypes), max_archetypes)]
+    else:
+        groups = [archetypes]
+
+    os.makedirs(output_dir, exist_ok=True)
+    written = []
+    for index, group in enumerate(groups):
+        ytyp_name = name if len(groups) == 1 else f"{name}_{index}"
+
+        container = template.find("archetypes")
+        if container is None:
+            container = ET.SubElement(template, "archetypes")
+        for item in list(container):
+            container.remove(item)
+        container.extend(group)
+
+        name_elem = template.find("name")
+        if name_elem is None:
+            name_elem = ET.SubElement(template, "name")
+        name_elem.text = ytyp_name
+
+        path = os.path.join(output_dir, f"{ytyp_name}.ytyp.xml")
+        tree = ET.ElementTree(template)
+        ET.indent(tree)
+        tree.write(path, encoding="UTF-8", xml_declaration=True)
+        written.append(path)
+        print(f"[MERGE] Wrote {len(group)} archetypes to {path}")
+
+    return written
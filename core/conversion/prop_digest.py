@@ -0,0 +1,85 @@
+import bpy
+import hashlib
+import json
+from array import array
+from ..mesh_prep.mesh_snapshot import get_snapshot
+from ...conversion_settings import ConversionSettings
+
+# Bump when the digest inputs change so old manifests are invalidated
+DIGEST_VERSION = b"propconverter-digest-2"
+
+# Settings that do not change the converted prop: worker counts, validation,
+# and the shader request, which is hashed as the resolved shader instead
+_DIGEST_IGNORED_SETTINGS = ("ao_workers", "convex_workers", "strict_validation", "shader_index", "shader_name")
+
+
+def _hash_collection(h, collection, attr: str, typecode: str, size: int) -> None:
+    """Feed a bulk foreach_get of a mesh collection attribute into the hash."""
+    data = array(typecode, [0]) * (len(collection) * size)
+    if len(data):
+        collection.foreach_get(attr, data)
+    h.update(len(data).to_bytes(8, "little"))
+    h.update(data.tobytes())
+
+
+def _hash_array(h, data) -> None:
+    """Feed a snapshot array into the hash, in the layout of _hash_collection."""
+    h.update(data.size.to_bytes(8, "little"))
+    h.update(data.tobytes())
+
+
+def _hash_mesh(h, mesh: bpy.types.Mesh) -> None:
+    """Feed the positions, topology, material indices and UV maps of a mesh into the hash."""
+    snapshot = get_snapshot(mesh)
+    _hash_array(h, snapshot.positions)
+    _hash_array(h, snapshot.loop_vertices)
+    _hash_array(h, snapshot.loop_starts)
+    _hash_array(h, snapshot.material_index)
+    for uv_layer in mesh.uv_layers:
+        h.update(uv_layer.name.encode("utf-8"))
+        _hash_collection(h, uv_layer.data, "uv", 'f', 2)
+
+
+def compute_mesh_digest(mesh: bpy.types.Mesh) -> str:
+    """Compute a stable digest of the content of a mesh datablock.
+
+    Covers the same geometry as compute_prop_digest plus the color
+    attributes, but no object or settings state.
+    """
+    h = hashlib.sha256(DIGEST_VERSION)
+    _hash_mesh(h, mesh)
+    for attr in mesh.color_attributes:
+        h.update(f"{attr.name}:{attr.domain}".encode("utf-8"))
+        _hash_collection(h, attr.data, "color", 'f', 4)
+    return h.hexdigest()
+
+
+def compute_prop_digest(obj: bpy.types.Object, settings: ConversionSettings, shader: str = "") -> str:
+    """Compute a stable digest of a source mesh and its conversion settings.
+
+    The digest covers vertex positions, topology, material indices, UV maps,
+    material slot names, object scale, the resolved shader and every
+    conversion setting that changes the output (vertex color,
+    decimate/remesh, collision material and collision flags). Worker counts
+    and validation settings are left out. It is independent of the session
+    and of object names.
+
+    Args:
+        obj: Source mesh object
+        settings: Conversion settings
+        shader: Filename of the resolved shader
+    """
+    mesh = obj.data
+    h = hashlib.sha256(DIGEST_VERSION)
+
+    _hash_mesh(h, mesh)
+
+    slot_names = [slot.material.name if slot.material else "" for slot in obj.material_slots]
+    h.update(json.dumps(slot_names).encode("utf-8"))
+    h.update(repr(tuple(round(v, 6) for v in obj.scale)).encode("utf-8"))
+    data = settings.to_dict()
+    for name in _DIGEST_IGNORED_SETTINGS:
+        data.pop(name, None)
+    data["shader"] = shader
+    h.update(json.dumps(data, sort_keys=True).encode("utf-8"))
+    return h.hexdigest()
@@ -1,11 +1,14 @@
 import bpy
 import re
 from ... import constants
+from .texture_registry import TextureRegistry
 
 
 def set_textures_from_original_name(context, model_objs, original_name: str) -> bool:
     """
     Assign per-material external texture paths using the original mesh name with an index.
+    Images come from the texture registry, so a texture file referenced by
+    several materials or props has a single image datablock.
     """
     try:
         if not model_objs or not original_name:
@@ -25,6 +28,7 @@ def set_textures_from_original_name(context, model_objs, original_name: str) ->
                     seen.add(id(mat))
 
         # Assign numbered texture paths per unique material
+        registry = TextureRegistry.get_instance()
         for idx, mat in enumerate(unique_mats):
             # Ensure material has a node tree
             if not hasattr(mat, "node_tree") or mat.node_tree is None:
@@ -40,11 +44,7 @@ def set_textures_from_original_name(context, model_objs, original_name: str) ->
                     label = re.sub(r"_sampler$", "", label)
                     texture_relpath = f"//{base_name}_{label}{constants.TEXTURE_EXTENSION}"
                     # Force external file reference
-                    if n.image is None:
-                        # Create a minimal image datablock so we can set a filepath
-                        n.image = bpy.data.images.new(name=f"{base_name}_{label}", width=1, height=1)
-                    n.image.source = "FILE"
-                    n.image.filepath = texture_relpath
+                    n.image = registry.get_image(texture_relpath, f"{base_name}_{label}")
         return True
     except Exception as e:
         print(f"ERROR: set_textures_from_original_name failed: {e}")
@@ -0,0 +1,175 @@
+import bpy
+import numpy as np
+from typing import List
+from ... import constants
+from ...sollumz_integration import SollumzIntegration
+from ..mesh_prep.extract_faces import extract_faces
+from ..mesh_prep.mesh_snapshot import get_snapshot, invalidate_snapshot
+
+# Decimals kept when comparing corner normals
+_NORMAL_DECIMALS = 4
+
+
+def _corner_keys(mesh: bpy.types.Mesh, loop_vertices: np.ndarray) -> np.ndarray:
+    """Id of the exported vertex of every corner.
+
+    Corners sharing a vertex, its UVs and its normal end up as one vertex of
+    the exported geometry; anything else splits the vertex.
+    """
+    loop_count = len(mesh.loops)
+    columns = [loop_vertices.reshape(-1, 1).astype(np.float64)]
+    for uv_layer in mesh.uv_layers:
+        uvs = np.empty(loop_count * 2, dtype=np.float32)
+        uv_layer.data.foreach_get("uv", uvs)
+        columns.append(uvs.reshape(-1, 2))
+    normals = np.empty(loop_count * 3, dtype=np.float32)
+    mesh.loops.foreach_get("normal", normals)
+    columns.append(np.round(normals.reshape(-1, 3), _NORMAL_DECIMALS))
+    _, keys = np.unique(np.hstack(columns), axis=0, return_inverse=True)
+    return keys.reshape(-1)
+
+
+def _partition_faces(
+    faces: np.ndarray,
+    centers: np.ndarray,
+    loop_faces: np.ndarray,
+    keys: np.ndarray,
+    max_vertices: int
+) -> List[np.ndarray]:
+    """Bisect a set of faces at the median of its longest axis until every part fits."""
+    mask = np.zeros(len(centers), dtype=bool)
+    parts, stack = [], [faces]
+    while stack:
+        part = stack.pop()
+        mask[part] = True
+        vertices = np.unique(keys[mask[loop_faces]]).size
+        mask[part] = False
+        if vertices <= max_vertices or len(part) <= 1:
+            parts.append(part)
+            continue
+        part_centers = centers[part]
+        axis = int(np.argmax(np.ptp(part_centers, axis=0)))
+        order = np.argsort(part_centers[:, axis], kind='stable')
+        half = len(part) // 2
+        stack.append(part[order[half:]])
+        stack.append(part[order[:half]])
+    return parts
+
+
+def _reset_lod_slots(obj: bpy.types.Object) -> None:
+    """Point the High LOD slot of a split model at its new mesh and clear the others.
+
+    The slots are copied along with the model object and still hold the
+    unsplit mesh, which would be exported as the High LOD and kept alive.
+    """
+    lod_slots = getattr(obj, "sz_lods", None)
+    sollumz_props = SollumzIntegration.get_instance().get_sollumz_properties()
+    LODLevel = getattr(sollumz_props, "LODLevel", None) if sollumz_props else None
+    if lod_slots is None or LODLevel is None:
+        return
+    for level in ("VERYHIGH", "HIGH", "MEDIUM", "LOW", "VERYLOW"):
+        lod_level = getattr(LODLevel, level, None)
+        lod = lod_slots.get_lod(lod_level) if lod_level is not None else None
+        if lod is not None:
+            lod.mesh = obj.data if level == "HIGH" else None
+
+
+def split_model(obj: bpy.types.Object, max_vertices: int = constants.MAX_GEOMETRY_VERTICES) -> List[bpy.types.Object]:
+    """Split a drawable model whose geometries exceed the vertex limit.
+
+    Every material of a model is exported as its own geometry, so faces are
+    grouped by material first; a material over the limit is then bisected
+    spatially until each part fits. The first part of every material stays
+    in the model, the others go to copies of the model object (same parent,
+    Sollumz type and materials) named '<model>_<n>'. Every resulting model
+    has its new mesh as High LOD and no lower LODs, which are generated
+    after the split.
+
+    Args:
+        obj: Drawable model object
+        max_vertices: Largest number of exported vertices per geometry
+
+    Returns:
+        The model followed by the new model objects ([obj] if nothing was split)
+    """
+    mesh = obj.data
+    poly_count = len(mesh.polygons)
+    if poly_count == 0 or len(mesh.loops) <= max_vertices:
+        return [obj]
+
+    snapshot = get_snapshot(mesh)
+    material_index = snapshot.material_index.astype(np.int64)
+    loop_faces = snapshot.loop_faces
+    keys = _corner_keys(mesh, snapshot.loop_vertices)
+
+    # Exported vertices per material: distinct (material, corner key) pairs
+    stride = int(keys.max()) + 1
+    pairs = np.unique(material_index[loop_faces] * stride + keys)
+    materials, counts = np.unique(pairs // stride, return_counts=True)
+    oversized = materials[counts > max_vertices]
+    if len(oversized) == 0:
+        return [obj]
+
+    centers = np.empty(poly_count * 3, dtype=np.float32)
+    mesh.polygons.foreach_get("center", centers)
+    centers = centers.reshape(-1, 3)
+
+    # Part 0 stays in the model; extra parts of each material get new labels
+    face_parts = np.zeros(poly_count, dtype=np.int64)
+    part_count = 1
+    for material in oversized:
+        faces = np.flatnonzero(material_index == material)
+        for part in _partition_faces(faces, centers, loop_faces, keys, max_vertices)[1:]:
+            face_parts[part] = part_count
+            part_count += 1
+
+    name = obj.name
+    print(f"[SPLIT] Splitting {name} into {part_count} models "
+          f"({len(oversized)} material(s) over {max_vertices} vertices)")
+
+    order = np.argsort(face_parts, kind='stable')
+    bounds = np.searchsorted(face_parts[order], np.arange(part_count + 1))
+    models = [obj]
+    collections = list(obj.users_collection)
+    for part_index in range(1, part_count):
+        part = obj.copy()
+        part.name = f"{name}_{part_index}"
+        part.data = extract_faces(mesh, order[bounds[part_index]:bounds[part_index + 1]], part.name)
+        _reset_lod_slots(part)
+        for collection in collections:
+            collection.objects.link(part)
+        models.append(part)
+
+    mesh_name = mesh.name
+    obj.data = extract_faces(mesh, order[bounds[0]:bounds[1]], mesh_name)
+    _reset_lod_slots(obj)
+    invalidate_snapshot(mesh)
+    if mesh.users == 0:
+        bpy.data.meshes.remove(mesh)
+        obj.data.name = mesh_name
+    return models
+
+
+def split_oversized_models(
+    model_objs: List[bpy.types.Object],
+    max_vertices: int = constants.MAX_GEOMETRY_VERTICES
+) -> List[bpy.types.Object]:
+    """Split every drawable model exceeding the per-geometry vertex limit.
+
+    Args:
+        model_objs: Drawable model objects
+        max_vertices: Largest number of exported vertices per geometry
+
+    Returns:
+        The model objects, including the ones created by the split
+    """
+    models = []
+    for obj in model_objs:
+        try:
+            models.extend(split_model(obj, max_vertices))
+        except Exception as e:
+            print(f"[ERROR] Failed to split model {obj.name} - {e}")
+            import traceback
+            traceback.print_exc()
+            models.append(obj)
+    return models
@@ -0,0 +1,161 @@
+import bpy
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterable, List, Optional
+from ... import constants
+
+
+def resolve_texture_path(
+    filepath: str,
+    library: Optional[bpy.types.Library] = None,
+    base_directory: str = ""
+) -> str:
+    """Absolute, normalized form of a texture filepath.
+
+    '//' paths are relative to the .blend. While the .blend was never saved
+    (headless conversions) they are relative to base_directory instead,
+    since Blender would resolve them against the current directory.
+    """
+    if filepath.startswith("//") and base_directory and library is None and not bpy.data.filepath:
+        path = os.path.join(base_directory, filepath[2:])
+    else:
+        path = bpy.path.abspath(filepath, library=library)
+    return os.path.normcase(os.path.abspath(path))
+
+
+def _image_path(image: bpy.types.Image, base_directory: str = "") -> Optional[str]:
+    """Resolved file path of an image read from disk, or None."""
+    if image.source != "FILE" or not image.filepath:
+        return None
+    return resolve_texture_path(image.filepath, image.library, base_directory)
+
+
+class TextureRegistry:
+    """External texture images shared across materials and props.
+
+    Images are keyed by resolved absolute path: every texture node pointing
+    to the same file gets the same image datablock instead of a new one.
+    Images already in the .blend are found by their path as well. Files are
+    checked in bulk before export, see missing_textures.
+
+    Texture paths are relative to the .blend ('//'). While it is unsaved
+    they are resolved against base_directory, which the command line sets
+    to the directory of the source model; without it, missing_textures
+    falls back to the directory it is given (the export directory).
+
+    Example:
+        >>> registry = TextureRegistry.get_instance()
+        >>> image = registry.get_image("//prop0_diffuse.dds", "prop0_diffuse")
+        >>> missing = registry.missing_textures(context.selected_objects)
+    """
+
+    _instance: Optional['TextureRegistry'] = None
+
+    def __init__(self):
+        self._images: Dict[str, str] = {}
+        self._scanned = False
+        self.base_directory = ""
+
+    @classmethod
+    def get_instance(cls) -> 'TextureRegistry':
+        """Return the registry shared by the session."""
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
+    def reset(self, base_directory: str = "") -> None:
+        """Forget the registered images (they are found again by their path).
+
+        Args:
+            base_directory: Directory of '//' paths while the .blend is unsaved
+        """
+        self._images.clear()
+        self._scanned = False
+        self.base_directory = base_directory
+
+    def _scan(self) -> None:
+        """Index the file images already in the .blend, once."""
+        self._scanned = True
+        for image in bpy.data.images:
+            path = _image_path(image, self.base_directory)
+            if path is not None:
+                self._images.setdefault(path, image.name)
+
+    def get_image(self, filepath: str, name: str) -> bpy.types.Image:
+        """Return the image of a texture file, creating it if needed.
+
+        The image is only a reference to the file: it is not loaded, and
+        the file does not have to exist yet.
+
+        Args:
+            filepath: Texture filepath, as stored in the image (e.g. '//prop0_diffuse.dds')
+            name: Name of the image if it has to be created
+        """
+        if not self._scanned:
+            self._scan()
+        path = resolve_texture_path(filepath, base_directory=self.base_directory)
+        image = bpy.data.images.get(self._images.get(path, ""))
+        if image is not None and _image_path(image, self.base_directory) == path:
+            return image
+
+        # A 1x1 placeholder switched to the file, so nothing is read from disk
+        image = bpy.data.images.new(name=name, width=1, height=1)
+        image.source = "FILE"
+        image.filepath = filepath
+        self._images[path] = image.name
+        return image
+
+    @staticmethod
+    def check_files(paths: Iterable[str]) -> Dict[str, bool]:
+        """Check whether files exist, in parallel (network drives answer slowly).
+
+        Returns:
+            Mapping of every path to True if the file exists
+        """
+        paths = list(dict.fromkeys(paths))
+        if not paths:
+            return {}
+        workers = min(constants.TEXTURE_CHECK_WORKERS, len(paths))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return dict(zip(paths, executor.map(os.path.isfile, paths)))
+
+    def missing_textures(self, objects: Iterable[bpy.types.Object], base_directory: str = "") -> Dict[str, List[str]]:
+        """List the texture files missing on disk, per prop.
+
+        The images of every material of the objects and of their children
+        (the models of a drawable) are checked with a single check_files call.
+
+        Args:
+            objects: Props to check, usually the drawables about to be exported
+            base_directory: Directory of '//' paths while the .blend is unsaved,
+                when the registry has none
+
+        Returns:
+            Mapping of prop name to its missing texture paths (props without
+            missing textures are left out)
+        """
+        base_directory = self.base_directory or base_directory
+        textures: Dict[str, List[str]] = {}
+        for obj in objects:
+            paths = []
+            for child in [obj, *obj.children_recursive]:
+                for slot in getattr(child, "material_slots", []):
+                    tree = slot.material.node_tree if slot.material else None
+                    if tree is None:
+                        continue
+                    for node in tree.nodes:
+                        image = getattr(node, "image", None)
+                        if image is None or image.packed_file is not None:
+                            continue
+                        path = _image_path(image, base_directory)
+                        if path is not None and path not in paths:
+                            paths.append(path)
+            textures[obj.name] = paths
+
+        exists = self.check_files(path for paths in textures.values() for path in paths)
+        missing = {}
+        for name, paths in textures.items():
+            absent = [path for path in paths if not exists[path]]
+            if absent:
+                missing[name] = absent
+        return missing
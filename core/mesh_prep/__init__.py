@@ -4,6 +4,14 @@ from .rename_uv_maps import rename_uv_maps_sequential
 from .clear_uv_maps import clear_uv_maps
 from .apply_decimate import apply_decimate
 from .apply_remesh import apply_remesh
+from .apply_modifier import apply_modifier, evaluate_modifier
+from .collision_budget import apply_collision_budget, CollisionBudgetSearch
+from .bake_ambient_occlusion import bake_ambient_occlusion
+from .extract_faces import extract_faces
+from .divide_mesh import divide_mesh
+from .weld_vertices import weld_vertices
+from .collision_mesh import build_collision_mesh
+from .mesh_snapshot import MeshSnapshot, get_snapshot, invalidate_snapshot, clear_snapshots
 
 __all__ = [
     'duplicate_and_prepare_mesh',
@@ -11,4 +19,17 @@ __all__ = [
     'clear_uv_maps',
     'apply_decimate',
     'apply_remesh',
+    'apply_modifier',
+    'evaluate_modifier',
+    'apply_collision_budget',
+    'CollisionBudgetSearch',
+    'bake_ambient_occlusion',
+    'extract_faces',
+    'divide_mesh',
+    'weld_vertices',
+    'build_collision_mesh',
+    'MeshSnapshot',
+    'get_snapshot',
+    'invalidate_snapshot',
+    'clear_snapshots',
 ]
@@ -1,4 +1,5 @@
 import bpy
+from .apply_modifier import apply_modifier
 
 
 def apply_decimate(context, obj: bpy.types.Object, decimate_type: str, ratio: float = 0.5, iterations: int = 1, use_dissolve: bool = False, planar_angle: float = 80.0) -> bool:
@@ -21,15 +22,8 @@ def apply_decimate(context, obj: bpy.types.Object, decimate_type: str, ratio: fl
         elif decimate_type == 'PLANAR':
             decimate_mod.angle_limit = planar_angle
         
-        # Apply the modifier
-        bpy.ops.object.select_all(action='DESELECT')
-        obj.select_set(True)
-        context.view_layer.objects.active = obj
-        
-        # Apply modifier using Blender operator
-        bpy.ops.object.modifier_apply(modifier=decimate_mod.name)
-        
-        return True
+        # Apply the modifier through the depsgraph, without touching the selection
+        return apply_modifier(context, obj, decimate_mod)
         
     except Exception as e:
         print(f"[ERROR] Failed to apply decimate modifier - {e}")
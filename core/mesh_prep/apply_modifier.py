@@ -0,0 +1,66 @@
+import bpy
+import bmesh
+from .mesh_snapshot import invalidate_snapshot
+
+
+def evaluate_modifier(context, obj: bpy.types.Object, modifier: bpy.types.Modifier) -> bmesh.types.BMesh:
+    """Evaluate a modifier alone on the mesh of an object, then remove it.
+
+    The object is evaluated through the depsgraph with only this modifier
+    enabled, like modifier_apply on the base mesh. Selection, active object
+    and the other modifiers are left untouched.
+
+    Args:
+        context: Blender context
+        obj: Mesh object owning the modifier
+        modifier: Modifier to evaluate (removed from obj afterwards)
+
+    Returns:
+        A new bmesh holding the evaluated mesh, to be freed by the caller
+    """
+    others = [m for m in obj.modifiers if m != modifier and m.show_viewport]
+    for other in others:
+        other.show_viewport = False
+    modifier.show_viewport = True
+
+    bm = bmesh.new()
+    try:
+        depsgraph = context.evaluated_depsgraph_get()
+        bm.from_object(obj, depsgraph)
+        return bm
+    except Exception:
+        bm.free()
+        raise
+    finally:
+        for other in others:
+            other.show_viewport = True
+        obj.modifiers.remove(modifier)
+
+
+def apply_modifier(context, obj: bpy.types.Object, modifier: bpy.types.Modifier) -> bool:
+    """Apply a modifier to the mesh of an object without going through operators.
+
+    The evaluated mesh (see evaluate_modifier) is written back into obj.data
+    and the modifier is removed.
+
+    Args:
+        context: Blender context
+        obj: Mesh object owning the modifier
+        modifier: Modifier to apply
+
+    Returns:
+        True if the modifier was applied, False otherwise
+    """
+    modifier_type = modifier.type
+    try:
+        bm = evaluate_modifier(context, obj, modifier)
+    except Exception as e:
+        print(f"[ERROR] Failed to apply {modifier_type} modifier on {obj.name} - {e}")
+        return False
+    try:
+        bm.to_mesh(obj.data)
+        obj.data.update()
+        invalidate_snapshot(obj.data)
+        return True
+    finally:
+        bm.free()
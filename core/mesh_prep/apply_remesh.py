@@ -1,4 +1,5 @@
 import bpy
+from .apply_modifier import apply_modifier
 
 
 def apply_remesh(context, obj: bpy.types.Object, mode: str, use_smooth_shade: bool = True, threshold: float = 0.1, voxel_size: float = 0.1, adaptivity: float = 0.0) -> bool:
@@ -27,15 +28,8 @@ def apply_remesh(context, obj: bpy.types.Object, mode: str, use_smooth_shade: bo
             remesh_mod.voxel_size = voxel_size
             remesh_mod.adaptivity = adaptivity
         
-        # Apply the modifier
-        bpy.ops.object.select_all(action='DESELECT')
-        obj.select_set(True)
-        context.view_layer.objects.active = obj
-        
-        # Apply modifier using Blender operator
-        bpy.ops.object.modifier_apply(modifier=remesh_mod.name)
-        
-        return True
+        # Apply the modifier through the depsgraph, without touching the selection
+        return apply_modifier(context, obj, remesh_mod)
         
     except Exception as e:
         print(f"[ERROR] Failed to apply remesh modifier - {e}")
@@ -0,0 +1,178 @@
+import bpy
+import math
+import multiprocessing
+import os
+import numpy as np
+from mathutils import Vector
+from mathutils.bvhtree import BVHTree
+from .paint_vertex_colors import ensure_color_attribute
+from .mesh_snapshot import get_snapshot
+
+# Read by _occlusion_chunk, and inherited by forked worker processes
+_STATE = {}
+
+_GOLDEN_ANGLE = math.pi * (3.0 - math.sqrt(5.0))
+
+
+def _hemisphere_samples(count: int) -> np.ndarray:
+    """Deterministic cosine-weighted hemisphere directions around +Z, shape (count, 3)."""
+    i = np.arange(count, dtype=np.float64)
+    u = (i + 0.5) / count
+    r = np.sqrt(u)
+    theta = i * _GOLDEN_ANGLE
+    return np.stack((r * np.cos(theta), r * np.sin(theta), np.sqrt(1.0 - u)), axis=1)
+
+
+def _tangent_frames(normals: np.ndarray):
+    """Return orthonormal tangent and bitangent arrays for unit normals (N, 3)."""
+    helper = np.zeros_like(normals)
+    use_x = np.abs(normals[:, 2]) > 0.999
+    helper[use_x, 0] = 1.0
+    helper[~use_x, 2] = 1.0
+    tangents = np.cross(helper, normals)
+    tangents /= np.linalg.norm(tangents, axis=1, keepdims=True)
+    bitangents = np.cross(normals, tangents)
+    return tangents, bitangents
+
+
+def _occlusion_chunk(bounds) -> np.ndarray:
+    """Ray cast the samples of a range of corners, returns the occluded fraction per corner.
+
+    mathutils has no batched ray cast: every sample is its own BVH query.
+    """
+    start, end = bounds
+    bvh = _STATE["bvh"]
+    origins = _STATE["origins"]
+    normals = _STATE["normals"]
+    tangents = _STATE["tangents"]
+    bitangents = _STATE["bitangents"]
+    samples = _STATE["samples"]
+    max_distance = _STATE["max_distance"]
+
+    result = np.zeros(end - start, dtype=np.float32)
+    for i in range(start, end):
+        # Directions in world space for this corner, shape (samples, 3)
+        directions = (samples[:, 0:1] * tangents[i] +
+                      samples[:, 1:2] * bitangents[i] +
+                      samples[:, 2:3] * normals[i])
+        origin = Vector(origins[i])
+        hits = 0
+        for direction in directions:
+            if bvh.ray_cast(origin, Vector(direction), max_distance)[0] is not None:
+                hits += 1
+        result[i - start] = hits / len(samples)
+    return result
+
+
+def bake_ambient_occlusion(
+    obj: bpy.types.Object,
+    samples: int = 32,
+    max_distance: float = 1.0,
+    strength: float = 1.0,
+    channel: str = 'RGB',
+    workers: int = 1,
+    chunk_size: int = 2048,
+    bias: float = 1e-3
+) -> bool:
+    """Bake per-corner ambient occlusion into the vertex color attribute.
+
+    Rays are cast from every face corner against a BVH of the mesh itself,
+    one BVH query per ray. Corners sharing a vertex and a normal are computed
+    once. The occlusion multiplies the RGB of the existing colors ('RGB') or
+    replaces a single channel ('R', 'G', 'B' or 'A').
+
+    Args:
+        obj: Mesh object to bake
+        samples: Rays per corner
+        max_distance: Maximum distance of an occluder
+        strength: 0 leaves the colors untouched, 1 applies the full occlusion
+        channel: 'RGB', 'R', 'G', 'B' or 'A'
+        workers: Worker processes (0 for one per CPU, 1 bakes in the current
+            process). Opt-in: worker processes are forked from Blender,
+            which is multithreaded, and a fork can deadlock if another
+            thread holds a lock at that moment. They are only used in
+            background mode on platforms that can fork; otherwise the bake
+            runs in the current process
+        chunk_size: Corners per work item (of a worker process)
+        bias: Offset of the ray origins along the normal, avoids self hits
+    """
+    try:
+        if not obj or obj.type != 'MESH':
+            print("[ERROR] Invalid object for ambient occlusion")
+            return False
+
+        mesh = obj.data
+        loops = len(mesh.loops)
+        if loops == 0 or samples <= 0:
+            return True
+
+        snapshot = get_snapshot(mesh)
+        positions = snapshot.positions
+        loop_vertices = snapshot.loop_vertices
+
+        corner_normals = np.empty(loops * 3, dtype=np.float32)
+        mesh.corner_normals.foreach_get("vector", corner_normals)
+        corner_normals = corner_normals.reshape(-1, 3)
+
+        mesh.calc_loop_triangles()
+        triangles = np.empty(len(mesh.loop_triangles) * 3, dtype=np.int32)
+        mesh.loop_triangles.foreach_get("vertices", triangles)
+        bvh = BVHTree.FromPolygons(positions.tolist(), triangles.reshape(-1, 3).tolist(), all_triangles=True)
+
+        # Corners sharing a vertex and a normal have the same occlusion
+        keys = np.concatenate(
+            (loop_vertices[:, None].astype(np.float64), np.round(corner_normals, 4)), axis=1
+        )
+        unique_keys, corner_to_unique = np.unique(keys, axis=0, return_inverse=True)
+        corner_to_unique = corner_to_unique.reshape(-1)
+        normals = unique_keys[:, 1:]
+        lengths = np.linalg.norm(normals, axis=1, keepdims=True)
+        normals = np.where(lengths > 0.0, normals / np.maximum(lengths, 1e-12), (0.0, 0.0, 1.0))
+        origins = positions[unique_keys[:, 0].astype(np.int64)] + normals * bias
+        tangents, bitangents = _tangent_frames(normals)
+
+        _STATE.update(
+            bvh=bvh,
+            origins=origins,
+            normals=normals,
+            tangents=tangents,
+            bitangents=bitangents,
+            samples=_hemisphere_samples(samples),
+            max_distance=max_distance,
+        )
+
+        count = len(normals)
+        chunks = [(i, min(i + chunk_size, count)) for i in range(0, count, chunk_size)]
+        workers = workers or os.cpu_count() or 1
+        can_fork = bpy.app.background and "fork" in multiprocessing.get_all_start_methods()
+
+        print(f"[AO] Baking {count} unique corners ({loops} total) with {samples} samples")
+        if can_fork and workers > 1 and len(chunks) > 1:
+            # Forked workers inherit _STATE, including the BVH
+            with multiprocessing.get_context("fork").Pool(min(workers, len(chunks))) as pool:
+                parts = pool.map(_occlusion_chunk, chunks)
+        else:
+            parts = [_occlusion_chunk(bounds) for bounds in chunks]
+
+        occlusion = np.concatenate(parts)[corner_to_unique]
+        ambient = 1.0 - occlusion * strength
+
+        target_attr = ensure_color_attribute(mesh)
+        colors = np.empty(loops * 4, dtype=np.float32)
+        target_attr.data.foreach_get("color", colors)
+        colors = colors.reshape(-1, 4)
+        if channel == 'RGB':
+            colors[:, :3] *= ambient[:, None]
+        else:
+            colors[:, "RGBA".index(channel)] = ambient
+        target_attr.data.foreach_set("color", colors.ravel())
+        mesh.update()
+        return True
+
+    except Exception as e:
+        print(f"[ERROR] Failed to bake ambient occlusion - {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+    finally:
+        _STATE.clear()
@@ -0,0 +1,262 @@
+import bpy
+import bmesh
+import math
+from typing import Dict, Optional, Tuple
+from mathutils import Vector
+from mathutils.bvhtree import BVHTree
+from .apply_modifier import evaluate_modifier
+from .mesh_snapshot import invalidate_snapshot
+
+# Bisection steps of the parameter search
+SEARCH_STEPS = 10
+
+# Vertices sampled on each side when measuring the deviation
+DEVIATION_SAMPLES = 4096
+
+# Voxel size search range, relative to the bounding box diagonal
+VOXEL_RANGE = (1.0 / 256.0, 1.0 / 4.0)
+
+
+def _triangle_count(bm: bmesh.types.BMesh) -> int:
+    """Number of triangles of a bmesh once triangulated."""
+    return sum(len(face.verts) - 2 for face in bm.faces)
+
+
+def _max_distance(points, tree: BVHTree) -> float:
+    """Largest distance of a sample of points to a surface."""
+    step = max(1, len(points) // DEVIATION_SAMPLES)
+    distance = 0.0
+    for co in points[::step]:
+        nearest = tree.find_nearest(co)
+        if nearest[0] is not None:
+            distance = max(distance, nearest[3])
+    return distance
+
+
+class CollisionBudgetSearch:
+    """Searches the decimate ratio or remesh voxel size meeting a collision budget.
+
+    Every evaluated parameter is cached with its triangle count and
+    deviation, so the bisection never evaluates the same value twice, and
+    the mesh of the best candidate so far is kept to be written back at
+    the end without a final evaluation.
+
+    Attributes:
+        obj: Collision mesh object being simplified
+        method: 'DECIMATE' (collapse ratio) or 'REMESH' (voxel size)
+        evaluations: Mapping of parameter value to (triangles, deviation)
+
+    Example:
+        >>> search = CollisionBudgetSearch(context, collision_obj, 'DECIMATE')
+        >>> search.run(max_triangles=500)
+        {'method': 'DECIMATE', 'value': 0.12, 'triangles': 496, ...}
+    """
+
+    def __init__(self, context, obj: bpy.types.Object, method: str = 'DECIMATE'):
+        """Prepare a search on obj, measuring deviation against its current mesh."""
+        self.context = context
+        self.obj = obj
+        self.method = method
+        self.evaluations: Dict[float, Tuple[int, float]] = {}
+        self._best: Optional[Tuple[float, bmesh.types.BMesh]] = None
+        self._last: Optional[Tuple[float, bmesh.types.BMesh]] = None
+
+        source = bmesh.new()
+        source.from_mesh(obj.data)
+        self.source_triangles = _triangle_count(source)
+        self.source_points = [v.co.copy() for v in source.verts]
+        self.source_tree = BVHTree.FromBMesh(source)
+        source.free()
+        self.diagonal = max((Vector(obj.bound_box[6]) - Vector(obj.bound_box[0])).length, 1e-6)
+
+    def evaluate(self, value: float) -> Tuple[int, float]:
+        """Return (triangles, deviation) of the mesh simplified with a parameter value.
+
+        The mesh of the latest new evaluation is held until the next one, so
+        it can be kept as the best candidate.
+
+        Args:
+            value: Collapse ratio or voxel size
+        """
+        value = round(value, 6)
+        if value in self.evaluations:
+            return self.evaluations[value]
+
+        if self.method == 'REMESH':
+            modifier = self.obj.modifiers.new(name="Budget", type='REMESH')
+            modifier.mode = 'VOXELS'
+            modifier.voxel_size = value
+            modifier.adaptivity = 0.0
+        else:
+            modifier = self.obj.modifiers.new(name="Budget", type='DECIMATE')
+            modifier.decimate_type = 'COLLAPSE'
+            modifier.ratio = value
+        bm = evaluate_modifier(self.context, self.obj, modifier)
+
+        triangles = _triangle_count(bm)
+        tree = BVHTree.FromBMesh(bm)
+        deviation = max(
+            _max_distance(self.source_points, tree),
+            _max_distance([v.co for v in bm.verts], self.source_tree)
+        )
+        self.evaluations[value] = (triangles, deviation)
+
+        self._free(self._last)
+        self._last = (value, bm)
+        return triangles, deviation
+
+    @staticmethod
+    def _free(candidate: Optional[Tuple[float, bmesh.types.BMesh]]) -> None:
+        """Free the mesh of a candidate, if any."""
+        if candidate:
+            candidate[1].free()
+
+    def _keep(self, value: float) -> None:
+        """Make the mesh of an evaluated value the best candidate."""
+        value = round(value, 6)
+        if self._last and self._last[0] == value:
+            self._free(self._best)
+            self._best, self._last = self._last, None
+
+    def _bisect(self, low: float, high: float, accept, prefer_high: bool) -> Optional[float]:
+        """Bisect [low, high] for the accepted value closest to the preferred end.
+
+        accept(triangles, deviation) must be monotonic over the range: true
+        towards the non-preferred end. Log-space bisection is used for the
+        voxel size, which spans orders of magnitude.
+        """
+        log = self.method == 'REMESH'
+        if log:
+            low, high = math.log(low), math.log(high)
+        best = None
+        for _ in range(SEARCH_STEPS):
+            middle = (low + high) / 2.0
+            value = math.exp(middle) if log else middle
+            if accept(*self.evaluate(value)):
+                best = value
+                self._keep(value)
+                if prefer_high:
+                    low = middle
+                else:
+                    high = middle
+            elif prefer_high:
+                high = middle
+            else:
+                low = middle
+        return best
+
+    def run(self, max_triangles: int = 0, max_deviation: float = 0.0) -> Optional[Dict]:
+        """Simplify the collision mesh to a triangle budget or a deviation limit.
+
+        Exactly one of max_triangles and max_deviation is expected. For a
+        triangle budget the least simplified mesh within the budget is
+        kept; for a deviation limit the most simplified mesh within it.
+
+        When no evaluated value meets a triangle budget, the most simplified
+        mesh tried is kept and the summary reports the budget as not met.
+
+        Returns:
+            A summary dict ('method', 'value', 'triangles', 'deviation',
+            'evaluations', 'met'), or None if the mesh was left unchanged
+        """
+        if max_triangles and self.source_triangles <= max_triangles:
+            return None
+
+        if self.method == 'REMESH':
+            low, high = self.diagonal * VOXEL_RANGE[0], self.diagonal * VOXEL_RANGE[1]
+            # Triangles decrease and deviation increases with the voxel size
+            if max_triangles:
+                value = self._bisect(low, high, lambda t, d: t <= max_triangles, prefer_high=False) or high
+            else:
+                value = self._bisect(low, high, lambda t, d: d <= max_deviation, prefer_high=True)
+        else:
+            # Triangles increase and deviation decreases with the ratio
+            if max_triangles:
+                # The ratio meeting the budget is close to max_triangles / source_triangles,
+                # so the bracket starts there instead of spreading the steps over [0, 1]
+                high = min(1.0, 2.0 * max_triangles / self.source_triangles)
+                value = self._bisect(0.0, high, lambda t, d: t <= max_triangles, prefer_high=True)
+                if value is None:
+                    value = min(self.evaluations)
+            else:
+                value = self._bisect(0.0, 1.0, lambda t, d: d <= max_deviation, prefer_high=False)
+
+        if value is None:
+            self._free(self._last)
+            self._free(self._best)
+            self._last = self._best = None
+            return None
+
+        value = round(value, 6)
+        if not self._best or self._best[0] != value:
+            # Not kept during the search (a fallback value)
+            self.evaluations.pop(value, None)
+            self.evaluate(value)
+            self._keep(value)
+        triangles, deviation = self.evaluations[value]
+        self._best[1].to_mesh(self.obj.data)
+        self.obj.data.update()
+        invalidate_snapshot(self.obj.data)
+        self._free(self._last)
+        self._free(self._best)
+        self._last = self._best = None
+        return {
+            "method": self.method,
+            "value": value,
+            "triangles": triangles,
+            "deviation": deviation,
+            "evaluations": len(self.evaluations),
+            "met": triangles <= max_triangles if max_triangles else deviation <= max_deviation,
+        }
+
+
+def apply_collision_budget(
+    context,
+    obj: bpy.types.Object,
+    method: str = 'DECIMATE',
+    target: str = 'TRIANGLES',
+    max_triangles: int = 500,
+    max_deviation: float = 0.05
+) -> bool:
+    """Simplify a collision mesh until it meets a triangle or deviation budget.
+
+    Args:
+        context: Blender context
+        obj: Collision mesh object
+        method: 'DECIMATE' (collapse ratio) or 'REMESH' (voxel size)
+        target: 'TRIANGLES' or 'DEVIATION'
+        max_triangles: Triangle budget (for 'TRIANGLES')
+        max_deviation: Largest surface deviation in meters (for 'DEVIATION')
+
+    Returns:
+        True if the mesh meets the budget, False otherwise
+    """
+    try:
+        if not obj or obj.type != 'MESH':
+            print("[ERROR] Invalid object for collision budget")
+            return False
+
+        search = CollisionBudgetSearch(context, obj, method)
+        if target == 'TRIANGLES':
+            summary = search.run(max_triangles=max_triangles)
+        else:
+            summary = search.run(max_deviation=max_deviation)
+
+        if summary is None:
+            print(f"[BUDGET] {obj.name} left unchanged ({search.source_triangles} triangles)")
+        else:
+            print(
+                f"[BUDGET] {obj.name}: {method.lower()} {summary['value']:.4f} -> "
+                f"{summary['triangles']} triangles, deviation {summary['deviation']:.4f}m "
+                f"({summary['evaluations']} evaluations)"
+            )
+            if not summary["met"]:
+                print(f"[WARNING] {obj.name} does not meet the collision budget")
+                return False
+        return True
+
+    except Exception as e:
+        print(f"[ERROR] Failed to apply collision budget - {e}")
+        import traceback
+        traceback.print_exc()
+        return False
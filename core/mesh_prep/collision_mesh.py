@@ -0,0 +1,34 @@
+import bpy
+from .mesh_snapshot import get_snapshot
+
+
+def build_collision_mesh(mesh: bpy.types.Mesh, name: str) -> bpy.types.Mesh:
+    """Build a collision mesh holding only the positions and faces of a mesh.
+
+    Unlike mesh.copy(), no UV map, color attribute, custom normal or other
+    attribute is duplicated. Face material indices and the material slots
+    are kept so the collision materials can be assigned per slot.
+
+    Args:
+        mesh: Source mesh
+        name: Name of the new mesh datablock
+
+    Returns:
+        The new mesh datablock
+    """
+    snapshot = get_snapshot(mesh)
+
+    new_mesh = bpy.data.meshes.new(name)
+    new_mesh.vertices.add(snapshot.vertex_count)
+    new_mesh.loops.add(snapshot.loop_count)
+    new_mesh.polygons.add(snapshot.poly_count)
+    new_mesh.vertices.foreach_set("co", snapshot.positions.ravel())
+    new_mesh.loops.foreach_set("vertex_index", snapshot.loop_vertices)
+    new_mesh.polygons.foreach_set("loop_start", snapshot.loop_starts)
+    new_mesh.polygons.foreach_set("material_index", snapshot.material_index)
+
+    for material in mesh.materials:
+        new_mesh.materials.append(material)
+
+    new_mesh.update(calc_edges=True)
+    return new_mesh
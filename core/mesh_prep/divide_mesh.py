@@ -0,0 +1,76 @@
+import bpy
+import numpy as np
+from typing import List
+from .extract_faces import extract_faces
+
+
+def divide_mesh(context, obj: bpy.types.Object, chunk_size: float) -> List[bpy.types.Object]:
+    """Split an oversized mesh into grid chunks on the ground (XY) plane.
+
+    Faces are assigned to square cells of chunk_size by their world-space
+    center. Each non-empty cell becomes a new object named
+    '<name>_<x>_<y>', linked to the collections of the source object and
+    keeping its transform. The source object is removed once divided.
+
+    Args:
+        context: Blender context
+        obj: Mesh object to divide
+        chunk_size: Edge length of a grid cell, in meters
+
+    Returns:
+        The chunk objects, or [obj] if the mesh fits in a single cell or
+        could not be divided (the chunks made so far are removed)
+    """
+    chunk_meshes = []
+    chunks = []
+    try:
+        mesh = obj.data
+        polys = len(mesh.polygons)
+        if chunk_size <= 0.0 or polys == 0:
+            return [obj]
+
+        centers = np.empty(polys * 3, dtype=np.float32)
+        mesh.polygons.foreach_get("center", centers)
+        matrix = np.array(obj.matrix_world, dtype=np.float64)
+        centers = centers.reshape(-1, 3) @ matrix[:3, :3].T + matrix[:3, 3]
+
+        cells = np.floor((centers[:, :2] - centers[:, :2].min(axis=0)) / chunk_size).astype(np.int64)
+        unique_cells, face_cells = np.unique(cells, axis=0, return_inverse=True)
+        if len(unique_cells) <= 1:
+            return [obj]
+        face_cells = face_cells.reshape(-1)
+
+        name = obj.name
+        print(f"[DIVIDE] Splitting {name} ({polys} faces) into {len(unique_cells)} chunks of {chunk_size}m")
+
+        # Sorting once groups the faces of each cell together
+        order = np.argsort(face_cells, kind='stable')
+        bounds = np.searchsorted(face_cells[order], np.arange(len(unique_cells) + 1))
+
+        collections = list(obj.users_collection) or [context.collection]
+        for cell_index, (x, y) in enumerate(unique_cells):
+            chunk_name = f"{name}_{x}_{y}"
+            chunk_mesh = extract_faces(mesh, order[bounds[cell_index]:bounds[cell_index + 1]], chunk_name)
+            chunk_meshes.append(chunk_mesh)
+            chunk = bpy.data.objects.new(chunk_name, chunk_mesh)
+            chunk.matrix_world = obj.matrix_world
+            for collection in collections:
+                collection.objects.link(chunk)
+            chunks.append(chunk)
+
+        bpy.data.objects.remove(obj)
+        if mesh.users == 0:
+            bpy.data.meshes.remove(mesh)
+        return chunks
+
+    except Exception as e:
+        print(f"[ERROR] Failed to divide mesh - {e}")
+        import traceback
+        traceback.print_exc()
+        # The source object is kept: drop the partial chunks
+        for chunk in chunks:
+            bpy.data.objects.remove(chunk)
+        for chunk_mesh in chunk_meshes:
+            if chunk_mesh.users == 0:
+                bpy.data.meshes.remove(chunk_mesh)
+        return [obj]
@@ -1,14 +1,16 @@
 import bpy
 from .rename_uv_maps import rename_uv_maps_sequential
-from .clear_uv_maps import clear_uv_maps
-from .paint_vertex_colors import paint_vertex_colors
+from .collision_mesh import build_collision_mesh
 from .apply_decimate import apply_decimate
 from .apply_remesh import apply_remesh
+from .collision_budget import apply_collision_budget
 from ... import constants
+from ...conversion_settings import ConversionSettings
 
 
-def duplicate_and_prepare_mesh(context, obj: bpy.types.Object):
-    """Duplicate mesh, store refs, normalize UVs, clear on collision, paint vertex colors."""
+def duplicate_and_prepare_mesh(context, obj: bpy.types.Object, settings: ConversionSettings = None):
+    """Store refs, normalize UVs and build the collision mesh from positions and faces only."""
+    settings = ConversionSettings.from_context_or(context, settings)
     sanitized_name = obj.name.lower().replace(" ", "")
     if sanitized_name != obj.name:
         obj.name = sanitized_name
@@ -39,46 +41,48 @@ def duplicate_and_prepare_mesh(context, obj: bpy.types.Object):
         else:
             obj.material_slots[0].material = mat
 
-    context.scene.prop_converter.original_mesh = obj
-
-    bpy.ops.object.select_all(action='DESELECT')
-    obj.select_set(True)
-    context.view_layer.objects.active = obj
+    props = getattr(context.scene, "prop_converter", None)
+    if props:
+        props.original_mesh = obj
 
-    new_obj = obj.copy()
-    new_obj.data = obj.data.copy()
-    new_obj.animation_data_clear()
+    # Only positions, faces and material slots are needed for the collision
+    collision_name = f"{original_name}{constants.COLLISION_SUFFIX}"
+    new_obj = bpy.data.objects.new(collision_name, build_collision_mesh(obj.data, collision_name))
+    new_obj.matrix_world = obj.matrix_world
     context.collection.objects.link(new_obj)
 
     rename_uv_maps_sequential(obj.data)
-    clear_uv_maps(new_obj.data)
 
-    new_obj.name = f"{original_name}{constants.COLLISION_SUFFIX}"
-    context.scene.prop_converter.collision_mesh = new_obj
+    if props:
+        props.collision_mesh = new_obj
+
+    # A collision budget replaces the manual decimate and remesh settings
+    if settings.enable_collision_budget:
+        if not apply_collision_budget(context, new_obj,
+                                      method=settings.budget_method,
+                                      target=settings.budget_target,
+                                      max_triangles=settings.budget_triangles,
+                                      max_deviation=settings.budget_max_deviation):
+            print("[WARNING] Failed to apply collision budget")
 
     # Apply decimate modifier if enabled
-    props = getattr(context.scene, "prop_converter", None)
-    if props and props.enable_decimate:
+    elif settings.enable_decimate:
         if not apply_decimate(context, new_obj, 
-                             decimate_type=props.decimate_type,
-                             ratio=props.decimate_ratio,
-                             iterations=props.decimate_iterations,
-                             use_dissolve=props.decimate_use_dissolve,
-                             planar_angle=props.decimate_planar_angle):
+                             decimate_type=settings.decimate_type,
+                             ratio=settings.decimate_ratio,
+                             iterations=settings.decimate_iterations,
+                             use_dissolve=settings.decimate_use_dissolve,
+                             planar_angle=settings.decimate_planar_angle):
             print("[WARNING] Failed to apply decimate modifier")
 
     # Apply remesh modifier if enabled
-    if props and props.enable_remesh:
-        if not apply_remesh(context, new_obj, props.remesh_mode, 
-                           use_smooth_shade=props.remesh_use_smooth_shade,
-                           threshold=props.remesh_threshold,
-                           voxel_size=props.remesh_voxel_size,
-                           adaptivity=props.remesh_adaptivity):
+    if settings.enable_remesh and not settings.enable_collision_budget:
+        if not apply_remesh(context, new_obj, settings.remesh_mode, 
+                           use_smooth_shade=settings.remesh_use_smooth_shade,
+                           threshold=settings.remesh_threshold,
+                           voxel_size=settings.remesh_voxel_size,
+                           adaptivity=settings.remesh_adaptivity):
             print("[WARNING] Failed to apply remesh modifier")
 
-    paint_col = getattr(getattr(context.scene, "prop_converter", None), "vertex_color", (1.0, 1.0, 1.0, 1.0))
-    # Only paint colors on collision mesh during preparation
-    # Original mesh colors will be painted AFTER material conversion to avoid interference
-    paint_vertex_colors(None, new_obj, color=tuple(paint_col))
-
+    # Original mesh colors are painted AFTER material conversion to avoid interference
     return original_name, new_obj
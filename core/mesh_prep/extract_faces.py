@@ -0,0 +1,196 @@
+import bpy
+import numpy as np
+from typing import Optional
+from .mesh_snapshot import get_snapshot
+
+# Attribute data type -> (foreach property, components per element)
+_ATTRIBUTE_LAYOUTS = {
+    'FLOAT': ("value", 1),
+    'INT': ("value", 1),
+    'INT8': ("value", 1),
+    'BOOLEAN': ("value", 1),
+    'FLOAT2': ("vector", 2),
+    'INT16_2D': ("value", 2),
+    'INT32_2D': ("value", 2),
+    'FLOAT_VECTOR': ("vector", 3),
+    'FLOAT_COLOR': ("color", 4),
+    'BYTE_COLOR': ("color", 4),
+    'QUATERNION': ("value", 4),
+}
+
+_ATTRIBUTE_DTYPES = {
+    'INT': np.int32,
+    'INT8': np.int8,
+    'BOOLEAN': bool,
+    'INT16_2D': np.int16,
+    'INT32_2D': np.int32,
+}
+
+
+def _get_attribute(attr, count: int) -> np.ndarray:
+    """Read an attribute into a (count, components) array."""
+    prop, width = _ATTRIBUTE_LAYOUTS[attr.data_type]
+    values = np.empty(count * width, dtype=_ATTRIBUTE_DTYPES.get(attr.data_type, np.float32))
+    attr.data.foreach_get(prop, values)
+    return values.reshape(count, width)
+
+
+def extract_faces(mesh: bpy.types.Mesh, faces, name: str) -> bpy.types.Mesh:
+    """Build a new mesh datablock from a subset of the faces of a mesh.
+
+    Positions, topology and every point, corner and face attribute (UV maps,
+    color attributes, material indices, custom data) are copied with bulk
+    foreach_get/foreach_set. Edges are rebuilt from the faces and get the
+    attributes (sharp edges, seams) of the source edge between the same
+    vertices; custom split normals are kept. The material slots of the
+    source mesh are shared with the new mesh.
+
+    Args:
+        mesh: Source mesh
+        faces: Indices of the faces to keep
+        name: Name of the new mesh datablock
+
+    Returns:
+        The new mesh datablock
+    """
+    faces = np.asarray(faces, dtype=np.int64)
+    snapshot = get_snapshot(mesh)
+    loop_starts = snapshot.loop_starts.astype(np.int64)
+    loop_vertices = snapshot.loop_vertices
+
+    # Corners of the kept faces, in face order
+    totals = snapshot.loop_totals[faces].astype(np.int64)
+    new_starts = np.cumsum(totals) - totals
+    loops = np.repeat(loop_starts[faces] - new_starts, totals) + np.arange(int(totals.sum()))
+
+    # Kept vertices and the remapped corner -> vertex indices
+    vertices, corner_vertices = np.unique(loop_vertices[loops], return_inverse=True)
+    return build_mesh(mesh, name, vertices, loops, faces, corner_vertices.reshape(-1), new_starts)
+
+
+def build_mesh(
+    mesh: bpy.types.Mesh,
+    name: str,
+    vertices: np.ndarray,
+    loops: np.ndarray,
+    faces: np.ndarray,
+    corner_vertices: np.ndarray,
+    loop_starts: np.ndarray,
+    vertex_map: Optional[np.ndarray] = None
+) -> bpy.types.Mesh:
+    """Build a new mesh datablock from elements of a mesh.
+
+    Args:
+        mesh: Source mesh
+        name: Name of the new mesh datablock
+        vertices: Source vertex of every new vertex
+        loops: Source corner of every new corner
+        faces: Source face of every new face
+        corner_vertices: New vertex index of every new corner
+        loop_starts: First new corner of every new face
+        vertex_map: New vertex of every source vertex, -1 if dropped
+            (defaults to the inverse of vertices; give it when several
+            source vertices become one new vertex)
+
+    Returns:
+        The new mesh datablock
+    """
+    positions = get_snapshot(mesh).positions
+
+    new_mesh = bpy.data.meshes.new(name)
+    new_mesh.vertices.add(len(vertices))
+    new_mesh.loops.add(len(loops))
+    new_mesh.polygons.add(len(faces))
+    new_mesh.vertices.foreach_set("co", positions[vertices].ravel())
+    new_mesh.loops.foreach_set("vertex_index", corner_vertices.astype(np.int32))
+    new_mesh.polygons.foreach_set("loop_start", loop_starts.astype(np.int32))
+
+    # Copy the user attributes; positions and topology are already set, edge
+    # attributes follow the rebuilt edges and custom normals are set last
+    domain_indices = {'POINT': vertices, 'CORNER': loops, 'FACE': faces}
+    domain_sizes = {'POINT': len(mesh.vertices), 'CORNER': len(mesh.loops), 'FACE': len(mesh.polygons)}
+    for attr in mesh.attributes:
+        if attr.name.startswith(".") or attr.name in ("position", "custom_normal"):
+            continue
+        if attr.domain not in domain_indices or attr.data_type not in _ATTRIBUTE_LAYOUTS:
+            continue
+        values = _get_attribute(attr, domain_sizes[attr.domain])[domain_indices[attr.domain]]
+        new_attr = new_mesh.attributes.get(attr.name)
+        if new_attr is None:
+            new_attr = new_mesh.attributes.new(attr.name, attr.data_type, attr.domain)
+        new_attr.data.foreach_set(_ATTRIBUTE_LAYOUTS[attr.data_type][0], values.ravel())
+
+    if mesh.uv_layers.active is not None and mesh.uv_layers.active.name in new_mesh.uv_layers:
+        new_mesh.uv_layers.active = new_mesh.uv_layers[mesh.uv_layers.active.name]
+    if mesh.color_attributes.active_color_name in new_mesh.color_attributes:
+        new_mesh.color_attributes.active_color_name = mesh.color_attributes.active_color_name
+
+    for material in mesh.materials:
+        new_mesh.materials.append(material)
+
+    new_mesh.update(calc_edges=True)
+
+    if vertex_map is None:
+        vertex_map = np.full(len(mesh.vertices), -1, dtype=np.int64)
+        vertex_map[vertices] = np.arange(len(vertices))
+    _copy_edge_data(mesh, new_mesh, vertex_map)
+
+    if mesh.has_custom_normals:
+        normals = np.empty(len(mesh.loops) * 3, dtype=np.float32)
+        mesh.corner_normals.foreach_get("vector", normals)
+        new_mesh.normals_split_custom_set(normals.reshape(-1, 3)[loops])
+    return new_mesh
+
+
+def _edge_keys(mesh: bpy.types.Mesh, vertex_map: Optional[np.ndarray], vertex_count: int) -> np.ndarray:
+    """Key of every edge from its (mapped) vertex pair, -1 for edges losing a vertex."""
+    pairs = np.empty(len(mesh.edges) * 2, dtype=np.int32)
+    mesh.edges.foreach_get("vertices", pairs)
+    pairs = pairs.reshape(-1, 2).astype(np.int64)
+    if vertex_map is not None:
+        pairs = vertex_map[pairs]
+    pairs.sort(axis=1)
+    keys = pairs[:, 0] * vertex_count + pairs[:, 1]
+    keys[(pairs[:, 0] < 0) | (pairs[:, 0] == pairs[:, 1])] = -1
+    return keys
+
+
+def _copy_edge_data(mesh: bpy.types.Mesh, new_mesh: bpy.types.Mesh, vertex_map: np.ndarray) -> None:
+    """Copy edge attributes and seams to the rebuilt edges between the same vertices.
+
+    When several source edges become one edge, a flag set on any of them
+    (sharp, seam) is kept; other values come from one of them.
+    """
+    if not len(mesh.edges) or not len(new_mesh.edges):
+        return
+    vertex_count = len(new_mesh.vertices)
+    source_keys = _edge_keys(mesh, vertex_map, vertex_count)
+    new_keys = _edge_keys(new_mesh, None, vertex_count)
+    order = np.argsort(new_keys)
+    found = np.searchsorted(new_keys[order], source_keys).clip(0, len(new_keys) - 1)
+    matched = (source_keys >= 0) & (new_keys[order][found] == source_keys)
+    source_edges = np.flatnonzero(matched)
+    new_edges = order[found[matched]]
+
+    def transfer(values: np.ndarray, new_values: np.ndarray) -> np.ndarray:
+        if values.dtype == bool:
+            np.logical_or.at(new_values, new_edges, values[source_edges])
+        else:
+            new_values[new_edges] = values[source_edges]
+        return new_values
+
+    for attr in mesh.attributes:
+        if attr.domain != 'EDGE' or attr.name.startswith(".") or attr.data_type not in _ATTRIBUTE_LAYOUTS:
+            continue
+        values = _get_attribute(attr, len(mesh.edges))
+        new_attr = new_mesh.attributes.get(attr.name)
+        if new_attr is None:
+            new_attr = new_mesh.attributes.new(attr.name, attr.data_type, 'EDGE')
+        new_values = transfer(values, np.zeros((len(new_mesh.edges), values.shape[1]), dtype=values.dtype))
+        new_attr.data.foreach_set(_ATTRIBUTE_LAYOUTS[attr.data_type][0], new_values.ravel())
+
+    # Seams are not a user attribute in every Blender version
+    seams = np.zeros(len(mesh.edges), dtype=bool)
+    mesh.edges.foreach_get("use_seam", seams)
+    if seams.any():
+        new_mesh.edges.foreach_set("use_seam", transfer(seams, np.zeros(len(new_mesh.edges), dtype=bool)))
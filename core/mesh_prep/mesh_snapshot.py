@@ -0,0 +1,104 @@
+import bpy
+import numpy as np
+from functools import cached_property
+from typing import Dict
+
+
+class MeshSnapshot:
+    """Compact arrays of the geometry of a mesh, read with foreach_get on first use.
+
+    Stages reading the same mesh share one snapshot through get_snapshot
+    instead of walking the mesh again. Arrays are read-only views; a stage
+    changing the mesh calls invalidate_snapshot so the next reader captures
+    it again. A snapshot whose element counts no longer match its mesh is
+    treated as stale as well.
+
+    Attributes:
+        mesh: The captured mesh
+        vertex_count: Number of vertices
+        loop_count: Number of face corners
+        poly_count: Number of polygons
+
+    Example:
+        >>> snapshot = get_snapshot(obj.data)
+        >>> snapshot.positions.shape
+        (8, 3)
+    """
+
+    def __init__(self, mesh: bpy.types.Mesh):
+        self.mesh = mesh
+        self.vertex_count = len(mesh.vertices)
+        self.loop_count = len(mesh.loops)
+        self.poly_count = len(mesh.polygons)
+
+    def _read(self, collection, attr: str, dtype, count: int, size: int = 1) -> np.ndarray:
+        """Bulk read an attribute of a mesh collection into a read-only array."""
+        data = np.empty(count * size, dtype=dtype)
+        if count:
+            collection.foreach_get(attr, data)
+        if size > 1:
+            data = data.reshape(-1, size)
+        data.flags.writeable = False
+        return data
+
+    @cached_property
+    def positions(self) -> np.ndarray:
+        """(vertices, 3) float32 vertex positions."""
+        return self._read(self.mesh.vertices, "co", np.float32, self.vertex_count, 3)
+
+    @cached_property
+    def loop_vertices(self) -> np.ndarray:
+        """int32 vertex index of every corner."""
+        return self._read(self.mesh.loops, "vertex_index", np.int32, self.loop_count)
+
+    @cached_property
+    def loop_starts(self) -> np.ndarray:
+        """int32 first corner of every polygon."""
+        return self._read(self.mesh.polygons, "loop_start", np.int32, self.poly_count)
+
+    @cached_property
+    def loop_totals(self) -> np.ndarray:
+        """int32 number of corners of every polygon."""
+        return self._read(self.mesh.polygons, "loop_total", np.int32, self.poly_count)
+
+    @cached_property
+    def material_index(self) -> np.ndarray:
+        """int32 material index of every polygon."""
+        return self._read(self.mesh.polygons, "material_index", np.int32, self.poly_count)
+
+    @cached_property
+    def loop_faces(self) -> np.ndarray:
+        """int64 polygon of every corner."""
+        faces = np.repeat(np.arange(self.poly_count), self.loop_totals)
+        faces.flags.writeable = False
+        return faces
+
+    def matches(self, mesh: bpy.types.Mesh) -> bool:
+        """Whether the snapshot still has the element counts of mesh."""
+        return (
+            self.vertex_count == len(mesh.vertices)
+            and self.loop_count == len(mesh.loops)
+            and self.poly_count == len(mesh.polygons)
+        )
+
+
+# Snapshots of the current prop, by mesh session id
+_SNAPSHOTS: Dict[int, MeshSnapshot] = {}
+
+
+def get_snapshot(mesh: bpy.types.Mesh) -> MeshSnapshot:
+    """Return the snapshot of a mesh, capturing it if missing or stale."""
+    snapshot = _SNAPSHOTS.get(mesh.session_uid)
+    if snapshot is None or not snapshot.matches(mesh):
+        snapshot = _SNAPSHOTS[mesh.session_uid] = MeshSnapshot(mesh)
+    return snapshot
+
+
+def invalidate_snapshot(mesh: bpy.types.Mesh) -> None:
+    """Drop the snapshot of a mesh after changing it."""
+    _SNAPSHOTS.pop(mesh.session_uid, None)
+
+
+def clear_snapshots() -> None:
+    """Drop every snapshot, once a prop is done."""
+    _SNAPSHOTS.clear()
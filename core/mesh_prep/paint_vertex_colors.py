@@ -1,38 +1,95 @@
 import bpy
+import numpy as np
+from typing import Mapping, Optional, Sequence, Union
+from .mesh_snapshot import get_snapshot
 from ... import constants
 
 
-def paint_vertex_colors(original_obj: bpy.types.Object, collision_obj: bpy.types.Object, color=(1.0, 1.0, 1.0, 1.0)) -> bool:
+def ensure_color_attribute(mesh: bpy.types.Mesh) -> bpy.types.Attribute:
+    """Create or get the vertex color attribute (Face Corner domain, Byte Color type)."""
+    attr_name = constants.VERTEX_COLOR_ATTRIBUTE_NAME
+
+    if attr_name in mesh.color_attributes:
+        target_attr = mesh.color_attributes[attr_name]
+        # Ensure it's Face Corner and Byte Color
+        if target_attr.domain == 'CORNER' and target_attr.data_type == 'BYTE_COLOR':
+            return target_attr
+        mesh.color_attributes.remove(target_attr)
+
+    return mesh.color_attributes.new(
+        name=attr_name,
+        type='BYTE_COLOR',
+        domain='CORNER'
+    )
+
+
+def build_corner_colors(
+    mesh: bpy.types.Mesh,
+    color=(1.0, 1.0, 1.0, 1.0),
+    face_colors: Optional[Sequence] = None,
+    material_colors: Optional[Union[Mapping[int, Sequence[float]], Sequence]] = None
+) -> np.ndarray:
+    """Build a (loops, 4) float32 array of corner colors.
+
+    Args:
+        mesh: Mesh whose corners are colored
+        color: RGBA used for every corner (and for unmapped materials)
+        face_colors: Optional RGBA per polygon, overrides color and material_colors
+        material_colors: Optional RGBA per material index (mapping or sequence)
+    """
+    loops = len(mesh.loops)
+    if face_colors is None and material_colors is None:
+        corner_colors = np.empty((loops, 4), dtype=np.float32)
+        corner_colors[:] = color
+        return corner_colors
+
+    polys = len(mesh.polygons)
+    snapshot = get_snapshot(mesh)
+    if face_colors is not None:
+        poly_colors = np.asarray(face_colors, dtype=np.float32).reshape(polys, 4)
+    else:
+        material_index = snapshot.material_index
+        if isinstance(material_colors, Mapping):
+            items = material_colors.items()
+        else:
+            items = enumerate(material_colors)
+        items = [(int(index), value) for index, value in items if value is not None]
+
+        # Lookup table indexed by material index, unmapped indices keep the base color
+        size = max([int(material_index.max()) + 1 if polys else 0] + [index + 1 for index, _ in items])
+        table = np.empty((max(size, 1), 4), dtype=np.float32)
+        table[:] = color
+        for index, value in items:
+            if index >= 0:
+                table[index] = value
+        poly_colors = table[material_index]
+
+    # Corners are stored contiguously per polygon, in polygon order
+    return np.repeat(poly_colors, snapshot.loop_totals, axis=0)
+
+
+def paint_vertex_colors(
+    original_obj: bpy.types.Object,
+    collision_obj: bpy.types.Object,
+    color=(1.0, 1.0, 1.0, 1.0),
+    face_colors: Optional[Sequence] = None,
+    material_colors: Optional[Union[Mapping[int, Sequence[float]], Sequence]] = None
+) -> bool:
     """Fill vertex colors on the original mesh (Color 1) and remove all vertex colors from the collision mesh.
-    Uses Face Corner domain and Byte Color type as required."""
+    Uses Face Corner domain and Byte Color type as required.
+
+    The fill is a single bulk foreach_set of all corners. By default every
+    corner gets color; face_colors gives one color per polygon and
+    material_colors one color per material index."""
     try:
         if original_obj and original_obj.type == "MESH":
             mesh = original_obj.data
             loops = len(mesh.loops)
             if loops > 0:
-                attr_name = constants.VERTEX_COLOR_ATTRIBUTE_NAME
-                
-                # Create or get color attribute with Face Corner and Byte Color
-                if attr_name in mesh.color_attributes:
-                    target_attr = mesh.color_attributes[attr_name]
-                    # Ensure it's Face Corner and Byte Color
-                    if target_attr.domain != 'CORNER' or target_attr.data_type != 'BYTE_COLOR':
-                        mesh.color_attributes.remove(target_attr)
-                        target_attr = mesh.color_attributes.new(
-                            name=attr_name, 
-                            type='BYTE_COLOR',
-                            domain='CORNER'
-                        )
-                else:
-                    target_attr = mesh.color_attributes.new(
-                        name=attr_name, 
-                        type='BYTE_COLOR',
-                        domain='CORNER'
-                    )
-                
-                # Fill with vertex color
-                for loop_index in range(loops):
-                    target_attr.data[loop_index].color = color
+                target_attr = ensure_color_attribute(mesh)
+                corner_colors = build_corner_colors(mesh, color, face_colors, material_colors)
+                target_attr.data.foreach_set("color", corner_colors.ravel())
+                mesh.update()
 
         if collision_obj and collision_obj.type == "MESH":
             cmesh = collision_obj.data
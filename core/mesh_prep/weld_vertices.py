@@ -0,0 +1,180 @@
+import bpy
+import itertools
+import numpy as np
+from typing import Dict, Tuple
+from .extract_faces import build_mesh
+from .mesh_snapshot import get_snapshot, invalidate_snapshot
+
+# Faces with a smaller area are dropped as degenerate
+DEGENERATE_AREA = 1e-12
+
+
+def _face_areas(positions: np.ndarray, corner_vertices: np.ndarray, loop_starts: np.ndarray) -> np.ndarray:
+    """Area of every face from its corners (Newell's method, valid for any polygon)."""
+    totals = np.diff(np.append(loop_starts, len(corner_vertices)))
+    following = np.arange(1, len(corner_vertices) + 1)
+    following[loop_starts + totals - 1] = loop_starts
+    co = positions[corner_vertices]
+    cross = np.cross(co, co[following])
+    return 0.5 * np.linalg.norm(np.add.reduceat(cross, loop_starts, axis=0), axis=1)
+
+
+# Neighbour cell offsets, one of each opposite pair plus the cell itself
+_HALF_NEIGHBOURS = [
+    offset for offset in itertools.product((-1, 0, 1), repeat=3) if offset >= (0, 0, 0)
+]
+
+
+def _close_pairs(positions: np.ndarray, distance: float) -> np.ndarray:
+    """Pairs (i, j), i < j, of vertices at most distance apart, sorted.
+
+    Vertices are hashed to a grid of cell size distance, so a vertex can
+    only be close to vertices of its own and of the 26 neighbouring cells;
+    candidates are then compared by their actual distance.
+    """
+    cells = np.floor(positions / distance).astype(np.int64)
+    unique_cells, cell_of = np.unique(cells, axis=0, return_inverse=True)
+    cell_of = cell_of.reshape(-1)
+    order = np.argsort(cell_of, kind='stable')
+    counts = np.bincount(cell_of, minlength=len(unique_cells))
+    starts = np.cumsum(counts) - counts
+
+    pairs = []
+    for offset in _HALF_NEIGHBOURS:
+        if offset == (0, 0, 0):
+            cells_a = cells_b = np.arange(len(unique_cells))
+        else:
+            # Find the cell at the offset of every cell, if it is occupied
+            shifted = unique_cells + np.array(offset)
+            _, inverse = np.unique(np.vstack((unique_cells, shifted)), axis=0, return_inverse=True)
+            inverse = inverse.reshape(-1)
+            lookup = np.full(len(unique_cells) * 2, -1, dtype=np.int64)
+            lookup[inverse[:len(unique_cells)]] = np.arange(len(unique_cells))
+            neighbours = lookup[inverse[len(unique_cells):]]
+            cells_a = np.flatnonzero(neighbours >= 0)
+            cells_b = neighbours[cells_a]
+
+        # Every vertex of cell a against every vertex of cell b
+        sizes = counts[cells_a] * counts[cells_b]
+        cell_pair = np.repeat(np.arange(len(sizes)), sizes)
+        within = np.arange(int(sizes.sum())) - np.repeat(np.cumsum(sizes) - sizes, sizes)
+        size_b = counts[cells_b][cell_pair]
+        first = order[starts[cells_a][cell_pair] + within // size_b]
+        second = order[starts[cells_b][cell_pair] + within % size_b]
+        close = np.einsum("ij,ij->i", positions[first] - positions[second], positions[first] - positions[second])
+        keep = (close <= distance * distance) & (first != second)
+        if offset == (0, 0, 0):
+            keep &= first < second
+        pairs.append(np.sort(np.column_stack((first[keep], second[keep])), axis=1))
+
+    pairs = np.vstack(pairs)
+    return pairs[np.lexsort((pairs[:, 1], pairs[:, 0]))]
+
+
+def _weld_targets(positions: np.ndarray, distance: float) -> Tuple[np.ndarray, np.ndarray]:
+    """Group vertices within distance of a kept vertex.
+
+    In index order, every vertex not merged yet keeps its place and absorbs
+    the vertices within distance of it that are not merged yet, so every
+    merged vertex is at most distance away from the vertex it is merged into.
+
+    Returns:
+        Tuple of (kept vertex indices, position in it of the kept vertex of every vertex)
+    """
+    target = np.arange(len(positions))
+    for i, j in _close_pairs(positions, distance).tolist():
+        if target[i] == i and target[j] == j:
+            target[j] = i
+    first = np.flatnonzero(target == np.arange(len(positions)))
+    return first, np.searchsorted(first, target)
+
+
+def weld_vertices(obj: bpy.types.Object, distance: float = 0.0001) -> Dict[str, int]:
+    """Weld coincident vertices and drop degenerate and duplicate faces.
+
+    Vertices at most distance apart are merged (see _weld_targets). Corners
+    repeated along a face are then collapsed, faces left with fewer than
+    three corners, a repeated corner or no area are dropped, and faces
+    using the same vertices as an earlier face are dropped as duplicates.
+    The mesh of obj is replaced by the cleaned mesh; point, corner and face
+    attributes and custom normals are kept, and the rebuilt edges get the
+    attributes (seams, sharp edges) of the edges they were welded from.
+
+    Args:
+        obj: Mesh object to clean
+        distance: Largest distance between merged vertices, in meters
+
+    Returns:
+        Dict with the number of removed 'vertices', 'degenerate' faces and
+        'duplicates' faces (all zero if the mesh was left unchanged)
+    """
+    removed = {"vertices": 0, "degenerate": 0, "duplicates": 0}
+    try:
+        mesh = obj.data
+        vertex_count, loop_count, poly_count = len(mesh.vertices), len(mesh.loops), len(mesh.polygons)
+        if poly_count == 0 or distance <= 0.0:
+            return removed
+
+        snapshot = get_snapshot(mesh)
+        positions = snapshot.positions.astype(np.float64)
+        loop_starts = snapshot.loop_starts.astype(np.int64)
+        loop_totals = snapshot.loop_totals.astype(np.int64)
+        loop_vertices = snapshot.loop_vertices
+
+        first, welded = _weld_targets(positions, distance)
+        corners = welded[loop_vertices]
+
+        # Collapse corners repeating the previous corner of their face
+        loop_faces = snapshot.loop_faces
+        previous = np.arange(-1, loop_count - 1)
+        previous[loop_starts] = loop_starts + loop_totals - 1
+        keep_loops = corners != corners[previous]
+        kept_corners = corners[keep_loops]
+        kept_totals = np.bincount(loop_faces[keep_loops], minlength=poly_count)
+
+        # Degenerate faces: too few corners, a corner used twice, or no area
+        distinct = np.bincount(np.unique(loop_faces * len(first) + corners) // len(first), minlength=poly_count)
+        valid = (kept_totals >= 3) & (distinct == kept_totals)
+        kept_starts = np.cumsum(kept_totals) - kept_totals
+        areas = _face_areas(positions[first], kept_corners, kept_starts[kept_totals > 0])
+        face_areas = np.zeros(poly_count)
+        face_areas[kept_totals > 0] = areas
+        valid &= face_areas > DEGENERATE_AREA
+        removed["degenerate"] = int(poly_count - np.count_nonzero(valid))
+
+        # Duplicate faces: same vertex set as an earlier face of the same size
+        for size in np.unique(kept_totals[valid]):
+            faces = np.flatnonzero(valid & (kept_totals == size))
+            face_loops = (kept_starts[faces][:, None] + np.arange(size)).ravel()
+            vertex_sets = np.sort(kept_corners[face_loops].reshape(-1, size), axis=1)
+            _, unique = np.unique(vertex_sets, axis=0, return_index=True)
+            duplicates = np.setdiff1d(np.arange(len(faces)), unique)
+            valid[faces[duplicates]] = False
+            removed["duplicates"] += len(duplicates)
+
+        faces = np.flatnonzero(valid)
+        loops = np.flatnonzero(keep_loops & valid[loop_faces])
+        vertices, corner_vertices = np.unique(corners[loops], return_inverse=True)
+        removed["vertices"] = int(vertex_count - len(vertices))
+        if not any(removed.values()):
+            return removed
+
+        totals = kept_totals[faces]
+        vertex_map = np.full(len(first), -1, dtype=np.int64)
+        vertex_map[vertices] = np.arange(len(vertices))
+        mesh_name = mesh.name
+        obj.data = build_mesh(
+            mesh, mesh_name, first[vertices], loops, faces,
+            corner_vertices.reshape(-1), np.cumsum(totals) - totals, vertex_map[welded]
+        )
+        invalidate_snapshot(mesh)
+        if mesh.users == 0:
+            bpy.data.meshes.remove(mesh)
+            obj.data.name = mesh_name
+        return removed
+
+    except Exception as e:
+        print(f"[ERROR] Failed to weld vertices - {e}")
+        import traceback
+        traceback.print_exc()
+        return {"vertices": 0, "degenerate": 0, "duplicates": 0}
@@ -0,0 +1,64 @@
+import bpy
+from contextlib import contextmanager
+from typing import Callable, Iterator, Optional, Sequence
+
+
+@contextmanager
+def objects_override(
+    context,
+    objects: Sequence[bpy.types.Object],
+    active: Optional[bpy.types.Object] = None
+) -> Iterator[None]:
+    """Make objects the selection and active object of the context, without selecting them.
+
+    Operators run inside the block see objects as context.selected_objects
+    and active (the first object if None) as context.active_object, while
+    the selection of the view layer is left untouched. This costs the same
+    whatever the number of objects in the scene, unlike deselecting
+    everything first.
+
+    Example:
+        >>> with objects_override(context, [obj]):
+        ...     bpy.ops.object.origin_set(type='ORIGIN_GEOMETRY')
+    """
+    objects = list(objects)
+    active = active or (objects[0] if objects else None)
+    with context.temp_override(
+        selected_objects=objects,
+        selected_editable_objects=objects,
+        active_object=active,
+        object=active,
+    ):
+        yield
+
+
+def run_with_objects(
+    context,
+    operator: Callable,
+    objects: Sequence[bpy.types.Object],
+    active: Optional[bpy.types.Object] = None,
+    **kwargs
+) -> set:
+    """Run an operator on an explicit set of objects (see objects_override).
+
+    Args:
+        context: Blender context
+        operator: Operator to call (e.g. bpy.ops.object.origin_set)
+        objects: Objects the operator works on, as its selection
+        active: Active object (the first object if None)
+        **kwargs: Operator properties
+
+    Returns:
+        The operator result
+    """
+    with objects_override(context, objects, active):
+        return operator(**kwargs)
+
+
+def select_objects(context, objects: Sequence[bpy.types.Object], active: Optional[bpy.types.Object] = None) -> None:
+    """Replace the selection of the view layer, e.g. to hand converted props back to the user."""
+    for obj in context.view_layer.objects.selected:
+        obj.select_set(False)
+    for obj in objects:
+        obj.select_set(True)
+    context.view_layer.objects.active = active or (objects[0] if objects else None)
@@ -0,0 +1,330 @@
+"""Multi-process conversion farm for PropConverter-V.
+
+Conversion goes through bpy.ops.sollumz.* and is single-threaded, so the
+farm splits the asset list across several background Blender processes,
+each running the command-line pipeline (cli.py) on its share of the models.
+The per-model archetypes are then merged into one or more YTYPs.
+
+Usage (runs inside Blender, workers use the same Blender binary):
+
+    blender -b --python-exit-code 1 --python-expr \\
+        "import sys; from bl_ext.user_default.propconverterv import farm; sys.exit(farm.main())" -- \\
+        --input ./models --output ./build --workers 16 --ytyp-name my_props
+
+Each chunk of models runs in its own process. When a worker crashes or
+times out, the model it was converting is retried; a model that keeps
+crashing its worker is marked as failed and the rest of its chunk continues
+in a new worker.
+"""
+
+import argparse
+import json
+import math
+import os
+import queue
+import subprocess
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
+import bpy
+from .cli import find_source_models, get_script_args
+from .core.conversion.merge_ytyp import merge_ytyp_files
+
+
+@dataclass
+class WorkerStats:
+    """Throughput counters of one worker slot.
+
+    Attributes:
+        slot: Worker slot index
+        processes: Number of Blender processes started in this slot
+        crashes: Number of processes that died before finishing their models
+        converted: Number of models converted successfully
+        failed: Number of models that failed
+        busy_seconds: Total wall time spent running processes
+    """
+    slot: int
+    processes: int = 0
+    crashes: int = 0
+    converted: int = 0
+    failed: int = 0
+    busy_seconds: float = 0.0
+
+    @property
+    def models_per_minute(self) -> float:
+        """Models handled per minute of busy time."""
+        if self.busy_seconds <= 0.0:
+            return 0.0
+        return (self.converted + self.failed) * 60.0 / self.busy_seconds
+
+
+@dataclass
+class FarmReport:
+    """Outcome of a farm run.
+
+    Attributes:
+        records: One record per model (see cli.convert_file)
+        workers: Throughput counters per worker slot
+        ytyp_files: Paths of the merged YTYPs
+        seconds: Total wall time of the run
+    """
+    records: List[Dict[str, Any]] = field(default_factory=list)
+    workers: List[WorkerStats] = field(default_factory=list)
+    ytyp_files: List[str] = field(default_factory=list)
+    seconds: float = 0.0
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Build the command-line argument parser."""
+    parser = argparse.ArgumentParser(
+        prog="propconverter.farm",
+        description="Convert a directory of source models with several Blender worker processes."
+    )
+    parser.add_argument("--input", required=True, help="Directory containing the source models")
+    parser.add_argument("--output", required=True, help="Directory receiving the exported assets")
+    parser.add_argument("--recursive", action="store_true", help="Also search sub-directories of --input")
+    parser.add_argument("--workers", type=int, default=max(1, (os.cpu_count() or 2) - 1),
+                        help="Number of parallel Blender processes")
+    parser.add_argument("--chunk-size", type=int, default=0,
+                        help="Models per worker process (default: balanced across workers)")
+    parser.add_argument("--retries", type=int, default=2,
+                        help="Times a model is retried after crashing its worker")
+    parser.add_argument("--timeout", type=float, default=0.0,
+                        help="Seconds before a worker process is killed (0 for no limit)")
+    parser.add_argument("--ytyp-name", help="Name of the merged YTYP (no merge if omitted)")
+    parser.add_argument("--max-archetypes", type=int, default=0,
+                        help="Split the merged YTYP after this many archetypes (0 for no limit)")
+    parser.add_argument("--blender", default=bpy.app.binary_path, help="Blender executable for the workers")
+    parser.epilog = "Options after --worker-args are passed to every cli.py worker, e.g. --worker-args --config convert.json"
+    return parser
+
+
+def split_chunks(items: List[str], workers: int, chunk_size: int = 0) -> List[List[str]]:
+    """Split items into chunks for the workers.
+
+    Without an explicit size, every worker gets about four chunks so a slow
+    chunk does not leave the other workers idle at the end of the run.
+    """
+    if not items:
+        return []
+    if chunk_size <= 0:
+        chunk_size = max(1, math.ceil(len(items) / (max(1, workers) * 4)))
+    return [items[i:i + chunk_size] for i in range(0, len(items), chunk_size)]
+
+
+class FarmCoordinator:
+    """Runs the conversion of a model list across worker processes.
+
+    Attributes:
+        args: Parsed farm arguments
+        worker_args: Extra arguments passed to every cli.py worker
+    """
+
+    def __init__(self, args: argparse.Namespace, worker_args: List[str]):
+        """Initialize the coordinator with its arguments."""
+        self.args = args
+        self.worker_args = worker_args
+        self._package = __package__
+
+    def _worker_command(self, file_list: str, report: str) -> List[str]:
+        """Build the Blender command line of a worker process."""
+        expr = f"import sys; from {self._package} import cli; sys.exit(cli.main())"
+        command = [
+            self.args.blender, "-b", "--python-exit-code", "1", "--python-expr", expr, "--",
+            "--input", os.path.abspath(self.args.input),
+            "--output", os.path.abspath(self.args.output),
+            "--files-from", file_list,
+            "--report", report,
+        ]
+        command.extend(self.worker_args)
+        # The YTYP merge reads CodeWalker XML, make sure the workers write it
+        if self.args.ytyp_name and "--format" in self.worker_args and "xml" not in self.worker_args:
+            command.extend(["--format", "xml"])
+        return command
+
+    def _run_process(self, files: List[str], workdir: str, stats: WorkerStats):
+        """Run one worker process over files.
+
+        The worker output goes to farm_logs/ in the output directory.
+
+        Returns:
+            The report records the worker wrote before exiting
+        """
+        fd, file_list = tempfile.mkstemp(suffix=".txt", dir=workdir)
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            f.write("\n".join(files))
+        report = file_list[:-4] + ".jsonl"
+
+        log_dir = os.path.join(os.path.abspath(self.args.output), "farm_logs")
+        os.makedirs(log_dir, exist_ok=True)
+        log_path = os.path.join(log_dir, f"worker{stats.slot}_{stats.processes}.log")
+
+        stats.processes += 1
+        start = time.perf_counter()
+        with open(log_path, 'w', encoding='utf-8') as log:
+            try:
+                subprocess.run(
+                    self._worker_command(file_list, report),
+                    stdout=log,
+                    stderr=subprocess.STDOUT,
+                    timeout=self.args.timeout or None,
+                )
+            except subprocess.TimeoutExpired:
+                print(f"[FARM] Worker {stats.slot} timed out, see {log_path}")
+        stats.busy_seconds += time.perf_counter() - start
+
+        records = []
+        if os.path.exists(report):
+            with open(report, 'r', encoding='utf-8') as f:
+                for line in f:
+                    try:
+                        records.append(json.loads(line))
+                    except json.JSONDecodeError:
+                        pass  # Truncated line from a crash
+        return records
+
+    def _run_chunk(self, chunk: List[str], workdir: str, slots: "queue.Queue[WorkerStats]") -> List[Dict[str, Any]]:
+        """Convert a chunk, restarting the worker after each crash."""
+        stats = slots.get()
+        try:
+            pending = list(chunk)
+            crash_counts: Dict[str, int] = {}
+            records = []
+            while pending:
+                done = self._run_process(pending, workdir, stats)
+                done_sources = {record["source"] for record in done}
+                for record in done:
+                    record["worker"] = stats.slot
+                    if record["success"]:
+                        stats.converted += 1
+                    else:
+                        stats.failed += 1
+                records.extend(done)
+                pending = [path for path in pending if os.path.abspath(path) not in done_sources]
+
+                if not pending:
+                    break
+
+                # Unreported models left: the worker died on the first of them
+                stats.crashes += 1
+                suspect = pending[0]
+                crash_counts[suspect] = crash_counts.get(suspect, 0) + 1
+                print(f"[FARM] Worker {stats.slot} crashed on {suspect} (attempt {crash_counts[suspect]})")
+                if crash_counts[suspect] > self.args.retries:
+                    records.append(self._failed_record(suspect, "worker crashed", stats))
+                    pending.pop(0)
+            return records
+        finally:
+            slots.put(stats)
+
+    @staticmethod
+    def _failed_record(path: str, error: str, stats: WorkerStats) -> Dict[str, Any]:
+        """Build the report record of a model that never completed."""
+        stats.failed += 1
+        return {
+            "source": os.path.abspath(path),
+            "output_dir": None,
+            "success": False,
+            "archetypes": [],
+            "seconds": 0.0,
+            "error": error,
+            "worker": stats.slot,
+        }
+
+    def run(self, sources: List[str]) -> FarmReport:
+        """Convert the sources and merge the resulting YTYPs.
+
+        Args:
+            sources: Paths of the models to convert
+
+        Returns:
+            The farm report
+        """
+        start = time.perf_counter()
+        report = FarmReport()
+        workers = max(1, self.args.workers)
+        chunks = split_chunks(sources, workers, self.args.chunk_size)
+
+        slots: "queue.Queue[WorkerStats]" = queue.Queue()
+        for slot in range(workers):
+            stats = WorkerStats(slot)
+            report.workers.append(stats)
+            slots.put(stats)
+
+        with tempfile.TemporaryDirectory(prefix="propconverter_farm_") as workdir:
+            # Threads only wait on the worker processes, the work happens in Blender
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                futures = [executor.submit(self._run_chunk, chunk, workdir, slots) for chunk in chunks]
+                for future in futures:
+                    report.records.extend(future.result())
+
+        if self.args.ytyp_name:
+            ytyp_files = []
+            for record in report.records:
+                if record["success"] and record["output_dir"] and os.path.isdir(record["output_dir"]):
+                    ytyp_files.extend(
+                        os.path.join(record["output_dir"], filename)
+                        for filename in sorted(os.listdir(record["output_dir"]))
+                        if filename.lower().endswith(".ytyp.xml")
+                    )
+            report.ytyp_files = merge_ytyp_files(
+                ytyp_files,
+                os.path.abspath(self.args.output),
+                self.args.ytyp_name,
+                self.args.max_archetypes,
+            )
+
+        report.seconds = time.perf_counter() - start
+        return report
+
+
+def print_summary(report: FarmReport) -> None:
+    """Print the per-worker throughput summary of a farm run."""
+    converted = sum(1 for record in report.records if record["success"])
+    print(f"[FARM] {converted}/{len(report.records)} models converted in {report.seconds:.1f}s")
+    for stats in report.workers:
+        print(
+            f"[FARM]   worker {stats.slot}: {stats.converted} converted, {stats.failed} failed, "
+            f"{stats.processes} processes, {stats.crashes} crashes, "
+            f"{stats.busy_seconds:.1f}s busy, {stats.models_per_minute:.1f} models/min"
+        )
+    for record in report.records:
+        if not record["success"]:
+            print(f"[FARM]   FAILED: {record['source']} {record.get('error', '')}")
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Run the conversion farm.
+
+    Args:
+        argv: Script arguments (defaults to the arguments after '--')
+
+    Returns:
+        0 if every model was converted, 1 otherwise
+    """
+    argv = get_script_args(argv)
+    worker_args = []
+    if "--worker-args" in argv:
+        index = argv.index("--worker-args")
+        argv, worker_args = argv[:index], argv[index + 1:]
+
+    args = build_parser().parse_args(argv)
+    sources = find_source_models(os.path.abspath(args.input), args.recursive)
+    print(f"[FARM] {len(sources)} source model(s), {args.workers} worker(s)")
+
+    report = FarmCoordinator(args, worker_args).run(sources)
+    print_summary(report)
+
+    summary_path = os.path.join(os.path.abspath(args.output), "farm_summary.json")
+    os.makedirs(os.path.dirname(summary_path), exist_ok=True)
+    with open(summary_path, 'w', encoding='utf-8') as f:
+        json.dump({
+            "seconds": report.seconds,
+            "records": report.records,
+            "workers": [dict(vars(stats), models_per_minute=stats.models_per_minute) for stats in report.workers],
+            "ytyp_files": report.ytyp_files,
+        }, f, indent=2)
+
+    return 0 if all(record["success"] for record in report.records) else 1
@@ -1,10 +1,12 @@
 # Operators module
 from .convert_operator import PROPCONVERTER_OT_convert_to_gtav
+from .batch_convert_operator import PROPCONVERTER_OT_convert_batch
 from .paint_operator import PROPCONVERTER_OT_paint_vertex_colors
 from .export_operator import PROPCONVERTER_OT_export_prop
 
 classes = [
     PROPCONVERTER_OT_convert_to_gtav,
+    PROPCONVERTER_OT_convert_batch,
     PROPCONVERTER_OT_paint_vertex_colors,
     PROPCONVERTER_OT_export_prop,
 ]
@@ -0,0 +1,29 @@
+import bpy
+from ..services.conversion_service import ConversionService
+from ..services.conversion_cache import ConversionCache
+from .. import logger
+
+
+class PROPCONVERTER_OT_convert_batch(bpy.types.Operator):
+    """Convert every selected mesh to GTA V"""
+    bl_idname = "propconverter.convert_batch"
+    bl_label = "Convert Selected to GTA V"
+    bl_options = {"REGISTER", "UNDO"}
+    
+    def execute(self, context):
+        # Check if in Object Mode
+        if context.mode != 'OBJECT':
+            logger.log_error("messages.error.switch_to_object_mode", operator=self)
+            return {"FINISHED"}
+        
+        objects = [obj for obj in context.selected_objects if obj.type == "MESH"]
+        if not objects:
+            logger.log_error("messages.error.select_mesh", operator=self)
+            return {"FINISHED"}
+        
+        # Props current in the manifest of the last export are skipped
+        props = getattr(context.scene, "prop_converter", None)
+        directory = bpy.path.abspath(props.export_directory) if props and props.export_directory else ""
+        cache = ConversionCache(directory) if directory else None
+        ConversionService().convert_batch(context, objects, operator=self, cache=cache)
+        return {"FINISHED"}
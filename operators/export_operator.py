@@ -1,7 +1,7 @@
 import bpy
 from .. import i18n
-from .. import logger
-from ..sollumz_integration import SollumzIntegration
+from ..services.export_service import ExportService
+from ..services.conversion_cache import ConversionCache
 
 # Get the root addon package name (handles both normal addons and Blender 5.0 extensions)
 ADDON_PACKAGE = __package__.split('.')[0] if '.' in __package__ else __package__
@@ -117,20 +117,6 @@ class PROPCONVERTER_OT_export_prop(bpy.types.Operator):
         return {"RUNNING_MODAL"}
 
     def execute(self, context):
-        if not self.directory:
-            logger.log_error("messages.error.no_directory", operator=self)
-            return {"CANCELLED"}
-
-        # Check if there's a YTYP to export
-        if len(context.scene.ytyps) == 0:
-            logger.log_error("messages.error.no_ytyp", operator=self)
-            return {"CANCELLED"}
-
-        # Check if there's a selected YTYP
-        if context.scene.ytyp_index < 0 or context.scene.ytyp_index >= len(context.scene.ytyps):
-            logger.log_error("messages.error.no_ytyp_selected", operator=self)
-            return {"CANCELLED"}
-
         # Collect format/version selections from operator properties
         formats_selected = set()
         if self.export_format_native:
@@ -144,51 +130,15 @@ class PROPCONVERTER_OT_export_prop(bpy.types.Operator):
         if self.target_version_gen9:
             versions_selected.add('GEN9')
 
-        if not formats_selected:
-            logger.log_error("messages.error.no_format", operator=self)
-            return {"CANCELLED"}
-        if not versions_selected:
-            logger.log_error("messages.error.no_version", operator=self)
-            return {"CANCELLED"}
-
-        # Get Sollumz preferences and temporarily set export options
-        try:
-            # Find Sollumz addon preferences using the integration service
-            sollumz = SollumzIntegration.get_instance()
-            sollumz_prefs = sollumz.get_preferences(context)
-            
-            if sollumz_prefs is None:
-                logger.log_error("messages.error.sollumz_addon_not_found", operator=self)
-                return {"CANCELLED"}
-            
-            # Store original settings to restore later
-            export_settings = sollumz_prefs.export_settings
-            original_formats = set(export_settings.target_formats)
-            original_versions = set(export_settings.target_versions)
-            
-            # Apply our custom settings temporarily
-            export_settings.target_formats = formats_selected
-            export_settings.target_versions = versions_selected
-            
-            try:
-                # Export YTYP first
-                result = bpy.ops.sollumz.export_ytyp_io(directory=self.directory)
-                if result != {"FINISHED"}:
-                    logger.log_warning("messages.warning.ytyp_export_warning", operator=self)
-                
-                # Export Drawable (YDR)
-                result = bpy.ops.sollumz.export_assets(directory=self.directory, direct_export=True)
-                if result != {"FINISHED"}:
-                    logger.log_warning("messages.warning.drawable_export_warning", operator=self)
-                    
-            finally:
-                # Restore original settings
-                export_settings.target_formats = original_formats
-                export_settings.target_versions = original_versions
-                
-        except Exception as e:
-            logger.log_error("messages.error.export_failed", operator=self, error=str(e))
+        service = ExportService()
+        if not service.export(context, self.directory, formats_selected, versions_selected, operator=self):
             return {"CANCELLED"}
 
-        logger.log_info("messages.info.export_success", operator=self, directory=self.directory)
+        # Record the exported drawables, so the next batch conversion skips them
+        cache = ConversionCache(bpy.path.abspath(self.directory))
+        if cache.update_from_objects(context.selected_objects):
+            cache.save()
+        props = getattr(context.scene, "prop_converter", None)
+        if props:
+            props.export_directory = self.directory
         return {"FINISHED"}
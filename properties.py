@@ -81,6 +81,12 @@ class PROPCONVERTER_Properties(bpy.types.PropertyGroup):
         type=bpy.types.Object
     )
 
+    export_directory: bpy.props.StringProperty(
+        name="Export Directory",
+        description="Directory of the last export, whose manifest lets batch conversion skip unchanged props",
+        subtype="DIR_PATH",
+    )
+
     vertex_color: bpy.props.FloatVectorProperty(
         name="Vertex Color",
         description="Color used to paint vertices on the original mesh",
@@ -138,6 +144,49 @@ class PROPCONVERTER_Properties(bpy.types.PropertyGroup):
         default=80.0,
     )
 
+    enable_collision_budget: bpy.props.BoolProperty(
+        name="Collision Budget",
+        description="Find the decimate ratio or remesh voxel size meeting a triangle budget or a deviation limit, instead of the manual settings",
+        default=False,
+    )
+
+    budget_method: bpy.props.EnumProperty(
+        name="Budget Method",
+        description="Simplification searched to meet the budget",
+        items=[
+            ('DECIMATE', "Decimate", "Search the collapse ratio"),
+            ('REMESH', "Remesh", "Search the voxel size"),
+        ],
+        default='DECIMATE',
+    )
+
+    budget_target: bpy.props.EnumProperty(
+        name="Budget Target",
+        description="Budget the collision mesh must meet",
+        items=[
+            ('TRIANGLES', "Triangles", "Keep the collision under a triangle count"),
+            ('DEVIATION', "Deviation", "Simplify as much as possible within a distance of the original mesh"),
+        ],
+        default='TRIANGLES',
+    )
+
+    budget_triangles: bpy.props.IntProperty(
+        name="Max Triangles",
+        description="Largest number of collision triangles",
+        min=4,
+        max=1000000,
+        default=500,
+    )
+
+    budget_max_deviation: bpy.props.FloatProperty(
+        name="Max Deviation",
+        description="Largest distance between the collision and the original mesh surfaces",
+        min=0.0001,
+        max=10.0,
+        default=0.05,
+        subtype='DISTANCE',
+    )
+
     enable_remesh: bpy.props.BoolProperty(
         name="Enable Remesh",
         description="Apply remesh modifier to collision mesh",
@@ -192,6 +241,166 @@ class PROPCONVERTER_Properties(bpy.types.PropertyGroup):
         default=False,
     )
 
+    enable_weld: bpy.props.BoolProperty(
+        name="Weld Vertices",
+        description="Merge coincident vertices and remove degenerate and duplicate faces before converting",
+        default=False,
+    )
+
+    weld_distance: bpy.props.FloatProperty(
+        name="Weld Distance",
+        description="Vertices closer than this snap to the same point",
+        min=0.000001,
+        max=1.0,
+        default=0.0001,
+        precision=6,
+        subtype='DISTANCE',
+    )
+
+    enable_ambient_occlusion: bpy.props.BoolProperty(
+        name="Ambient Occlusion",
+        description="Bake ambient occlusion into the vertex colors after painting them",
+        default=False,
+    )
+
+    ao_samples: bpy.props.IntProperty(
+        name="AO Samples",
+        description="Rays cast per face corner (more = smoother, slower)",
+        min=1,
+        max=512,
+        default=32,
+    )
+
+    ao_distance: bpy.props.FloatProperty(
+        name="AO Distance",
+        description="Maximum distance at which geometry occludes a corner",
+        min=0.001,
+        max=100.0,
+        default=1.0,
+        subtype='DISTANCE',
+    )
+
+    ao_strength: bpy.props.FloatProperty(
+        name="AO Strength",
+        description="How much the occlusion darkens the vertex colors",
+        min=0.0,
+        max=1.0,
+        default=1.0,
+    )
+
+    ao_channel: bpy.props.EnumProperty(
+        name="AO Channel",
+        description="Vertex color channel receiving the occlusion",
+        items=[
+            ('RGB', "RGB", "Multiply the vertex color by the occlusion"),
+            ('R', "Red", "Write the occlusion to the red channel"),
+            ('G', "Green", "Write the occlusion to the green channel"),
+            ('B', "Blue", "Write the occlusion to the blue channel"),
+            ('A', "Alpha", "Write the occlusion to the alpha channel"),
+        ],
+        default='RGB',
+    )
+
+    enable_lods: bpy.props.BoolProperty(
+        name="Generate LODs",
+        description="Build Medium, Low and Very Low LODs by decimating the drawable, and derive the LOD distances from its size",
+        default=False,
+    )
+
+    lod_ratio_medium: bpy.props.FloatProperty(
+        name="Medium Ratio",
+        description="Ratio of triangles kept in the Medium LOD",
+        min=0.01,
+        max=1.0,
+        default=0.5,
+        subtype='FACTOR',
+    )
+
+    lod_ratio_low: bpy.props.FloatProperty(
+        name="Low Ratio",
+        description="Ratio of triangles kept in the Low LOD",
+        min=0.01,
+        max=1.0,
+        default=0.25,
+        subtype='FACTOR',
+    )
+
+    lod_ratio_very_low: bpy.props.FloatProperty(
+        name="Very Low Ratio",
+        description="Ratio of triangles kept in the Very Low LOD",
+        min=0.01,
+        max=1.0,
+        default=0.1,
+        subtype='FACTOR',
+    )
+
+    enable_model_split: bpy.props.BoolProperty(
+        name="Split Large Models",
+        description="Split drawable models with more than 65535 vertices in a material into several models, by material and then spatially",
+        default=True,
+    )
+
+    enable_auto_divide: bpy.props.BoolProperty(
+        name="Auto Divide",
+        description="Split meshes larger than the chunk size into grid chunks, each exported as its own drawable with a standalone collision",
+        default=False,
+    )
+
+    divide_chunk_size: bpy.props.FloatProperty(
+        name="Chunk Size",
+        description="Edge length of a grid chunk",
+        min=1.0,
+        max=10000.0,
+        default=50.0,
+        subtype='DISTANCE',
+    )
+
+    enable_primitive_fitting: bpy.props.BoolProperty(
+        name="Primitive Bounds",
+        description="Use box, sphere, capsule or cylinder bounds when they match the collision mesh, instead of a BVH",
+        default=False,
+    )
+
+    primitive_tolerance: bpy.props.FloatProperty(
+        name="Tolerance",
+        description="Largest distance between a collision mesh vertex and the fitted primitive surface",
+        min=0.0,
+        max=1.0,
+        default=0.02,
+        subtype='DISTANCE',
+    )
+
+    primitive_max_count: bpy.props.IntProperty(
+        name="Max Primitives",
+        description="Largest number of primitives (one per separate part) before falling back to a BVH",
+        min=1,
+        max=64,
+        default=8,
+    )
+
+    enable_convex_decomposition: bpy.props.BoolProperty(
+        name="Convex Decomposition",
+        description="Build the collision from convex hulls (Bound Geometry) instead of a BVH of every polygon",
+        default=False,
+    )
+
+    convex_max_hulls: bpy.props.IntProperty(
+        name="Max Hulls",
+        description="Largest number of convex hulls for the collision",
+        min=1,
+        max=64,
+        default=8,
+    )
+
+    convex_volume_error: bpy.props.FloatProperty(
+        name="Volume Error",
+        description="Allowed hull volume in excess of the mesh volume, relative to its convex hull (lower = more hulls)",
+        min=0.0,
+        max=1.0,
+        default=0.05,
+        subtype='FACTOR',
+    )
+
     use_default_flags: bpy.props.BoolProperty(
         name="Use Default Flags",
         description="Apply default collision flags (NOT CLIMBABLE, NOT COVER, TOO STEEP FOR PLAYER)",
@@ -4,6 +4,15 @@ This package contains service classes that coordinate complex workflows
 and business logic, following the Single Responsibility Principle.
 """
 
-from .conversion_service import ConversionService
+from .conversion_service import ConversionService, ConversionResult
+from .export_service import ExportService
+from .conversion_cache import ConversionCache
+from .instrumentation import ConversionProfiler
 
-__all__ = ['ConversionService']
+__all__ = [
+    'ConversionService',
+    'ConversionResult',
+    'ExportService',
+    'ConversionCache',
+    'ConversionProfiler',
+]
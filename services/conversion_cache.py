@@ -0,0 +1,116 @@
+"""Persistent conversion cache for PropConverter-V.
+
+The cache is a JSON manifest stored next to the exported assets. It maps each
+prop to the digest of its source mesh and conversion settings, so props
+that have not changed since the last export can be skipped.
+
+The command line pipeline reads and writes the manifest of its output
+directory. In the UI, batch conversion tags every converted drawable with
+its digest, the export operator records the exported drawables in the
+manifest of the export directory, and the next batch conversion skips the
+props that are current in the manifest of the last export directory.
+"""
+
+import json
+import os
+import time
+from typing import Dict, Iterable, Optional
+
+
+class ConversionCache:
+    """Manifest of the prop digests exported to a directory.
+
+    Attributes:
+        directory: Directory holding the exported assets and the manifest
+        entries: Mapping of prop name to its manifest entry
+
+    Example:
+        >>> cache = ConversionCache(output_dir)
+        >>> if not cache.is_current("crate01", digest):
+        >>>     convert_and_export()
+        >>>     cache.update("crate01", digest)
+        >>>     cache.save()
+    """
+
+    MANIFEST_NAME = "propconverter_manifest.json"
+    MANIFEST_VERSION = 1
+
+    # Custom properties tagging a converted drawable with its manifest entry
+    NAME_PROPERTY = "propconverter_cache_name"
+    DIGEST_PROPERTY = "propconverter_digest"
+
+    def __init__(self, directory: str):
+        """Load the manifest of a directory (empty if it does not exist)."""
+        self.directory = directory
+        self.entries: Dict[str, Dict] = {}
+        self._load()
+
+    @property
+    def manifest_path(self) -> str:
+        """Full path of the manifest file."""
+        return os.path.join(self.directory, self.MANIFEST_NAME)
+
+    def _load(self) -> None:
+        """Read the manifest, ignoring a missing, corrupt or outdated file."""
+        if not os.path.exists(self.manifest_path):
+            return
+        try:
+            with open(self.manifest_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError) as e:
+            print(f"[CACHE] Ignoring unreadable manifest {self.manifest_path} - {e}")
+            return
+        if data.get("version") == self.MANIFEST_VERSION:
+            self.entries = data.get("entries", {})
+
+    def get_digest(self, name: str) -> Optional[str]:
+        """Return the recorded digest of a prop, or None if unknown."""
+        entry = self.entries.get(name)
+        return entry.get("digest") if entry else None
+
+    def is_current(self, name: str, digest: str) -> bool:
+        """Check whether a prop was already exported with this digest."""
+        return self.get_digest(name) == digest
+
+    def update(self, name: str, digest: str) -> None:
+        """Record the digest of an exported prop."""
+        self.entries[name] = {"digest": digest, "exported_at": time.time()}
+
+    @classmethod
+    def tag(cls, obj, name: str, digest: str) -> None:
+        """Tag a converted drawable with the manifest name and digest of its prop."""
+        obj[cls.NAME_PROPERTY] = name
+        obj[cls.DIGEST_PROPERTY] = digest
+
+    def update_from_objects(self, objects: Iterable) -> int:
+        """Record the digests tagged on exported drawables (see tag).
+
+        Objects inside a drawable (its models) record the tagged drawable
+        they belong to, found through their parents.
+
+        Returns:
+            Number of props recorded
+        """
+        recorded = set()
+        for obj in objects:
+            while obj is not None and obj.get(self.DIGEST_PROPERTY) is None:
+                obj = obj.parent
+            if obj is None:
+                continue
+            name, digest = obj.get(self.NAME_PROPERTY), obj.get(self.DIGEST_PROPERTY)
+            if isinstance(name, str) and isinstance(digest, str) and name not in recorded:
+                self.update(name, digest)
+                recorded.add(name)
+        return len(recorded)
+
+    def remove(self, name: str) -> None:
+        """Forget a prop, forcing its next conversion."""
+        self.entries.pop(name, None)
+
+    def save(self) -> None:
+        """Write the manifest atomically."""
+        os.makedirs(self.directory, exist_ok=True)
+        tmp_path = self.manifest_path + ".tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({"version": self.MANIFEST_VERSION, "entries": self.entries}, f, indent=2, sort_keys=True)
+        os.replace(tmp_path, self.manifest_path)
@@ -5,21 +5,67 @@ delegating to specialized modules for each step while maintaining
 clean separation of concerns.
 """
 
-from typing import Optional, Tuple
+from dataclasses import dataclass
+from typing import Iterable, List, Optional, Tuple
 import bpy
+from mathutils import Vector
 from ..sollumz_integration import SollumzIntegration
 from ..validators.mesh_validator import MeshValidator
-from ..core.mesh_prep import duplicate_and_prepare_mesh
+from ..conversion_settings import ConversionSettings
+from .conversion_cache import ConversionCache
+from .instrumentation import ConversionProfiler
+from ..core.mesh_prep import (
+    duplicate_and_prepare_mesh,
+    divide_mesh,
+    weld_vertices,
+    invalidate_snapshot,
+    clear_snapshots
+)
 from ..core.conversion import (
     convert_collision,
     convert_drawable,
     convert_materials,
+    resolve_shader_index,
     create_ytyp,
-    create_archetype
+    create_archetype,
+    compute_prop_digest,
+    attach_lods,
+    split_oversized_models
 )
 from ..core.mesh_prep.paint_vertex_colors import paint_vertex_colors
+from ..core.mesh_prep.bake_ambient_occlusion import bake_ambient_occlusion
+from ..core.operator_context import run_with_objects, select_objects
 from .. import logger
 from .. import constants
+from .. import i18n
+
+
+@dataclass
+class ConversionResult:
+    """Outcome of converting a single object.
+    
+    Attributes:
+        name: Name of the object before conversion
+        success: True if the object was converted
+        error_key: Translation key of the failure reason, or None on success
+        drawable: The resulting Drawable object (its model if no parent was created)
+        ytyp_index: Index of the YTYP created for this object in scene.ytyps
+        digest: Digest of the source mesh and settings (None if validation failed)
+        skipped: True if the object was unchanged in the cache and not converted
+        source: Name of the object this chunk was divided from (None if not divided)
+        collision: Standalone collision composite (None when embedded in the drawable)
+        offset: World-space center of the chunk before it was moved to the origin
+    """
+    name: str
+    success: bool
+    error_key: Optional[str] = None
+    drawable: Optional[bpy.types.Object] = None
+    ytyp_index: int = -1
+    digest: Optional[str] = None
+    skipped: bool = False
+    source: Optional[str] = None
+    collision: Optional[bpy.types.Object] = None
+    offset: Tuple[float, float, float] = (0.0, 0.0, 0.0)
 
 
 class ConversionService:
@@ -32,6 +78,7 @@ class ConversionService:
     Attributes:
         sollumz: Sollumz integration service instance
         validator: Mesh validator instance
+        profiler: Per-stage timing and counter records
     
     Example:
         >>> service = ConversionService()
@@ -39,10 +86,16 @@ class ConversionService:
         >>>     print("Conversion successful!")
     """
     
-    def __init__(self):
-        """Initialize the conversion service with required dependencies."""
+    def __init__(self, profiler: Optional[ConversionProfiler] = None):
+        """Initialize the conversion service with required dependencies.
+        
+        Args:
+            profiler: Profiler receiving the stage records (a new one if None),
+                pass a shared one to collect records across service instances
+        """
         self.sollumz = SollumzIntegration.get_instance()
         self.validator = MeshValidator()
+        self.profiler = profiler if profiler is not None else ConversionProfiler()
     
     def convert_to_gtav(
         self,
@@ -60,76 +113,376 @@ class ConversionService:
         4. Convert drawable to Sollumz drawable with models
         5. Convert materials to selected shader
         6. Apply vertex colors
-        7. Create YTYP and archetype entries
+        7. Generate the lower LODs (when enabled)
+        8. Create YTYP and archetype entries
         
         Args:
             context: Blender context containing scene and object information
             operator: Optional operator instance for progress reporting
-            
+        
         Returns:
             True if conversion succeeded, False otherwise
-            
+        
         Example:
             >>> service = ConversionService()
             >>> success = service.convert_to_gtav(context, self)
             >>> return {'FINISHED'} if success else {'CANCELLED'}
         """
+        active = context.active_object
+        prop = active.name if active else ""
+        
         # Stage 1: Validate
-        is_valid, obj = self.validator.validate_for_conversion(context, operator)
+        with self.profiler.stage(prop, "validate", active):
+            is_valid, obj = self.validator.validate_for_conversion(context, operator)
         if not is_valid:
             return False
         
+        settings = ConversionSettings.from_context(context)
+        with self.profiler.stage(prop, "validate_mesh", obj):
+            error_key, _ = self.validator.validate_mesh_deep(
+                obj, settings.strict_validation, check_vertex_limit=not settings.enable_model_split
+            )
+        if error_key:
+            logger.log_error(error_key, operator=operator)
+            return False
+        
         # Stage 2: Check Sollumz availability
+        with self.profiler.stage(prop, "sollumz_check"):
+            mod_name = self._resolve_sollumz(operator)
+        if not mod_name:
+            return False
+        
+        parts = self._divide_object(context, obj, settings, operator)
+        converted = []
+        for part in parts:
+            error_key, collision = self._convert_object(
+                context, part, mod_name, settings, operator, embed_collision=len(parts) == 1
+            )
+            if error_key:
+                logger.log_error(error_key, operator=operator)
+                return False
+            converted.append(part.parent or part)
+            if collision is not None:
+                converted.append(collision)
+        
+        # The stages leave the selection alone: select the result for export
+        select_objects(context, converted)
+        return True
+    
+    def convert_batch(
+        self,
+        context: bpy.types.Context,
+        objects: Iterable[bpy.types.Object],
+        operator: Optional[bpy.types.Operator] = None,
+        settings: Optional[ConversionSettings] = None,
+        cache: Optional[ConversionCache] = None
+    ) -> List[ConversionResult]:
+        """Convert several meshes to GTA V props in a single run.
+        
+        Every object is validated first (including the deep geometry
+        checks), so bad inputs are reported before any conversion starts.
+        Sollumz is resolved and the settings (including the shader index)
+        are read once for the whole batch. Each object then goes through the
+        same stages as convert_to_gtav. A failing object is reported and
+        skipped, it never aborts the rest of the batch.
+        
+        With auto divide enabled, an oversized object is split into chunks
+        that are converted separately, each with a standalone collision.
+        
+        With a cache, objects whose digest matches the manifest are skipped
+        entirely. The caller records the new digests once the props are
+        exported (see ConversionCache.update). Converted drawables of
+        undivided objects are tagged with their digest (see
+        ConversionCache.tag), so the export operator can record them.
+        
+        Args:
+            context: Blender context
+            objects: Mesh objects to convert
+            operator: Optional operator instance for progress reporting
+            settings: Conversion settings (read from the context if None)
+            cache: Optional manifest of already exported props
+        
+        Returns:
+            One ConversionResult per input object (one per chunk for a
+            divided object), in input order
+        
+        Example:
+            >>> service = ConversionService()
+            >>> results = service.convert_batch(context, context.selected_objects)
+            >>> failed = [r.name for r in results if not r.success]
+        """
+        # Capture the objects up front: conversion changes selection and parenting
+        objects = [obj for obj in objects if obj is not None]
+        names = [obj.name for obj in objects]
+        
+        if context.mode != 'OBJECT':
+            logger.log_error("messages.error.switch_to_object_mode", operator=operator)
+            return [ConversionResult(name, False, "messages.error.switch_to_object_mode") for name in names]
+        
+        settings = ConversionSettings.from_context_or(context, settings)
+        
+        # Validate every object before the Sollumz stages, so a batch fails fast
+        validation_errors = {}
+        for obj, name in zip(objects, names):
+            with self.profiler.stage(name, "validate", obj):
+                error_key = self.validator.validate_batch_object(obj)
+                if error_key is None:
+                    error_key, _ = self.validator.validate_mesh_deep(
+                        obj, settings.strict_validation, check_vertex_limit=not settings.enable_model_split
+                    )
+            validation_errors[name] = error_key
+            invalidate_snapshot(obj.data)
+        invalid = sum(1 for error_key in validation_errors.values() if error_key)
+        if invalid:
+            logger.log_warning("messages.warning.batch_invalid", operator=operator, count=invalid)
+        
+        with self.profiler.stage("", "sollumz_check"):
+            mod_name = self._resolve_sollumz(operator)
+        if not mod_name:
+            return [ConversionResult(name, False, "messages.error.sollumz_not_found") for name in names]
+        
+        with self.profiler.stage("", "resolve_shader"):
+            shader_index = resolve_shader_index(context, settings.shader_index, settings.shader_name)
+        if shader_index is None:
+            logger.log_error('messages.error.material_failed', operator=operator)
+            return [ConversionResult(name, False, "messages.error.material_failed") for name in names]
+        settings.shader_index = shader_index
+        catalog = SollumzIntegration.get_instance().get_shader_catalog()
+        shader = catalog.get(shader_index) if catalog else None
+        shader_key = shader.filename if shader else str(shader_index)
+        
+        results = []
+        for obj, name in zip(objects, names):
+            error_key = validation_errors[name]
+            digest = None
+            if error_key is None:
+                with self.profiler.stage(name, "digest", obj):
+                    digest = compute_prop_digest(obj, settings, shader_key)
+                if cache is not None and cache.is_current(name, digest):
+                    print(f"[CACHE] {name} is unchanged, skipping conversion")
+                    results.append(ConversionResult(name, True, digest=digest, skipped=True))
+                    continue
+            
+            if error_key:
+                logger.log_error(
+                    'messages.error.batch_item_failed',
+                    name=name,
+                    reason=i18n.t(error_key)
+                )
+                results.append(ConversionResult(name, False, error_key, digest=digest))
+                continue
+            
+            parts = self._divide_object(context, obj, settings, operator)
+            divided = len(parts) > 1
+            for part in parts:
+                part_name = part.name
+                offset = self._world_center(part) if divided else (0.0, 0.0, 0.0)
+                try:
+                    error_key, collision = self._convert_object(
+                        context, part, mod_name, settings, operator,
+                        shader_index=shader_index, embed_collision=not divided
+                    )
+                except Exception as e:
+                    print(f"[ERROR] Unexpected failure converting {part_name} - {e}")
+                    import traceback
+                    traceback.print_exc()
+                    error_key, collision = "messages.error.conversion_failed", None
+                
+                source = name if divided else None
+                if error_key:
+                    logger.log_error(
+                        'messages.error.batch_item_failed',
+                        name=part_name,
+                        reason=i18n.t(error_key)
+                    )
+                    results.append(ConversionResult(part_name, False, error_key, digest=digest, source=source))
+                else:
+                    drawable = part.parent if part.parent else part
+                    # Chunks are left untagged: their source is only current
+                    # once every chunk is exported
+                    if not divided:
+                        ConversionCache.tag(drawable, name, digest)
+                    results.append(ConversionResult(
+                        part_name, True, drawable=drawable, ytyp_index=context.scene.ytyp_index,
+                        digest=digest, source=source, collision=collision, offset=offset
+                    ))
+        
+        succeeded = sum(1 for r in results if r.success and not r.skipped)
+        skipped = sum(1 for r in results if r.skipped)
+        logger.log_info(
+            'messages.info.batch_summary',
+            operator=operator,
+            succeeded=succeeded,
+            failed=len(results) - succeeded - skipped
+        )
+        if skipped:
+            logger.log_info('messages.info.batch_skipped', operator=operator, skipped=skipped)
+        
+        # The stages leave the selection alone: select the results for export
+        converted = [r.drawable for r in results if r.success and r.drawable is not None]
+        converted += [r.collision for r in results if r.success and r.collision is not None]
+        if converted:
+            select_objects(context, converted)
+        return results
+    
+    def _resolve_sollumz(
+        self,
+        operator: Optional[bpy.types.Operator]
+    ) -> Optional[str]:
+        """Check Sollumz availability and return its module name.
+        
+        Args:
+            operator: Optional operator for error reporting
+        
+        Returns:
+            The Sollumz module name, or None if Sollumz is not available
+        """
         if not self.sollumz.is_available():
             logger.log_error('messages.error.sollumz_not_found', operator=operator)
-            return False
+            return None
         
         mod_name = self.sollumz.get_module_name()
         if not mod_name:
             logger.log_error('messages.error.sollumz_not_found', operator=operator)
-            return False
-        
-        # Stage 3: Prepare mesh
-        original_name, collision_obj = self._prepare_mesh(context, obj, operator)
-        if not collision_obj:
-            return False
+            return None
         
-        # Stage 4: Convert collision
-        composite_obj = convert_collision(context, collision_obj, mod_name)
-        if composite_obj is None:
-            logger.log_error('messages.error.collision_failed', operator=operator)
-            return False
+        return mod_name
+    
+    def _divide_object(
+        self,
+        context: bpy.types.Context,
+        obj: bpy.types.Object,
+        settings: ConversionSettings,
+        operator: Optional[bpy.types.Operator]
+    ) -> List[bpy.types.Object]:
+        """Split an oversized object into grid chunks when auto divide is on.
         
-        # Stage 5: Convert drawable
-        model_objs, drawable_parent = convert_drawable(context, obj, composite_obj)
-        if not model_objs:
-            logger.log_error('messages.error.drawable_failed', operator=operator)
-            return False
+        Args:
+            context: Blender context
+            obj: The validated mesh object (removed if it gets divided)
+            settings: Conversion settings
+            operator: Optional operator for progress reporting
         
-        # Stage 6: Convert materials
-        if not convert_materials(context, model_objs, mod_name, original_name):
-            logger.log_error('messages.error.material_failed', operator=operator)
-            return False
+        Returns:
+            The chunk objects, or [obj] if the object was not divided
+        """
+        if not settings.enable_auto_divide:
+            return [obj]
         
-        # Stage 7: Apply vertex colors
-        self._apply_vertex_colors(context, operator)
+        name = obj.name
+        with self.profiler.stage(name, "divide_mesh", obj):
+            parts = divide_mesh(context, obj, settings.divide_chunk_size)
+        if len(parts) > 1:
+            logger.log_info('messages.info.object_divided', operator=operator, name=name, count=len(parts))
+        return parts
+    
+    @staticmethod
+    def _world_center(obj: bpy.types.Object) -> Tuple[float, float, float]:
+        """Return the world-space center of an object's bounding box."""
+        center = sum((Vector(corner) for corner in obj.bound_box), Vector()) / 8.0
+        return tuple(obj.matrix_world @ center)
+    
+    def _convert_object(
+        self,
+        context: bpy.types.Context,
+        obj: bpy.types.Object,
+        mod_name: str,
+        settings: ConversionSettings,
+        operator: Optional[bpy.types.Operator],
+        shader_index: Optional[int] = None,
+        embed_collision: bool = True
+    ) -> Tuple[Optional[str], Optional[bpy.types.Object]]:
+        """Run the conversion stages for a single validated mesh.
         
-        # Stage 8: Create YTYP and Archetype
-        if not create_ytyp(context, original_name):
-            logger.log_error('messages.error.ytyp_failed', operator=operator)
-            return False
+        Args:
+            context: Blender context
+            obj: The validated mesh object
+            mod_name: Sollumz module name
+            settings: Conversion settings
+            operator: Optional operator for error reporting
+            shader_index: Pre-resolved shader index (resolved per call if None)
+            embed_collision: Parent the collision composite to the drawable;
+                when False it is left standalone and exported as its own bound
         
-        if not create_archetype(context, obj, mod_name, original_name):
-            logger.log_error('messages.error.archetype_failed', operator=operator)
-            return False
+        Returns:
+            Tuple of (error_key, collision) where error_key is None on success,
+            otherwise the translation key of the failed stage, and collision is
+            the standalone composite (None when embedded or on failure)
+        """
+        prop = obj.name
+        stage = self.profiler.stage
         
-        return True
+        try:
+            with stage(prop, "total", obj):
+                # Stage 3: Weld vertices and drop degenerate and duplicate faces
+                if settings.enable_weld:
+                    with stage(prop, "weld_vertices", obj):
+                        removed = weld_vertices(obj, settings.weld_distance)
+                    logger.log_info('messages.info.mesh_cleaned', operator=operator, name=prop, **removed)
+                
+                # Stage 4: Prepare mesh
+                with stage(prop, "prepare_mesh", obj):
+                    original_name, collision_obj = self._prepare_mesh(context, obj, settings)
+                if not collision_obj:
+                    return 'messages.error.duplicate_failed', None
+                
+                # Stage 5: Convert collision
+                with stage(prop, "convert_collision", collision_obj):
+                    composite_obj = convert_collision(context, collision_obj, mod_name, settings)
+                if composite_obj is None:
+                    return 'messages.error.collision_failed', None
+                
+                # Stage 6: Convert drawable
+                with stage(prop, "convert_drawable", obj):
+                    embedded = composite_obj if embed_collision else None
+                    model_objs, drawable_parent = convert_drawable(context, obj, embedded)
+                if not model_objs:
+                    return 'messages.error.drawable_failed', None
+                
+                # Stage 7: Split models over the per-geometry vertex limit
+                if settings.enable_model_split:
+                    with stage(prop, "split_models", obj):
+                        model_objs = split_oversized_models(model_objs)
+                
+                # Stage 8: Convert materials
+                with stage(prop, "convert_materials", obj):
+                    materials_ok = convert_materials(context, model_objs, mod_name, original_name, settings, shader_index)
+                if not materials_ok:
+                    return 'messages.error.material_failed', None
+                
+                # Stage 9: Apply vertex colors
+                with stage(prop, "apply_vertex_colors", obj):
+                    for model_obj in model_objs:
+                        self._apply_vertex_colors(model_obj, settings)
+                
+                # Stage 10: Generate the lower LODs
+                lod_dist = None
+                if settings.enable_lods:
+                    with stage(prop, "generate_lods", obj):
+                        lod_dist = attach_lods(context, model_objs, drawable_parent, {
+                            'MEDIUM': settings.lod_ratio_medium,
+                            'LOW': settings.lod_ratio_low,
+                            'VERYLOW': settings.lod_ratio_very_low,
+                        })
+                
+                # Stage 11: Create YTYP and Archetype
+                with stage(prop, "create_ytyp_archetype", obj):
+                    if not create_ytyp(context, original_name):
+                        return 'messages.error.ytyp_failed', None
+                    
+                    if not create_archetype(context, obj, mod_name, original_name, lod_dist):
+                        return 'messages.error.archetype_failed', None
+            
+            return None, (None if embed_collision else composite_obj)
+        finally:
+            # Snapshots are only valid for the prop being converted
+            clear_snapshots()
     
     def _prepare_mesh(
         self,
         context: bpy.types.Context,
         obj: bpy.types.Object,
-        operator: Optional[bpy.types.Operator]
+        settings: ConversionSettings
     ) -> Tuple[str, Optional[bpy.types.Object]]:
         """Prepare mesh for conversion by resetting transforms and duplicating.
         
@@ -141,52 +494,47 @@ class ConversionService:
         Args:
             context: Blender context
             obj: The mesh object to prepare
-            operator: Optional operator for error reporting
-            
+            settings: Conversion settings
+        
         Returns:
             Tuple of (original_name, collision_mesh) where collision_mesh
             is None if preparation failed
         """
         # Reset transform to world origin
-        bpy.ops.object.select_all(action='DESELECT')
-        obj.select_set(True)
-        context.view_layer.objects.active = obj
-        bpy.ops.object.origin_set(type='ORIGIN_GEOMETRY', center='BOUNDS')
+        run_with_objects(context, bpy.ops.object.origin_set, [obj], type='ORIGIN_GEOMETRY', center='BOUNDS')
+        invalidate_snapshot(obj.data)
         obj.location = constants.DEFAULT_LOCATION
         obj.rotation_euler = constants.DEFAULT_ROTATION
         
         # Duplicate for collision
-        original_name, collision_obj = duplicate_and_prepare_mesh(context, obj)
+        original_name, collision_obj = duplicate_and_prepare_mesh(context, obj, settings)
         if not collision_obj:
-            logger.log_error('messages.error.duplicate_failed', operator=operator)
             return "", None
         
         return original_name, collision_obj
     
     def _apply_vertex_colors(
         self,
-        context: bpy.types.Context,
-        operator: Optional[bpy.types.Operator]
+        obj: bpy.types.Object,
+        settings: ConversionSettings
     ) -> None:
-        """Apply vertex colors to the original mesh based on user settings.
+        """Apply the configured vertex color to the converted mesh.
         
-        This method retrieves the original mesh reference from scene properties
-        and applies the configured vertex color to all vertices.
+        When enabled, ambient occlusion is baked on top of the painted color.
         
         Args:
-            context: Blender context
-            operator: Optional operator for warning reporting
+            obj: A drawable model (the original mesh object or a split part)
+            settings: Conversion settings
         """
-        props = getattr(context.scene, "prop_converter", None)
-        if not props:
-            return
-        
-        original_mesh_obj = props.original_mesh
-        if original_mesh_obj:
-            paint_col = getattr(props, "vertex_color", (1.0, 1.0, 1.0, 1.0))
-            paint_vertex_colors(original_mesh_obj, None, color=tuple(paint_col))
-        else:
-            logger.log_warning(
-                'messages.warning.original_mesh_not_found',
-                operator=operator
-            )
+        paint_vertex_colors(obj, None, color=tuple(settings.vertex_color))
+        
+        if settings.enable_ambient_occlusion:
+            if not bake_ambient_occlusion(
+                obj,
+                samples=settings.ao_samples,
+                max_distance=settings.ao_distance,
+                strength=settings.ao_strength,
+                channel=settings.ao_channel,
+                workers=settings.ao_workers
+            ):
+                print("[WARNING] Failed to bake ambient occlusion")
@@ -0,0 +1,154 @@
+"""Export service for writing converted props to disk.
+
+This service holds the YTYP/YDR export logic shared by the export operator
+and the headless command-line pipeline, so neither depends on the other's
+UI state.
+"""
+
+from typing import Dict, List, Optional, Set
+import os
+import bpy
+from ..sollumz_integration import SollumzIntegration
+from ..core.conversion.texture_registry import TextureRegistry
+from .. import logger
+
+
+class ExportService:
+    """Exports the selected YTYP and drawables through Sollumz.
+
+    Attributes:
+        sollumz: Sollumz integration service instance
+
+    Example:
+        >>> service = ExportService()
+        >>> service.export(context, "/tmp/out", {'NATIVE'}, {'GEN8'})
+        True
+    """
+
+    def __init__(self):
+        """Initialize the export service with required dependencies."""
+        self.sollumz = SollumzIntegration.get_instance()
+
+    def export(
+        self,
+        context: bpy.types.Context,
+        directory: str,
+        formats: Set[str],
+        versions: Set[str],
+        operator: Optional[bpy.types.Operator] = None
+    ) -> bool:
+        """Export the selected YTYP and the selected drawables.
+
+        The Sollumz export settings are temporarily replaced with the
+        requested formats and versions and restored afterwards. Texture
+        files missing on disk are reported per prop first; they do not stop
+        the export.
+
+        Args:
+            context: Blender context
+            directory: Output directory
+            formats: Sollumz target formats ('NATIVE', 'CWXML')
+            versions: Sollumz target versions ('GEN8', 'GEN9')
+            operator: Optional operator instance for error reporting
+
+        Returns:
+            True if both the YTYP and the drawable exports finished, False otherwise
+        """
+        if not directory:
+            logger.log_error("messages.error.no_directory", operator=operator)
+            return False
+
+        # Check if there's a YTYP to export
+        if len(context.scene.ytyps) == 0:
+            logger.log_error("messages.error.no_ytyp", operator=operator)
+            return False
+
+        # Check if there's a selected YTYP
+        if context.scene.ytyp_index < 0 or context.scene.ytyp_index >= len(context.scene.ytyps):
+            logger.log_error("messages.error.no_ytyp_selected", operator=operator)
+            return False
+
+        if not formats:
+            logger.log_error("messages.error.no_format", operator=operator)
+            return False
+        if not versions:
+            logger.log_error("messages.error.no_version", operator=operator)
+            return False
+
+        self.report_missing_textures(context, directory, operator)
+
+        # Get Sollumz preferences and temporarily set export options
+        try:
+            sollumz_prefs = self.sollumz.get_preferences(context)
+
+            if sollumz_prefs is None:
+                logger.log_error("messages.error.sollumz_addon_not_found", operator=operator)
+                return False
+
+            # Store original settings to restore later
+            export_settings = sollumz_prefs.export_settings
+            original_formats = set(export_settings.target_formats)
+            original_versions = set(export_settings.target_versions)
+
+            # Apply our custom settings temporarily
+            export_settings.target_formats = set(formats)
+            export_settings.target_versions = set(versions)
+
+            finished = True
+            try:
+                # Export YTYP first
+                result = bpy.ops.sollumz.export_ytyp_io(directory=directory)
+                if result != {"FINISHED"}:
+                    logger.log_warning("messages.warning.ytyp_export_warning", operator=operator)
+                    finished = False
+
+                # Export Drawable (YDR)
+                result = bpy.ops.sollumz.export_assets(directory=directory, direct_export=True)
+                if result != {"FINISHED"}:
+                    logger.log_warning("messages.warning.drawable_export_warning", operator=operator)
+                    finished = False
+
+            finally:
+                # Restore original settings
+                export_settings.target_formats = original_formats
+                export_settings.target_versions = original_versions
+
+        except Exception as e:
+            logger.log_error("messages.error.export_failed", operator=operator, error=str(e))
+            return False
+
+        if not finished:
+            return False
+        logger.log_info("messages.info.export_success", operator=operator, directory=directory)
+        return True
+
+    def report_missing_textures(
+        self,
+        context: bpy.types.Context,
+        directory: str = "",
+        operator: Optional[bpy.types.Operator] = None
+    ) -> Dict[str, List[str]]:
+        """Warn about the texture files of the selected props missing on disk.
+
+        In an unsaved .blend, '//' texture paths are checked in the
+        directory of the source model when converting from the command
+        line, and in the export directory otherwise (see TextureRegistry).
+
+        Args:
+            context: Blender context
+            directory: Export directory
+            operator: Optional operator instance for warning reporting
+
+        Returns:
+            Mapping of prop name to its missing texture paths
+        """
+        selected = context.selected_objects
+        selected_set = set(selected)
+        props = [obj for obj in selected if obj.parent not in selected_set]
+        missing = TextureRegistry.get_instance().missing_textures(props, bpy.path.abspath(directory))
+        for name, paths in missing.items():
+            logger.log_warning(
+                "messages.warning.missing_textures", operator=operator,
+                name=name, count=len(paths), files=", ".join(os.path.basename(path) for path in paths)
+            )
+        return missing
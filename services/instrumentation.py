@@ -0,0 +1,124 @@
+"""Per-stage timing and counters for the conversion workflow.
+
+The profiler records the wall time of every conversion stage of every prop,
+together with the vertex/loop/polygon counts of the mesh the stage worked
+on. Records are plain dictionaries, readable from Python and dumpable as
+JSON lines to compare runs between releases.
+"""
+
+import json
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional
+import bpy
+
+
+def mesh_counts(obj: Optional[bpy.types.Object]) -> Dict[str, int]:
+    """Return the vertex, loop and polygon counts of a mesh object.
+
+    Non-mesh or missing objects give zero counts.
+    """
+    if obj is None or obj.type != 'MESH' or obj.data is None:
+        return {"vertices": 0, "loops": 0, "polygons": 0}
+    mesh = obj.data
+    return {
+        "vertices": len(mesh.vertices),
+        "loops": len(mesh.loops),
+        "polygons": len(mesh.polygons),
+    }
+
+
+class ConversionProfiler:
+    """Collects stage timing records.
+
+    Each record has the keys 'prop', 'stage', 'seconds', 'vertices', 'loops',
+    'polygons' and 'error' (True if the stage raised).
+
+    Attributes:
+        records: Recorded stage measurements, in execution order
+        enabled: When False, stages are executed without being recorded
+
+    Example:
+        >>> profiler = ConversionProfiler()
+        >>> with profiler.stage("crate01", "convert_collision", collision_obj):
+        >>>     convert_collision(context, collision_obj, mod_name)
+        >>> profiler.summary()["convert_collision"]["seconds"]
+        0.42
+    """
+
+    def __init__(self, enabled: bool = True):
+        """Initialize an empty profiler."""
+        self.enabled = enabled
+        self.records: List[Dict[str, Any]] = []
+
+    @contextmanager
+    def stage(self, prop: str, stage: str, obj: Optional[bpy.types.Object] = None) -> Iterator[None]:
+        """Time a stage of a prop.
+
+        The mesh counts are taken from obj when the stage starts, i.e. the
+        size of the input the stage works on.
+
+        Args:
+            prop: Name of the prop being converted ("" for batch-level stages)
+            stage: Stage name
+            obj: Mesh object processed by the stage, if any
+        """
+        if not self.enabled:
+            yield
+            return
+
+        record = {"prop": prop, "stage": stage, **mesh_counts(obj), "error": False}
+        start = time.perf_counter()
+        try:
+            yield
+        except Exception:
+            record["error"] = True
+            raise
+        finally:
+            record["seconds"] = time.perf_counter() - start
+            self.records.append(record)
+
+    def for_prop(self, prop: str) -> List[Dict[str, Any]]:
+        """Return the records of a single prop."""
+        return [record for record in self.records if record["prop"] == prop]
+
+    def summary(self) -> Dict[str, Dict[str, float]]:
+        """Aggregate the records per stage.
+
+        Returns:
+            Mapping of stage name to {'count', 'seconds', 'max_seconds'}
+        """
+        summary: Dict[str, Dict[str, float]] = {}
+        for record in self.records:
+            entry = summary.setdefault(record["stage"], {"count": 0, "seconds": 0.0, "max_seconds": 0.0})
+            entry["count"] += 1
+            entry["seconds"] += record["seconds"]
+            entry["max_seconds"] = max(entry["max_seconds"], record["seconds"])
+        return summary
+
+    def to_jsonl(self) -> str:
+        """Return the records as JSON lines."""
+        return "".join(json.dumps(record) + "\n" for record in self.records)
+
+    def dump_jsonl(self, filepath: str, append: bool = True) -> None:
+        """Write the records to a JSON lines file.
+
+        Args:
+            filepath: Destination file
+            append: Append to the file instead of overwriting it
+        """
+        with open(filepath, 'a' if append else 'w', encoding='utf-8') as f:
+            f.write(self.to_jsonl())
+
+    def clear(self) -> None:
+        """Drop all records."""
+        self.records.clear()
+
+    def print_summary(self) -> None:
+        """Print the per-stage summary, slowest stage first."""
+        summary = self.summary()
+        for stage, entry in sorted(summary.items(), key=lambda item: item[1]["seconds"], reverse=True):
+            print(
+                f"[PROFILE] {stage}: {entry['seconds']:.3f}s total, "
+                f"{entry['count']} calls, {entry['max_seconds']:.3f}s max"
+            )
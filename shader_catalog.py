@@ -0,0 +1,132 @@
+"""Indexed catalog of the Sollumz shaders.
+
+The catalog is built once per session from the Sollumz shader list and
+looked up by index, shader name or shader filename, so batch and command
+line conversions can pick a shader by name. The parameter and texture slot
+layout of a shader is read from the Sollumz shader definitions on first
+use. SollumzIntegration owns the catalog and drops it on reset().
+"""
+
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Tuple
+import importlib
+from . import constants
+
+# Sollumz shader parameter type of texture slots
+TEXTURE_PARAMETER_TYPE = "Texture"
+
+
+def _type_name(param_type) -> str:
+    """Name of a shader parameter type, given as a string or an enum member."""
+    return str(getattr(param_type, "value", param_type))
+
+
+@dataclass(frozen=True)
+class ShaderEntry:
+    """A Sollumz shader.
+
+    Attributes:
+        index: Index in the Sollumz shader list (sz_shader_material_index)
+        name: Shader name (e.g. 'default')
+        filename: Shader filename (e.g. 'default.sps')
+        ui_name: Name shown in the Sollumz shader list
+    """
+    index: int
+    name: str
+    filename: str
+    ui_name: str
+
+
+@dataclass(frozen=True)
+class ShaderLayout:
+    """Parameters of a shader, as (name, type) pairs, and its texture slots."""
+    parameters: Tuple[Tuple[str, str], ...]
+    textures: Tuple[str, ...]
+
+
+class ShaderCatalog:
+    """Sollumz shaders indexed by position, name and filename.
+
+    Example:
+        >>> catalog = SollumzIntegration.get_instance().get_shader_catalog()
+        >>> entry = catalog.find("normal_spec")
+        >>> layout = catalog.layout("default.sps")
+        >>> slots = layout.textures if layout else ()
+    """
+
+    def __init__(self, shadermats, mod_name: Optional[str] = None):
+        """Index a Sollumz shader list.
+
+        Args:
+            shadermats: Sollumz shadermats list (items with name, ui_name, value)
+            mod_name: Sollumz module name, used to read the shader layouts
+        """
+        self._mod_name = mod_name
+        self.entries: List[ShaderEntry] = []
+        self._by_key: Dict[str, ShaderEntry] = {}
+        self._layouts: Dict[str, Optional[ShaderLayout]] = {}
+
+        for index, shader in enumerate(shadermats):
+            filename = str(getattr(shader, "value", ""))
+            name = str(getattr(shader, "name", "") or filename.rsplit(".", 1)[0])
+            entry = ShaderEntry(index, name, filename, str(getattr(shader, "ui_name", name)))
+            self.entries.append(entry)
+            for key in (name, filename):
+                if key:
+                    self._by_key.setdefault(key.lower(), entry)
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def get(self, index: int) -> Optional[ShaderEntry]:
+        """Return the shader at an index of the Sollumz shader list, or None."""
+        return self.entries[index] if 0 <= index < len(self.entries) else None
+
+    def find(self, key: str) -> Optional[ShaderEntry]:
+        """Return a shader by name or filename (case-insensitive), or None."""
+        return self._by_key.get((key or "").lower())
+
+    @property
+    def default(self) -> Optional[ShaderEntry]:
+        """The default shader (constants.DEFAULT_SHADER_NAME), or None."""
+        return self.find(constants.DEFAULT_SHADER_NAME)
+
+    def _shader_manager(self) -> Optional[Any]:
+        """Return the Sollumz shader definition manager, or None."""
+        if not self._mod_name:
+            return None
+        try:
+            return importlib.import_module(f"{self._mod_name}.cwxml.shader").ShaderManager
+        except (ImportError, AttributeError) as e:
+            print(f"[ShaderCatalog] Shader definitions not available: {e}")
+            return None
+
+    def layout(self, key: str) -> Optional[ShaderLayout]:
+        """Return the parameter and texture slot layout of a shader, or None.
+
+        Args:
+            key: Shader name or filename
+        """
+        entry = self.find(key)
+        if entry is None:
+            return None
+        if entry.filename in self._layouts:
+            return self._layouts[entry.filename]
+
+        layout = None
+        manager = self._shader_manager()
+        shader_def = None
+        if manager is not None and hasattr(manager, "find_shader"):
+            try:
+                shader_def = manager.find_shader(entry.filename)
+            except Exception as e:
+                print(f"[ShaderCatalog] Failed to read shader {entry.filename}: {e}")
+        if shader_def is not None:
+            parameters = tuple(
+                (str(getattr(param, "name", "")), _type_name(getattr(param, "type", "")))
+                for param in getattr(shader_def, "parameters", [])
+            )
+            textures = tuple(name for name, type_name in parameters if type_name == TEXTURE_PARAMETER_TYPE)
+            layout = ShaderLayout(parameters, textures)
+        self._layouts[entry.filename] = layout
+        return layout
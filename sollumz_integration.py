@@ -5,11 +5,14 @@ following the Dependency Inversion Principle. It isolates all Sollumz-specific
 code and provides a stable API for the rest of the addon.
 """
 
-from typing import Optional, Any
+from typing import Optional, Any, Callable, Dict, List, Tuple
 import bpy
 import importlib
+import inspect
 import sys
 from . import constants
+from .shader_catalog import ShaderCatalog
+from .core.operator_context import run_with_objects
 
 
 class SollumzIntegration:
@@ -20,12 +23,20 @@ class SollumzIntegration:
     - Availability checking
     - Preferences access
     - Material system access
+    - The shader catalog, built once per session
+    - Conversion calls, made directly into Sollumz when its functions are
+      found and through the operators otherwise
     
     The singleton pattern ensures consistent state across the addon.
     """
     
     _instance: Optional['SollumzIntegration'] = None
     _module_name: Optional[str] = None
+    _shader_catalog: Optional[ShaderCatalog] = None
+    
+    def __init__(self):
+        # Probed direct calls by capability (None when only the operator exists)
+        self._direct_calls: Dict[str, Optional[Callable]] = {}
     
     @classmethod
     def get_instance(cls) -> 'SollumzIntegration':
@@ -45,13 +56,14 @@ class SollumzIntegration:
     
     @classmethod
     def reset(cls) -> None:
-        """Reset the singleton instance and cached module name.
+        """Reset the singleton instance, cached module name and shader catalog.
         
         This is primarily useful for testing or when Sollumz is
         enabled/disabled at runtime.
         """
         cls._instance = None
         cls._module_name = None
+        cls._shader_catalog = None
     
     def is_available(self) -> bool:
         """Check if Sollumz is installed and its operators are available.
@@ -174,6 +186,27 @@ class SollumzIntegration:
             print(f"[SollumzIntegration] Failed to load shader materials: {e}")
             return None
     
+    def get_shader_catalog(self) -> Optional[ShaderCatalog]:
+        """Get the catalog of Sollumz shaders, indexed by name and filename.
+        
+        The catalog is built on first use and kept until reset().
+        
+        Returns:
+            The shader catalog, or None if Sollumz is not available
+            
+        Example:
+            >>> sollumz = SollumzIntegration.get_instance()
+            >>> catalog = sollumz.get_shader_catalog()
+            >>> if catalog:
+            >>>     shader = catalog.find("default.sps")
+        """
+        if SollumzIntegration._shader_catalog is None:
+            shadermats = self.get_shader_materials()
+            if not shadermats:
+                return None
+            SollumzIntegration._shader_catalog = ShaderCatalog(shadermats, self.get_module_name())
+        return SollumzIntegration._shader_catalog
+    
     def get_collision_materials(self) -> Optional[Any]:
         """Get Sollumz collision materials module.
         
@@ -219,6 +252,111 @@ class SollumzIntegration:
             print(f"[SollumzIntegration] Failed to load sollumz properties: {e}")
             return None
 
+    
+    def get_direct_call(self, capability: str) -> Optional[Callable]:
+        """Get the Sollumz function behind a conversion operator, if it exists.
+        
+        The candidates of constants.SOLLUMZ_DIRECT_CALLS are probed once: the
+        first function that can be called with just the expected arguments
+        (no other required parameter) is used. Sollumz versions without it
+        fall back to the operator.
+        
+        Args:
+            capability: Key of constants.SOLLUMZ_DIRECT_CALLS
+            
+        Returns:
+            The Sollumz function, or None if only the operator is available
+            
+        Example:
+            >>> sollumz = SollumzIntegration.get_instance()
+            >>> convert = sollumz.get_direct_call("convert_to_drawable")
+            >>> if convert:
+            >>>     convert(obj)
+        """
+        if capability in self._direct_calls:
+            return self._direct_calls[capability]
+        
+        function = None
+        mod_name = self.get_module_name()
+        for submodule, name, parameters in constants.SOLLUMZ_DIRECT_CALLS.get(capability, ()):
+            if not mod_name:
+                break
+            try:
+                candidate = getattr(importlib.import_module(f"{mod_name}.{submodule}"), name, None)
+                if candidate is None:
+                    continue
+                # Placeholder arguments, only checked against the signature
+                inspect.signature(candidate).bind(*parameters)
+                function = candidate
+                break
+            except (ImportError, TypeError, ValueError):
+                continue
+        
+        print(f"[SollumzIntegration] {capability}: {'direct call' if function else 'operator'}")
+        self._direct_calls[capability] = function
+        return function
+    
+    def call_direct(self, capability: str, *args) -> Tuple[bool, Any]:
+        """Call the Sollumz function of a capability, if there is one.
+        
+        Only a missing function makes the caller fall back to the operator.
+        An exception of the function is raised as a conversion failure: the
+        function may have changed the objects already, and running the
+        operator on top of it could convert them twice.
+        
+        Args:
+            capability: Key of constants.SOLLUMZ_DIRECT_CALLS
+            *args: Arguments of the function
+            
+        Returns:
+            Tuple of (called, result) where called is False if there is no
+            function
+        """
+        function = self.get_direct_call(capability)
+        if function is None:
+            return False, None
+        try:
+            return True, function(*args)
+        except Exception as e:
+            print(f"[SollumzIntegration] {capability} direct call failed: {e}")
+            raise
+    
+    def run_operator(
+        self,
+        context: bpy.types.Context,
+        operator: str,
+        objects: List[bpy.types.Object],
+        active: Optional[bpy.types.Object] = None
+    ) -> set:
+        """Run a Sollumz operator on a set of objects, leaving the selection untouched.
+        
+        Args:
+            context: Blender context
+            operator: Operator name in the Sollumz namespace (e.g. 'converttodrawable')
+            objects: Objects the operator works on (the selection)
+            active: Active object (the first object if None)
+            
+        Returns:
+            The operator result
+        """
+        namespace = getattr(bpy.ops, constants.SOLLUMZ_OPERATOR_NAMESPACE)
+        return run_with_objects(context, getattr(namespace, operator), objects, active)
+    
+    def convert_to_composite(self, context: bpy.types.Context, obj: bpy.types.Object) -> None:
+        """Convert a mesh into a Bound Composite holding a BVH with the mesh as poly mesh."""
+        props = self.get_sollumz_properties()
+        called = False
+        if props is not None:
+            called, _ = self.call_direct("convert_to_composite", obj, props.SollumType.BOUND_GEOMETRYBVH)
+        if not called:
+            self.run_operator(context, "converttocomposite", [obj])
+    
+    def convert_to_drawable(self, context: bpy.types.Context, obj: bpy.types.Object) -> None:
+        """Convert a mesh into a Drawable holding the mesh as drawable model."""
+        called, _ = self.call_direct("convert_to_drawable", obj)
+        if not called:
+            self.run_operator(context, "converttodrawable", [obj])
+
 
 # Legacy function for backward compatibility
 # TODO: Remove this after all code is migrated to use SollumzIntegration class
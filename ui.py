@@ -24,12 +24,44 @@ class PROPCONVERTER_PT_main_panel(bpy.types.Panel):
             layout.separator()
         
         layout.operator("propconverter.convert_to_gtav", text=i18n.t("ui.convert_button"))
+        layout.operator("propconverter.convert_batch", text=i18n.t("ui.convert_batch_button"))
 
         # Vertex color selector (runs automatically during convert)
         if props:
             layout.prop(props, "vertex_color", text=i18n.t("ui.vertex_color"))
             # Optional auto texture naming from mesh name
             layout.prop(props, "auto_texture_from_mesh_name", text=i18n.t("ui.auto_texture_from_mesh_name"))
+            
+            # Coincident vertices welded before converting
+            box = layout.box()
+            box.prop(props, "enable_weld", text=i18n.t("ui.enable_weld"))
+            if props.enable_weld:
+                box.prop(props, "weld_distance", text=i18n.t("ui.weld_distance"))
+            
+            # Ambient occlusion baked into the vertex colors
+            box = layout.box()
+            box.prop(props, "enable_ambient_occlusion", text=i18n.t("ui.enable_ambient_occlusion"))
+            if props.enable_ambient_occlusion:
+                box.prop(props, "ao_samples", text=i18n.t("ui.ao_samples"))
+                box.prop(props, "ao_distance", text=i18n.t("ui.ao_distance"))
+                box.prop(props, "ao_strength", text=i18n.t("ui.ao_strength"))
+                box.prop(props, "ao_channel", text=i18n.t("ui.ao_channel"))
+            
+            # Lower LODs generated from the drawable
+            box = layout.box()
+            box.prop(props, "enable_lods", text=i18n.t("ui.enable_lods"))
+            if props.enable_lods:
+                box.prop(props, "lod_ratio_medium", text=i18n.t("ui.lod_ratio_medium"))
+                box.prop(props, "lod_ratio_low", text=i18n.t("ui.lod_ratio_low"))
+                box.prop(props, "lod_ratio_very_low", text=i18n.t("ui.lod_ratio_very_low"))
+            
+            layout.prop(props, "enable_model_split", text=i18n.t("ui.enable_model_split"))
+            
+            # Big objects are split into chunks with standalone collisions
+            box = layout.box()
+            box.prop(props, "enable_auto_divide", text=i18n.t("ui.enable_auto_divide"))
+            if props.enable_auto_divide:
+                box.prop(props, "divide_chunk_size", text=i18n.t("ui.divide_chunk_size"))
         
         # Mirror Sollumz shader picker using its collection/list so users see the full shader list
         if hasattr(wm, "sz_shader_materials") and hasattr(wm, "sz_shader_material_index"):
@@ -65,6 +97,18 @@ class PROPCONVERTER_PT_main_panel(bpy.types.Panel):
                 elif props.decimate_type == 'PLANAR':
                     box.prop(props, "decimate_planar_angle", text=i18n.t("ui.decimate_angle"))
             
+            # Collision budget settings (replace decimate and remesh)
+            layout.separator()
+            box = layout.box()
+            box.prop(props, "enable_collision_budget", text=i18n.t("ui.enable_collision_budget"))
+            if props.enable_collision_budget:
+                box.prop(props, "budget_method", text=i18n.t("ui.budget_method"))
+                box.prop(props, "budget_target", text=i18n.t("ui.budget_target"))
+                if props.budget_target == 'TRIANGLES':
+                    box.prop(props, "budget_triangles", text=i18n.t("ui.budget_triangles"))
+                else:
+                    box.prop(props, "budget_max_deviation", text=i18n.t("ui.budget_max_deviation"))
+            
             # Remesh settings
             layout.separator()
             box = layout.box()
@@ -79,6 +123,22 @@ class PROPCONVERTER_PT_main_panel(bpy.types.Panel):
                 if props.remesh_mode == 'voxels':
                     box.prop(props, "remesh_voxel_size", text=i18n.t("ui.remesh_voxel_size"))
                     box.prop(props, "remesh_adaptivity", text=i18n.t("ui.remesh_adaptivity"))
+            
+            # Primitive bounds settings
+            layout.separator()
+            box = layout.box()
+            box.prop(props, "enable_primitive_fitting", text=i18n.t("ui.enable_primitive_fitting"))
+            if props.enable_primitive_fitting:
+                box.prop(props, "primitive_tolerance", text=i18n.t("ui.primitive_tolerance"))
+                box.prop(props, "primitive_max_count", text=i18n.t("ui.primitive_max_count"))
+            
+            # Convex decomposition settings
+            layout.separator()
+            box = layout.box()
+            box.prop(props, "enable_convex_decomposition", text=i18n.t("ui.enable_convex_decomposition"))
+            if props.enable_convex_decomposition:
+                box.prop(props, "convex_max_hulls", text=i18n.t("ui.convex_max_hulls"))
+                box.prop(props, "convex_volume_error", text=i18n.t("ui.convex_volume_error"))
 
         # Collision material selector for the collision mesh
         if hasattr(wm, "sz_collision_materials") and hasattr(wm, "sz_collision_material_index"):
@@ -5,5 +5,6 @@ objects before conversion operations.
 """
 
 from .mesh_validator import MeshValidator
+from .mesh_statistics import MeshStatistics, compute_mesh_statistics
 
-__all__ = ['MeshValidator']
+__all__ = ['MeshValidator', 'MeshStatistics', 'compute_mesh_statistics']
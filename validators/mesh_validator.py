@@ -6,6 +6,8 @@ following the Single Responsibility Principle.
 
 from typing import Tuple, Optional
 import bpy
+from .mesh_statistics import MeshStatistics, compute_mesh_statistics
+from .. import constants
 from .. import logger
 
 
@@ -67,6 +69,86 @@ class MeshValidator:
         
         return True, obj
     
+    @staticmethod
+    def validate_batch_object(
+        obj: Optional[bpy.types.Object]
+    ) -> Optional[str]:
+        """Validate a single object of a batch conversion.
+        
+        Unlike validate_for_conversion, this does not depend on the active
+        object or the selection state, so it can be used for any object.
+        
+        Args:
+            obj: The object to validate
+            
+        Returns:
+            None if the object can be converted, otherwise the translation
+            key describing why it cannot
+        """
+        if obj is None:
+            return 'messages.error.no_object_selected'
+        
+        if obj.type != "MESH":
+            return 'messages.error.not_a_mesh'
+        
+        if len(obj.data.vertices) == 0:
+            return 'messages.error.empty_mesh'
+        
+        return None
+    
+    @staticmethod
+    def validate_mesh_deep(
+        obj: bpy.types.Object,
+        strict: bool = False,
+        check_vertex_limit: bool = True
+    ) -> Tuple[Optional[str], MeshStatistics]:
+        """Inspect the geometry of a mesh with bulk array statistics.
+        
+        NaN/infinite coordinates and geometries over the 16-bit vertex limit
+        always fail. Degenerate faces, non-manifold edges, loose vertices and
+        missing UV maps are reported as a warning, or fail in strict mode.
+        
+        Args:
+            obj: The mesh object to inspect
+            strict: Fail on every detected issue instead of warning
+            check_vertex_limit: Fail on geometries over MAX_GEOMETRY_VERTICES
+            
+        Returns:
+            Tuple of (error_key, statistics) where error_key is None if the
+            mesh can be converted
+        """
+        stats = compute_mesh_statistics(obj.data)
+        
+        if stats.invalid_vertices:
+            return 'messages.error.invalid_coordinates', stats
+        
+        if check_vertex_limit and stats.max_geometry_vertices > constants.MAX_GEOMETRY_VERTICES:
+            print(f"[VALIDATE] {obj.name}: {stats.max_geometry_vertices} vertices in one geometry "
+                  f"(limit {constants.MAX_GEOMETRY_VERTICES})")
+            return 'messages.error.too_many_vertices', stats
+        
+        issues = (
+            (stats.degenerate_faces, 'messages.error.degenerate_faces'),
+            (stats.non_manifold_edges, 'messages.error.non_manifold_edges'),
+            (stats.loose_vertices, 'messages.error.loose_vertices'),
+            (stats.uv_layers == 0, 'messages.error.missing_uvs'),
+        )
+        if strict:
+            for count, error_key in issues:
+                if count:
+                    return error_key, stats
+        elif any(count for count, _ in issues):
+            logger.log_warning(
+                'messages.warning.mesh_issues',
+                name=obj.name,
+                degenerate=stats.degenerate_faces,
+                non_manifold=stats.non_manifold_edges,
+                loose=stats.loose_vertices,
+                uv_layers=stats.uv_layers
+            )
+        
+        return None, stats
+    
     @staticmethod
     def validate_mesh_has_geometry(
         obj: bpy.types.Object,